@@ -2,19 +2,43 @@
 # -*- coding: utf-8 -*-
 """Central configuration for Universal File Processor"""
 
+import os
 from pathlib import Path
+from utils.cpu import effective_cpu_count
 
 # Directories
 BASE_DIR = Path(__file__).parent.parent
 LOG_DIR = BASE_DIR / "logs"
 OUTPUT_DIR = BASE_DIR / "output"
+CONFIG_DIR = Path(os.environ.get('XDG_CONFIG_HOME') or Path.home() / ".config") / "ufp"
 
-# Quality settings
+# Batch format choices remembered between runs; with UFP_ASSUME_DEFAULT=1
+# (or --assume-default) a single-type batch reuses them without prompting
+LAST_CHOICES_FILE = CONFIG_DIR / "last_choices.json"
+ASSUME_DEFAULT = os.environ.get('UFP_ASSUME_DEFAULT') == '1'
+
+# Quality settings; 'Original' keeps same-format files untouched
+# (linked or copied) and otherwise encodes like 'High'
 QUALITY_PRESETS = {
     'Low': {'crf': '28', 'audio_bitrate': '128k', 'image_quality': 60},
     'Medium': {'crf': '23', 'audio_bitrate': '192k', 'image_quality': 80},
     'High': {'crf': '18', 'audio_bitrate': '256k', 'image_quality': 95},
-    'Ultra': {'crf': '15', 'audio_bitrate': '320k', 'image_quality': 100}
+    'Ultra': {'crf': '15', 'audio_bitrate': '320k', 'image_quality': 100},
+    'Original': {'crf': '18', 'audio_bitrate': '256k', 'image_quality': 95}
+}
+
+# Per-preset converter arguments, precomputed from QUALITY_PRESETS
+AUDIO_ARGS = {
+    name: ('-b:a', preset['audio_bitrate'])
+    for name, preset in QUALITY_PRESETS.items()
+}
+VIDEO_ARGS = {
+    name: ('-crf', preset['crf'], '-b:a', preset['audio_bitrate'])
+    for name, preset in QUALITY_PRESETS.items()
+}
+IMAGE_QUALITY = {
+    name: preset['image_quality']
+    for name, preset in QUALITY_PRESETS.items()
 }
 
 # File type mappings
@@ -57,6 +81,13 @@ FILE_TYPE_MAP = {
     }
 }
 
+# Reverse index: file extension -> file type
+EXT_TO_TYPE = {
+    ext: file_type
+    for file_type, config in FILE_TYPE_MAP.items()
+    for ext in config['extensions']
+}
+
 # Tool commands
 TOOL_COMMANDS = {
     'FFmpeg': 'ffmpeg',
@@ -74,3 +105,39 @@ IMAGE_RESIZE_OPTIONS = ['Original', '50%', '75%', '100%', '1920x1080', '1280x720
 
 # Timeouts (seconds)
 CONVERSION_TIMEOUT = 600
+
+# Batch file list: rows shown, and the file count above which the total
+# size is computed in a streamed pass with a live running total
+FILE_LIST_DISPLAY_LIMIT = 15
+FILE_LIST_STREAM_THRESHOLD = 10_000
+
+
+def _env_int(name: str, default: int, low: int = 1, high: int = 64) -> int:
+    """Read an integer in [low, high] from the environment, else return default"""
+    try:
+        value = int(os.environ[name])
+    except (KeyError, ValueError):
+        return default
+    return value if low <= value <= high else default
+
+
+# Parallel batch conversion: number of files converted at once
+# (override with the UFP_WORKERS environment variable or --workers)
+BATCH_WORKERS = _env_int('UFP_WORKERS', max(1, effective_cpu_count() // 2))
+
+# Order batch files are handed to the workers: 'smallest' first (default),
+# 'largest' first or as 'picked' (override with UFP_ORDER or --order)
+BATCH_ORDERS = ('smallest', 'largest', 'picked')
+BATCH_ORDER = os.environ.get('UFP_ORDER', 'smallest')
+if BATCH_ORDER not in BATCH_ORDERS:
+    BATCH_ORDER = 'smallest'
+
+# On NVENC hosts, convert numbered clips of one source ("talk_001.mp4",
+# "talk_002.mp4", ...) in a shared FFmpeg process (opt in with
+# UFP_GROUP_CLIPS=1 or --group-clips)
+GROUP_CLIPS = os.environ.get('UFP_GROUP_CLIPS') == '1'
+
+# FFmpeg threads per conversion in a batch (override with
+# UFP_FFMPEG_THREADS_PER_INVOCATION or --ffmpeg-threads-per-invocation).
+# 0 derives it from the pool size so that workers * threads ~= CPU cores.
+FFMPEG_THREADS_PER_INVOCATION = _env_int('UFP_FFMPEG_THREADS_PER_INVOCATION', 0)
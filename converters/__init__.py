@@ -7,16 +7,75 @@ This module provides a factory pattern for creating file converters.
 New converters can be easily registered and managed.
 """
 
-from typing import Optional, Dict, List, Type
+import importlib
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from typing import Optional, Dict, List, Set, Type, Union, Tuple, Any
 from converters.base_converter import BaseConverter
-from converters.video_converter import VideoConverter
-from converters.audio_converter import AudioConverter
-from converters.image_converter import ImageConverter
-from converters.document_converter import DocumentConverter
+from utils.cpu import effective_cpu_count
 from utils.logger import get_logger
 
 logger = get_logger()
 
+# Built-in converter classes are imported on first use (see __getattr__ below)
+_LAZY_EXPORTS = {
+    'VideoConverter': 'converters.video_converter',
+    'AudioConverter': 'converters.audio_converter',
+    'ImageConverter': 'converters.image_converter',
+    'DocumentConverter': 'converters.document_converter',
+}
+
+# Built-in types whose conversion runs in Python (PIL) and needs processes
+# to scale; the others spawn external tools and only need threads
+_PROCESS_POOL_TYPES = {'image'}
+
+
+# Built-in converter registry ("module:Class" paths are resolved on first use)
+_converters: Dict[str, Union[str, Type[BaseConverter]]] = {
+    'video': 'converters.video_converter:VideoConverter',
+    'audio': 'converters.audio_converter:AudioConverter',
+    'image': 'converters.image_converter:ImageConverter',
+    'document': 'converters.document_converter:DocumentConverter',
+}
+
+# Custom converter registry (for plugins/extensions)
+_custom_converters: Dict[str, Type[BaseConverter]] = {}
+
+# Shared converter instances, one per file type. Converters are
+# stateless, and plain dict get/set is atomic under the GIL, so the
+# cache is safe to read from worker threads.
+_instances: Dict[str, BaseConverter] = {}
+
+
+def _get_converter_class(file_type: str) -> Optional[Type[BaseConverter]]:
+    """
+    Look up the converter class for a file type, importing it if needed
+    
+    Custom converters take precedence over built-in ones. Built-in
+    entries are stored as "module:Class" strings and replaced with
+    the imported class the first time they are requested.
+    
+    Args:
+        file_type: Type of file
+    
+    Returns:
+        Converter class or None if no converter is registered
+    """
+    converter_class = _custom_converters.get(file_type)
+    if converter_class:
+        return converter_class
+    
+    converter_class = _converters.get(file_type)
+    if isinstance(converter_class, str):
+        module_name, class_name = converter_class.split(':')
+        converter_class = getattr(importlib.import_module(module_name), class_name)
+        _converters[file_type] = converter_class
+    return converter_class
+
+
+def _supported_types_set() -> Set[str]:
+    """Get the set of file types with a built-in or custom converter"""
+    return _converters.keys() | _custom_converters.keys()
+
 
 class ConverterFactory:
     """
@@ -24,20 +83,9 @@ class ConverterFactory:
     
     This factory uses the factory pattern to instantiate the correct
     converter based on file type. New converters can be registered
-    dynamically.
+    dynamically. The registries themselves live at module level.
     """
     
-    # Built-in converter registry
-    _converters: Dict[str, Type[BaseConverter]] = {
-        'video': VideoConverter,
-        'audio': AudioConverter,
-        'image': ImageConverter,
-        'document': DocumentConverter,
-    }
-    
-    # Custom converter registry (for plugins/extensions)
-    _custom_converters: Dict[str, Type[BaseConverter]] = {}
-    
     @classmethod
     def get_converter(cls, file_type: str) -> Optional[BaseConverter]:
         """
@@ -54,16 +102,21 @@ class ConverterFactory:
             >>> if converter:
             ...     success, error = converter.convert(input_file, output_file, settings)
         """
-        # Check custom converters first (allows overriding built-in ones)
-        converter_class = cls._custom_converters.get(file_type)
+        instance = _instances.get(file_type)
+        if instance is not None:
+            return instance
         
-        # Fall back to built-in converters
-        if not converter_class:
-            converter_class = cls._converters.get(file_type)
+        # Custom converters override built-in ones
+        try:
+            converter_class = _get_converter_class(file_type)
+        except ImportError as e:
+            logger.error(f"Failed to load converter for {file_type}: {e}")
+            return None
         
         if converter_class:
             try:
                 instance = converter_class()
+                _instances[file_type] = instance
                 logger.debug(f"Created converter instance for type: {file_type}")
                 return instance
             except Exception as e:
@@ -103,7 +156,8 @@ class ConverterFactory:
             )
             return False
         
-        cls._custom_converters[file_type] = converter_class
+        _custom_converters[file_type] = converter_class
+        _instances.pop(file_type, None)
         logger.info(f"Registered custom converter for type: {file_type}")
         return True
     
@@ -118,8 +172,9 @@ class ConverterFactory:
         Returns:
             True if unregistration successful, False otherwise
         """
-        if file_type in cls._custom_converters:
-            del cls._custom_converters[file_type]
+        if file_type in _custom_converters:
+            del _custom_converters[file_type]
+            _instances.pop(file_type, None)
             logger.info(f"Unregistered custom converter for type: {file_type}")
             return True
         else:
@@ -140,8 +195,7 @@ class ConverterFactory:
             ['video', 'audio', 'image', 'document']
         """
         # Combine built-in and custom converters
-        all_types = set(cls._converters.keys()) | set(cls._custom_converters.keys())
-        return sorted(list(all_types))
+        return sorted(_supported_types_set())
     
     @classmethod
     def is_supported(cls, file_type: str) -> bool:
@@ -158,8 +212,7 @@ class ConverterFactory:
             >>> if ConverterFactory.is_supported('video'):
             ...     print("Video conversion is supported!")
         """
-        return (file_type in cls._converters or 
-                file_type in cls._custom_converters)
+        return file_type in _supported_types_set()
     
     @classmethod
     def get_converter_info(cls, file_type: str) -> Optional[Dict[str, str]]:
@@ -177,8 +230,7 @@ class ConverterFactory:
             >>> print(info['name'])
             'VideoConverter'
         """
-        converter_class = (cls._custom_converters.get(file_type) or 
-                          cls._converters.get(file_type))
+        converter_class = _get_converter_class(file_type)
         
         if converter_class:
             return {
@@ -186,7 +238,7 @@ class ConverterFactory:
                 'module': converter_class.__module__,
                 'docstring': converter_class.__doc__ or 'No description available',
                 'type': file_type,
-                'is_custom': file_type in cls._custom_converters
+                'is_custom': file_type in _custom_converters
             }
         return None
     
@@ -218,8 +270,92 @@ class ConverterFactory:
         This resets the factory to only use built-in converters.
         Useful for testing or resetting configuration.
         """
-        cls._custom_converters.clear()
+        for file_type in _custom_converters:
+            _instances.pop(file_type, None)
+        _custom_converters.clear()
         logger.info("All custom converters have been reset")
+    
+    @classmethod
+    def convert_many(
+        cls,
+        jobs: List[Tuple[str, str, Dict[str, Any]]],
+        file_type: str,
+        max_workers: Optional[int] = None
+    ) -> List[Tuple[bool, Optional[str]]]:
+        """
+        Convert several files of one type in parallel
+        
+        Converters that shell out to external tools run in a thread pool;
+        built-in image conversion is CPU-bound in PIL and runs in a
+        process pool instead.
+        
+        Args:
+            jobs: List of (input_file, output_file, settings) tuples
+            file_type: Type of all files in the batch
+            max_workers: Pool size (default: effective_cpu_count())
+        
+        Returns:
+            List of (success, error_message) tuples in the same order as jobs
+        
+        Example:
+            >>> jobs = [('a.png', 'out/a.jpg', {'quality': 'High'}),
+            ...         ('b.png', 'out/b.jpg', {'quality': 'High'})]
+            >>> results = ConverterFactory.convert_many(jobs, 'image')
+        """
+        if not jobs:
+            return []
+        
+        max_workers = max_workers or effective_cpu_count()
+        use_processes = (file_type in _PROCESS_POOL_TYPES and
+                         file_type not in _custom_converters)
+        
+        if use_processes:
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+            worker, worker_args = _convert_job, (file_type,)
+        else:
+            converter = cls.get_converter(file_type)
+            if not converter:
+                error = f"No converter available for {file_type} files"
+                return [(False, error)] * len(jobs)
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            worker, worker_args = converter.convert, ()
+        
+        logger.info(
+            f"Converting {len(jobs)} {file_type} file(s) with "
+            f"{max_workers} {'process' if use_processes else 'thread'} worker(s)"
+        )
+        
+        results: List[Tuple[bool, Optional[str]]] = [(False, None)] * len(jobs)
+        with executor:
+            futures = {
+                executor.submit(worker, *worker_args, *job): idx
+                for idx, job in enumerate(jobs)
+            }
+            for future in as_completed(futures):
+                idx = futures[future]
+                try:
+                    results[idx] = future.result()
+                except Exception as e:
+                    logger.error(f"Conversion worker failed for {jobs[idx][0]}: {e}")
+                    results[idx] = (False, str(e)[:300])
+        
+        from ui.notifications import AsyncNotifications
+        AsyncNotifications.flush()
+        return results
+
+
+def _convert_job(file_type: str, input_file: str, output_file: str,
+                 settings: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    """Run a single conversion inside a worker process"""
+    converter = ConverterFactory.get_converter(file_type)
+    if not converter:
+        return False, f"No converter available for {file_type} files"
+    try:
+        return converter.convert(input_file, output_file, settings)
+    finally:
+        # Worker processes exit without running atexit handlers
+        from ui.notifications import AsyncNotifications
+        AsyncNotifications.flush()
 
 
 # Convenience functions for backward compatibility
@@ -249,6 +385,22 @@ def is_supported(file_type: str) -> bool:
     return ConverterFactory.is_supported(file_type)
 
 
+def __getattr__(name: str):
+    """Import built-in converter classes on first access (PEP 562)"""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Include lazily imported converter classes in dir() (PEP 562)"""
+    return sorted(set(globals()) | _LAZY_EXPORTS.keys())
+
+
 # Export main classes and functions
 __all__ = [
     'ConverterFactory',
@@ -2,18 +2,28 @@
 # -*- coding: utf-8 -*-
 """Audio converter using FFmpeg with beautiful notifications"""
 
+import os
 import subprocess
-import time
 from typing import Tuple, Dict, Any, Optional
-from pathlib import Path
-from converters.base_converter import BaseConverter
-from config.settings import QUALITY_PRESETS, CONVERSION_TIMEOUT
-from ui.notifications import Notifications
+from converters.base_converter import BaseConverter, find_tool, run_tool
+from config.settings import AUDIO_ARGS, CONVERSION_TIMEOUT
+from ui.notifications import AsyncNotifications
+
+# Source codecs each output container can hold as-is (stream copy, no re-encode)
+_COPY_CODECS = {
+    '.mp3': ('mp3',),
+    '.aac': ('aac',),
+    '.flac': ('flac',),
+    '.ogg': ('vorbis', 'opus', 'flac'),
+    '.wav': ('pcm_s16le', 'pcm_s24le', 'pcm_f32le'),
+}
 
 
 class AudioConverter(BaseConverter):
     """Convert audio files using FFmpeg with enhanced UI feedback"""
     
+    __slots__ = ()
+    
     def convert(self, input_file: str, output_file: str, settings: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         """
         Convert audio file with progress notifications
@@ -28,51 +38,75 @@ class AudioConverter(BaseConverter):
         """
         if not self.validate_input(input_file):
             error_msg = "Input file not found"
-            Notifications.show_conversion_failed(input_file, error_msg)
+            AsyncNotifications.show_conversion_failed(input_file, error_msg)
+            return False, error_msg
+        
+        # Same format with nothing to change: link/copy instead of converting
+        if self.try_passthrough(input_file, output_file, settings):
+            AsyncNotifications.show_conversion_complete(input_file, output_file)
+            return True, None
+        
+        ffmpeg = find_tool('ffmpeg')
+        if ffmpeg is None:
+            error_msg = "FFmpeg not found. Please install FFmpeg first."
+            self.logger.error(error_msg)
+            AsyncNotifications.show_conversion_failed(input_file, error_msg)
             return False, error_msg
         
         self.ensure_output_dir(output_file)
         
         # Start timing
-        start_time = time.time()
+        start_time = self.start_timer()
         
         try:
             # Get quality settings
             quality_name = settings.get('quality', 'Medium')
-            preset = QUALITY_PRESETS.get(quality_name, QUALITY_PRESETS['Medium'])
+            audio_args = AUDIO_ARGS.get(quality_name, AUDIO_ARGS['Medium'])
             
             cmd = [
-                'ffmpeg',
+                ffmpeg,
+                '-hide_banner',
+                '-nostdin',
+                '-loglevel', 'error',
                 '-i', input_file,
-                '-b:a', preset['audio_bitrate'],
-                '-y', output_file
             ]
             
-            self.logger.info(f"Converting audio: {Path(input_file).name} -> {Path(output_file).name}")
-            self.logger.debug(f"Quality: {quality_name}, Bitrate: {preset['audio_bitrate']}")
+            # 'Original' quality with a codec the output container can hold
+            # (e.g. .m4a AAC -> .aac, .opus -> .ogg): remux without re-encoding
+            out_ext = os.path.splitext(output_file)[1].lower()
+            if quality_name == 'Original' and self.get_audio_codec(input_file) in _COPY_CODECS.get(out_ext, ()):
+                cmd.extend(['-vn', '-c:a', 'copy'])
+            else:
+                cmd.extend(audio_args)
+            
+            # Capped by the batch pool so parallel encodes do not oversubscribe the CPU
+            if settings.get('ffmpeg_threads'):
+                cmd.extend(['-threads', str(settings['ffmpeg_threads'])])
+            
+            cmd.extend(['-y', output_file])
+            
+            in_name = os.path.basename(input_file)
+            out_name = os.path.basename(output_file)
+            self.logger.info(f"Converting audio: {in_name} -> {out_name}")
+            self.logger.debug(f"Quality: {quality_name}, Bitrate: {audio_args[1]}")
             
             # Show progress notification
-            Notifications.show_progress_notification(
-                f"Converting audio: {Path(input_file).name}",
+            AsyncNotifications.show_progress_notification(
+                f"Converting audio: {in_name}",
                 icon="🎵"
             )
             
             # Execute
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=CONVERSION_TIMEOUT
-            )
+            return_code, stderr_tail = run_tool(cmd, CONVERSION_TIMEOUT)
             
             # Calculate duration
-            duration = time.time() - start_time
+            duration = self.elapsed(start_time)
             
-            if result.returncode == 0:
+            if return_code == 0:
                 self.logger.info(f"Audio conversion successful in {duration:.2f}s")
                 
                 # Show success notification
-                Notifications.show_conversion_complete(
+                AsyncNotifications.show_conversion_complete(
                     input_file,
                     output_file,
                     duration
@@ -80,25 +114,56 @@ class AudioConverter(BaseConverter):
                 
                 return True, None
             else:
-                error = result.stderr[:300] if result.stderr else result.stdout[:300]
+                error = stderr_tail[-300:].decode('utf-8', errors='replace')
                 self.logger.error(f"FFmpeg failed: {error}")
-                Notifications.show_conversion_failed(input_file, error)
+                AsyncNotifications.show_conversion_failed(input_file, error)
                 return False, error
                 
         except subprocess.TimeoutExpired:
             error_msg = f"Conversion timeout (>{CONVERSION_TIMEOUT}s)"
             self.logger.error(error_msg)
-            Notifications.show_conversion_failed(input_file, "⏱️ Timeout: Conversion took too long")
-            return False, error_msg
-            
-        except FileNotFoundError:
-            error_msg = "FFmpeg not found. Please install FFmpeg first."
-            self.logger.error(error_msg)
-            Notifications.show_conversion_failed(input_file, error_msg)
+            AsyncNotifications.show_conversion_failed(input_file, "⏱️ Timeout: Conversion took too long")
             return False, error_msg
             
         except Exception as e:
             error_msg = str(e)[:300]
             self.logger.error(f"Audio conversion exception: {error_msg}")
-            Notifications.show_conversion_failed(input_file, error_msg)
+            AsyncNotifications.show_conversion_failed(input_file, error_msg)
             return False, error_msg
+    
+    def get_audio_codec(self, audio_file: str) -> Optional[str]:
+        """
+        Get the codec of the first audio stream using FFprobe
+        
+        Args:
+            audio_file: Path to audio file
+        
+        Returns:
+            Codec name (e.g. 'aac') or None
+        """
+        ffprobe = find_tool('ffprobe')
+        if ffprobe is None:
+            self.logger.debug("Could not get audio codec: FFprobe not found")
+            return None
+        
+        try:
+            result = subprocess.run(
+                [
+                    ffprobe,
+                    '-v', 'quiet',
+                    '-select_streams', 'a:0',
+                    '-show_entries', 'stream=codec_name',
+                    '-of', 'csv=p=0',
+                    audio_file
+                ],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                timeout=30
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            self.logger.debug(f"Could not get audio codec: {e}")
+            return None
+        
+        codec = result.stdout.decode('ascii', errors='replace').strip()
+        return codec if result.returncode == 0 and codec else None
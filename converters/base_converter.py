@@ -2,18 +2,194 @@
 # -*- coding: utf-8 -*-
 """Base converter class"""
 
+import logging
+import os
+import shutil
+import subprocess
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Tuple, Dict, Any, Optional
-from pathlib import Path
+from functools import lru_cache
+from typing import Tuple, Dict, Any, Optional, List, Callable, BinaryIO
 from utils.logger import get_logger
+from utils import tool_cache
+from ui.notifications import Notifications
 
 logger = get_logger()
 
+# Settings that change the content and rule out a plain file copy
+_TRANSFORM_SETTINGS = ('resize', 'resolution', 'fps', 'codec')
+
+
+@lru_cache(maxsize=None)
+def find_tool(command: str) -> Optional[str]:
+    """
+    Resolve an external tool's absolute path (cached per process)
+    
+    Availability is answered from the persistent tool cache first, so a
+    missing tool is reported without spawning anything.
+    
+    Args:
+        command: Executable name (e.g., 'ffmpeg', 'pandoc')
+    
+    Returns:
+        Absolute path to the executable or None if it is not available
+    """
+    if not tool_cache.available(command):
+        return None
+    return shutil.which(command)
+
+
+def _start_tail_reader(stream, tail: bytearray, tail_size: int,
+                       on_output: Optional[Callable[[bytes], None]] = None) -> threading.Thread:
+    """
+    Drain a pipe in a background thread, keeping only its last bytes
+    
+    Args:
+        stream: Unbuffered binary pipe to read
+        tail: Buffer that receives the trailing tail_size bytes
+        tail_size: Number of trailing bytes to keep
+        on_output: Called from the reader thread with each chunk
+    
+    Returns:
+        The started reader thread
+    """
+    def _drain():
+        for chunk in iter(lambda: stream.read(tail_size), b''):
+            tail.extend(chunk)
+            del tail[:-tail_size]
+            if on_output:
+                on_output(chunk)
+    
+    reader = threading.Thread(target=_drain, daemon=True)
+    reader.start()
+    return reader
+
+
+def run_tool(cmd: List[str], timeout: float, tail_size: int = 4096,
+             on_output: Optional[Callable[[bytes], None]] = None) -> Tuple[int, bytes]:
+    """
+    Run an external tool, keeping only the tail of its stderr
+    
+    Stderr is drained in chunks by a background thread into a bounded
+    buffer, so verbose tools (FFmpeg) never pin their whole log in memory.
+    The tail is returned undecoded; callers decode only what they show.
+    
+    Args:
+        cmd: Command line to execute
+        timeout: Maximum run time in seconds
+        tail_size: Number of trailing stderr bytes to keep
+        on_output: Called from the reader thread with each stderr chunk
+    
+    Returns:
+        Tuple of (return_code, stderr_tail_bytes)
+    
+    Raises:
+        subprocess.TimeoutExpired: If the tool runs longer than timeout
+    """
+    process = subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        bufsize=0
+    )
+    tail = bytearray()
+    reader = _start_tail_reader(process.stderr, tail, tail_size, on_output)
+    
+    try:
+        return_code = process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        reader.join()
+        process.stderr.close()
+    
+    return return_code, bytes(tail)
+
+
+def pipe_tool(cmd: List[str], source: BinaryIO, sink: BinaryIO, timeout: float,
+              tail_size: int = 4096, chunk_size: int = 1024 * 1024) -> Tuple[int, bytes]:
+    """
+    Run an external tool that reads stdin and writes stdout, streaming both
+    
+    A feeder thread copies source into the tool while the calling thread
+    copies the tool's output into sink, so a producer upstream and a
+    consumer downstream overlap with the conversion itself and no
+    intermediate file is written.
+    
+    Args:
+        cmd: Command line to execute (reading pipe:0, writing pipe:1)
+        source: Binary file object the input is read from
+        sink: Binary file object the output is written to
+        timeout: Maximum run time in seconds
+        tail_size: Number of trailing stderr bytes to keep
+        chunk_size: Bytes copied per read
+    
+    Returns:
+        Tuple of (return_code, stderr_tail_bytes)
+    
+    Raises:
+        subprocess.TimeoutExpired: If the tool runs longer than timeout
+    """
+    process = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=0
+    )
+    tail = bytearray()
+    reader = _start_tail_reader(process.stderr, tail, tail_size)
+    
+    def _feed():
+        try:
+            shutil.copyfileobj(source, process.stdin, chunk_size)
+        except (BrokenPipeError, ValueError):
+            # Tool exited (or was killed) before consuming all input
+            pass
+        finally:
+            try:
+                process.stdin.close()
+            except BrokenPipeError:
+                pass
+    
+    feeder = threading.Thread(target=_feed, daemon=True)
+    feeder.start()
+    
+    # The output copy blocks this thread, so the time limit is enforced by a timer
+    timed_out = threading.Event()
+    
+    def _kill():
+        timed_out.set()
+        process.kill()
+    
+    timer = threading.Timer(timeout, _kill)
+    timer.start()
+    try:
+        shutil.copyfileobj(process.stdout, sink, chunk_size)
+        return_code = process.wait()
+    finally:
+        timer.cancel()
+        feeder.join()
+        reader.join()
+        process.stdout.close()
+        process.stderr.close()
+    
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return return_code, bytes(tail)
+
+
 class BaseConverter(ABC):
     """Abstract base class for all converters"""
     
-    def __init__(self):
-        self.logger = get_logger()
+    __slots__ = ()
+    
+    # Module logger, shared by all converter instances
+    logger = logger
     
     @abstractmethod
     def convert(self, input_file: str, output_file: str, settings: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
@@ -30,13 +206,72 @@ class BaseConverter(ABC):
         """
         pass
     
+    def start_timer(self) -> Optional[int]:
+        """
+        Start timing a conversion
+        
+        Returns:
+            perf_counter_ns() start value, or None when neither the log nor
+            notifications would show the duration
+        """
+        if self.logger.isEnabledFor(logging.INFO) or Notifications.enabled:
+            return time.perf_counter_ns()
+        return None
+    
+    @staticmethod
+    def elapsed(start_time: Optional[int]) -> float:
+        """Seconds since start_timer() (0.0 if timing was skipped)"""
+        if start_time is None:
+            return 0.0
+        return (time.perf_counter_ns() - start_time) / 1e9
+    
     def validate_input(self, input_file: str) -> bool:
         """Validate input file exists"""
-        if not Path(input_file).exists():
+        if not os.path.exists(input_file):
             self.logger.error(f"Input file not found: {input_file}")
             return False
         return True
     
     def ensure_output_dir(self, output_file: str) -> None:
         """Ensure output directory exists"""
-        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+        os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+    
+    def try_passthrough(self, input_file: str, output_file: str, settings: Dict[str, Any]) -> bool:
+        """
+        Hard-link or copy the input when no conversion is needed
+        
+        Applies when input and output share an extension, quality is
+        'Original' and no transforming option (resize, resolution, ...)
+        is set.
+        
+        Args:
+            input_file: Path to input file
+            output_file: Path to output file
+            settings: Conversion settings
+        
+        Returns:
+            True if the output was produced without running a converter
+        """
+        if settings.get('quality', 'Medium') != 'Original':
+            return False
+        if os.path.splitext(input_file)[1].lower() != os.path.splitext(output_file)[1].lower():
+            return False
+        if any(settings.get(key) not in (None, 'Original') for key in _TRANSFORM_SETTINGS):
+            return False
+        
+        try:
+            self.ensure_output_dir(output_file)
+            if os.path.exists(output_file):
+                if os.path.samefile(input_file, output_file):
+                    return True
+                os.remove(output_file)
+            try:
+                os.link(input_file, output_file)
+            except OSError:
+                shutil.copyfile(input_file, output_file)
+        except OSError as e:
+            self.logger.debug(f"Passthrough copy failed, converting instead: {e}")
+            return False
+        
+        self.logger.info(f"Copied unchanged: {os.path.basename(input_file)} -> {os.path.basename(output_file)}")
+        return True
@@ -2,18 +2,19 @@
 # -*- coding: utf-8 -*-
 """Document converter using Pandoc with beautiful notifications"""
 
+import os
 import subprocess
-import time
 from typing import Tuple, Dict, Any, Optional
-from pathlib import Path
-from converters.base_converter import BaseConverter
+from converters.base_converter import BaseConverter, find_tool, run_tool
 from config.settings import CONVERSION_TIMEOUT
-from ui.notifications import Notifications
+from ui.notifications import AsyncNotifications
 
 
 class DocumentConverter(BaseConverter):
     """Convert documents using Pandoc with enhanced UI feedback"""
     
+    __slots__ = ()
+    
     def convert(self, input_file: str, output_file: str, settings: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         """
         Convert document with progress notifications
@@ -28,41 +29,50 @@ class DocumentConverter(BaseConverter):
         """
         if not self.validate_input(input_file):
             error_msg = "Input file not found"
-            Notifications.show_conversion_failed(input_file, error_msg)
+            AsyncNotifications.show_conversion_failed(input_file, error_msg)
+            return False, error_msg
+        
+        # Same format with nothing to change: link/copy instead of converting
+        if self.try_passthrough(input_file, output_file, settings):
+            AsyncNotifications.show_conversion_complete(input_file, output_file)
+            return True, None
+        
+        pandoc = find_tool('pandoc')
+        if pandoc is None:
+            error_msg = "Pandoc not found. Please install Pandoc first."
+            self.logger.error(error_msg)
+            AsyncNotifications.show_conversion_failed(input_file, error_msg)
             return False, error_msg
         
         self.ensure_output_dir(output_file)
         
         # Start timing
-        start_time = time.time()
+        start_time = self.start_timer()
         
         try:
-            cmd = ['pandoc', input_file, '-o', output_file]
+            cmd = [pandoc, input_file, '-o', output_file]
             
-            self.logger.info(f"Converting document: {Path(input_file).name} -> {Path(output_file).name}")
+            in_name = os.path.basename(input_file)
+            out_name = os.path.basename(output_file)
+            self.logger.info(f"Converting document: {in_name} -> {out_name}")
             
             # Show progress notification
-            Notifications.show_progress_notification(
-                f"Converting document: {Path(input_file).name}",
+            AsyncNotifications.show_progress_notification(
+                f"Converting document: {in_name}",
                 icon="📝"
             )
             
             # Execute
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=CONVERSION_TIMEOUT
-            )
+            return_code, stderr_tail = run_tool(cmd, CONVERSION_TIMEOUT)
             
             # Calculate duration
-            duration = time.time() - start_time
+            duration = self.elapsed(start_time)
             
-            if result.returncode == 0:
+            if return_code == 0:
                 self.logger.info(f"Document conversion successful in {duration:.2f}s")
                 
                 # Show success notification
-                Notifications.show_conversion_complete(
+                AsyncNotifications.show_conversion_complete(
                     input_file,
                     output_file,
                     duration
@@ -70,25 +80,19 @@ class DocumentConverter(BaseConverter):
                 
                 return True, None
             else:
-                error = result.stderr[:300] if result.stderr else result.stdout[:300]
+                error = stderr_tail[-300:].decode('utf-8', errors='replace')
                 self.logger.error(f"Pandoc failed: {error}")
-                Notifications.show_conversion_failed(input_file, error)
+                AsyncNotifications.show_conversion_failed(input_file, error)
                 return False, error
                 
         except subprocess.TimeoutExpired:
             error_msg = f"Conversion timeout (>{CONVERSION_TIMEOUT}s)"
             self.logger.error(error_msg)
-            Notifications.show_conversion_failed(input_file, "⏱️ Timeout: Conversion took too long")
-            return False, error_msg
-            
-        except FileNotFoundError:
-            error_msg = "Pandoc not found. Please install Pandoc first."
-            self.logger.error(error_msg)
-            Notifications.show_conversion_failed(input_file, error_msg)
+            AsyncNotifications.show_conversion_failed(input_file, "⏱️ Timeout: Conversion took too long")
             return False, error_msg
             
         except Exception as e:
             error_msg = str(e)[:300]
             self.logger.error(f"Document conversion exception: {error_msg}")
-            Notifications.show_conversion_failed(input_file, error_msg)
+            AsyncNotifications.show_conversion_failed(input_file, error_msg)
             return False, error_msg
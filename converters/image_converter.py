@@ -2,27 +2,82 @@
 # -*- coding: utf-8 -*-
 """Image converter using PIL/Pillow with beautiful notifications"""
 
-import time
+import os
+import re
+from functools import lru_cache
 from typing import Tuple, Dict, Any, Optional
-from pathlib import Path
 from converters.base_converter import BaseConverter
-from config.settings import QUALITY_PRESETS
-from ui.notifications import Notifications
+from config.settings import IMAGE_QUALITY
+from ui.notifications import AsyncNotifications
 
-try:
-    from PIL import Image
-    HAS_PIL = True
-except ImportError:
-    HAS_PIL = False
+# Output extensions that need an RGB image
+_JPEG_EXTENSIONS = ('.jpg', '.jpeg')
+
+# Format-specific save options by output extension (quality -> kwargs);
+# JPEGs are progressive, which is usually smaller at the same quality
+_SAVE_OPTIONS = {
+    '.jpg': lambda quality: {'optimize': True, 'progressive': True, 'quality': quality},
+    '.jpeg': lambda quality: {'optimize': True, 'progressive': True, 'quality': quality},
+    '.png': lambda quality: {'optimize': True, 'compress_level': 9 if quality > 90 else 6},
+}
+
+# Resize option formats: '50%' and '1920x1080'
+_PERCENT_RE = re.compile(r'\s*(\d+)\s*%\s*')
+_WH_RE = re.compile(r'\s*(\d+)\s*x\s*(\d+)\s*', re.IGNORECASE)
+
+
+@lru_cache(maxsize=32)
+def _parse_resize(option: str) -> tuple:
+    """
+    Parse a resize option string
+    
+    Args:
+        option: Resize option (e.g., '50%', '1920x1080')
+    
+    Returns:
+        ('percent', percent), ('wh', width, height) or ('invalid',)
+    """
+    match = _PERCENT_RE.fullmatch(option)
+    if match and int(match.group(1)) > 0:
+        return ('percent', int(match.group(1)))
+    
+    match = _WH_RE.fullmatch(option)
+    if match and int(match.group(1)) > 0 and int(match.group(2)) > 0:
+        return ('wh', int(match.group(1)), int(match.group(2)))
+    
+    return ('invalid',)
+
+
+def _target_size(size: Tuple[int, int], option: str) -> Optional[Tuple[int, int]]:
+    """Get the output size for a resize option, or None if it is invalid"""
+    parsed = _parse_resize(option)
+    if parsed[0] == 'percent':
+        return int(size[0] * parsed[1] / 100), int(size[1] * parsed[1] / 100)
+    if parsed[0] == 'wh':
+        return parsed[1], parsed[2]
+    return None
 
 
 class ImageConverter(BaseConverter):
     """Convert image files using PIL/Pillow with enhanced UI feedback"""
     
-    def __init__(self):
-        super().__init__()
-        if not HAS_PIL:
-            self.logger.warning("PIL/Pillow not available - image conversion will fail")
+    __slots__ = ()
+    
+    # PIL.Image module, imported on first conversion
+    _Image = None
+    
+    @classmethod
+    def _get_pil(cls):
+        """
+        Import PIL.Image on first use and cache it on the class
+        
+        Raises:
+            ImportError: If Pillow is not installed
+        """
+        if cls._Image is None:
+            import PIL.Image as _Image
+            cls._Image = _Image
+        return cls._Image
     
     def convert(self, input_file: str, output_file: str, settings: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         """
@@ -36,32 +91,42 @@ class ImageConverter(BaseConverter):
         Returns:
             Tuple of (success: bool, error_message: Optional[str])
         """
-        if not HAS_PIL:
+        try:
+            Image = self._get_pil()
+        except ImportError:
             error_msg = "PIL/Pillow not installed. Install with: pip install Pillow"
-            Notifications.show_conversion_failed(input_file, error_msg)
+            self.logger.warning("PIL/Pillow not available - image conversion failed")
+            AsyncNotifications.show_conversion_failed(input_file, error_msg)
             return False, error_msg
         
         if not self.validate_input(input_file):
             error_msg = "Input file not found"
-            Notifications.show_conversion_failed(input_file, error_msg)
+            AsyncNotifications.show_conversion_failed(input_file, error_msg)
             return False, error_msg
         
+        # Same format with nothing to change: link/copy instead of converting
+        if self.try_passthrough(input_file, output_file, settings):
+            AsyncNotifications.show_conversion_complete(input_file, output_file)
+            return True, None
+        
         self.ensure_output_dir(output_file)
         
         # Start timing
-        start_time = time.time()
+        start_time = self.start_timer()
         
         try:
             # Get quality settings
             quality_name = settings.get('quality', 'Medium')
-            preset = QUALITY_PRESETS.get(quality_name, QUALITY_PRESETS['Medium'])
-            quality = preset['image_quality']
+            quality = IMAGE_QUALITY.get(quality_name, IMAGE_QUALITY['Medium'])
+            output_ext = os.path.splitext(output_file)[1].lower()
             
-            self.logger.info(f"Converting image: {Path(input_file).name} -> {Path(output_file).name}")
+            in_name = os.path.basename(input_file)
+            out_name = os.path.basename(output_file)
+            self.logger.info(f"Converting image: {in_name} -> {out_name}")
             
             # Show progress notification
-            Notifications.show_progress_notification(
-                f"Converting image: {Path(input_file).name}",
+            AsyncNotifications.show_progress_notification(
+                f"Converting image: {in_name}",
                 icon="🖼️"
             )
             
@@ -72,36 +137,37 @@ class ImageConverter(BaseConverter):
             
             # Resize if specified
             if settings.get('resize') and settings['resize'] != 'Original':
-                img = self._resize_image(img, settings['resize'])
+                # Let libjpeg decode at a reduced DCT scale when shrinking
+                target = _target_size(original_size, settings['resize'])
+                if (img.format == 'JPEG' and target and
+                        target[0] < img.width and target[1] < img.height):
+                    img.draft('RGB', target)
+                    self.logger.debug(f"JPEG draft decode at: {img.size}")
+                
+                img = self._resize_image(img, settings['resize'], quality, source_size=original_size)
                 self.logger.debug(f"Resized to: {img.size}")
             
             # Convert RGBA to RGB for JPG
-            if img.mode in ('RGBA', 'LA', 'P') and output_file.lower().endswith(('.jpg', '.jpeg')):
+            if img.mode in ('RGBA', 'LA', 'P') and output_ext in _JPEG_EXTENSIONS:
                 self.logger.debug(f"Converting {img.mode} to RGB for JPEG")
-                background = Image.new('RGB', img.size, (255, 255, 255))
-                if img.mode == 'RGBA':
-                    background.paste(img, mask=img.split()[3])
-                else:
-                    background.paste(img)
-                img = background
+                if img.mode != 'RGBA':
+                    img = img.convert('RGBA')
+                background = Image.new('RGBA', img.size, (255, 255, 255, 255))
+                img = Image.alpha_composite(background, img).convert('RGB')
             
             # Save with optimization
-            save_kwargs = {'optimize': True}
-            
-            if output_file.lower().endswith(('.jpg', '.jpeg')):
-                save_kwargs['quality'] = quality
-            elif output_file.lower().endswith('.png'):
-                save_kwargs['compress_level'] = 9 if quality > 90 else 6
+            save_options = _SAVE_OPTIONS.get(output_ext)
+            save_kwargs = save_options(quality) if save_options else {'optimize': True}
             
             img.save(output_file, **save_kwargs)
             
             # Calculate duration
-            duration = time.time() - start_time
+            duration = self.elapsed(start_time)
             
             self.logger.info(f"Image conversion successful in {duration:.2f}s")
             
             # Show success notification
-            Notifications.show_conversion_complete(
+            AsyncNotifications.show_conversion_complete(
                 input_file,
                 output_file,
                 duration
@@ -112,25 +178,62 @@ class ImageConverter(BaseConverter):
         except Exception as e:
             error_msg = str(e)[:300]
             self.logger.error(f"Image conversion exception: {error_msg}")
-            Notifications.show_conversion_failed(input_file, error_msg)
+            AsyncNotifications.show_conversion_failed(input_file, error_msg)
             return False, error_msg
     
-    def _resize_image(self, img: Image.Image, resize_option: str) -> Image.Image:
-        """Resize image based on option"""
-        if '%' in resize_option:
+    def _select_resample(self, scale: float, quality: int):
+        """
+        Pick a resampling filter for the given scale factor and quality
+        
+        Upscales and High/Ultra quality keep LANCZOS; cheaper filters are
+        used for downscales where the difference is not visible.
+        """
+        Image = self._get_pil()
+        if scale >= 1.0 or quality >= 95:
+            return Image.Resampling.LANCZOS
+        if scale > 0.4:
+            return Image.Resampling.BICUBIC
+        return Image.Resampling.BILINEAR
+    
+    def _resize_image(self, img: "PIL.Image.Image", resize_option: str,
+                      quality: int = 80, resample=None,
+                      source_size: Optional[Tuple[int, int]] = None) -> "PIL.Image.Image":
+        """
+        Resize image based on option
+        
+        Args:
+            img: Image to resize
+            resize_option: Percentage ('50%') or dimensions ('1920x1080')
+            quality: Image quality from the preset, used to pick the filter
+            resample: Resampling filter override (None = choose automatically)
+            source_size: Size percentages are relative to (default: img.size);
+                differs from img.size after a JPEG draft decode
+        
+        Returns:
+            Resized image
+        """
+        parsed = _parse_resize(resize_option)
+        
+        if parsed[0] == 'percent':
             # Percentage resize
-            percent = int(resize_option.rstrip('%'))
-            new_width = int(img.width * percent / 100)
-            new_height = int(img.height * percent / 100)
-            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            percent = parsed[1]
+            new_width, new_height = _target_size(source_size or img.size, resize_option)
+            if resample is None:
+                resample = self._select_resample(new_width / img.width, quality)
+            if new_width < img.width:
+                # Downscale in place, without an intermediate copy
+                img.thumbnail((new_width, new_height), resample=resample)
+            else:
+                img = img.resize((new_width, new_height), resample)
             self.logger.info(f"Resized to {percent}%: {img.size}")
-        elif 'x' in resize_option.lower():
+        elif parsed[0] == 'wh':
             # Dimension resize
-            try:
-                width, height = map(int, resize_option.lower().split('x'))
-                img = img.resize((width, height), Image.Resampling.LANCZOS)
-                self.logger.info(f"Resized to: {img.size}")
-            except ValueError:
-                self.logger.warning(f"Invalid resize option: {resize_option}")
+            _, width, height = parsed
+            if resample is None:
+                resample = self._select_resample(width / img.width, quality)
+            img = img.resize((width, height), resample)
+            self.logger.info(f"Resized to: {img.size}")
+        else:
+            self.logger.warning(f"Invalid resize option: {resize_option}")
         
         return img
@@ -2,18 +2,85 @@
 # -*- coding: utf-8 -*-
 """Video converter using FFmpeg with beautiful notifications"""
 
+import logging
+import os
+import re
+import shlex
 import subprocess
 import time
-from typing import Tuple, Dict, Any, Optional
-from pathlib import Path
-from converters.base_converter import BaseConverter
-from config.settings import QUALITY_PRESETS, CONVERSION_TIMEOUT
-from ui.notifications import Notifications
+from functools import lru_cache
+from typing import Tuple, Dict, Any, Optional, List, Callable, BinaryIO
+from converters.base_converter import BaseConverter, find_tool, run_tool, pipe_tool
+from config.settings import AUDIO_ARGS, VIDEO_ARGS, CONVERSION_TIMEOUT
+from core.tool_checker import get_hw_encoder, VAAPI_DEVICE
+from ui.notifications import AsyncNotifications
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Hardware encoders to use in place of a software codec, by the encoder
+# family get_hw_encoder() found usable on this machine
+_HW_ENCODERS = {
+    'nvenc': {'libx264': 'h264_nvenc', 'libx265': 'hevc_nvenc'},
+}
+
+# Encoded position in FFmpeg's stats output (e.g., "time=00:01:23.45")
+_TIME_RE = re.compile(rb'time=(\d+:\d+:\d+\.\d+)')
+
+# A stderr line mentioning an error (FFmpeg ends stats lines with \r)
+_ERROR_LINE_RE = re.compile(rb'[^\r\n]*(?:error|invalid)[^\r\n]*', re.IGNORECASE)
+
+# Muxers that need a seekable output unless told to fragment
+_SEEKING_MUXERS = ('mp4', 'mov', 'ismv')
+
+# Minimum seconds between progress notifications
+_PROGRESS_INTERVAL = 0.25
+
+# Outputs that only carry the audio track
+_AUDIO_ONLY_EXTS = ('.mp3',)
+
+# Hardware H.264 encoders: (encoder, constant-quality flag replacing -crf, extra options)
+_HW_VIDEO_ENCODERS = {
+    'nvenc': ('h264_nvenc', '-cq', ('-preset', 'p5')),
+    'vaapi': ('h264_vaapi', '-qp', ()),
+}
+
+# Containers (by extension or muxer name) that take H.264 video
+_H264_CONTAINERS = ('mp4', 'm4v', 'mov', 'mkv', 'matroska', 'avi')
+
+
+@lru_cache(maxsize=32)
+def _normalize_settings(quality: str, resolution: Optional[str], fps: Any,
+                        codec: Optional[str]) -> Tuple[Tuple[str, ...], Optional[str], Optional[str], Optional[str]]:
+    """
+    Resolve conversion settings to FFmpeg values
+    
+    Cached, since a batch converts every file with the same settings.
+    
+    Args:
+        quality: Quality preset name
+        resolution: Resolution (e.g., '1280x720'), 'Original' or None
+        fps: Frame rate, 'Original' or None
+        codec: Video codec or None
+    
+    Returns:
+        Tuple of (video_args, resolution, fps, codec); unset values are None
+    """
+    return (
+        VIDEO_ARGS.get(quality, VIDEO_ARGS['Medium']),
+        resolution if resolution and resolution != 'Original' else None,
+        str(fps) if fps and fps != 'Original' else None,
+        codec or None,
+    )
 
 
 class VideoConverter(BaseConverter):
     """Convert video files using FFmpeg with enhanced UI feedback"""
     
+    __slots__ = ()
+    
     def convert(self, input_file: str, output_file: str, settings: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         """
         Convert video file with progress notifications
@@ -28,70 +95,60 @@ class VideoConverter(BaseConverter):
         """
         if not self.validate_input(input_file):
             error_msg = "Input file not found"
-            Notifications.show_conversion_failed(input_file, error_msg)
+            AsyncNotifications.show_conversion_failed(input_file, error_msg)
+            return False, error_msg
+        
+        # Same format with nothing to change: link/copy instead of converting
+        if self.try_passthrough(input_file, output_file, settings):
+            AsyncNotifications.show_conversion_complete(input_file, output_file)
+            return True, None
+        
+        ffmpeg = find_tool('ffmpeg')
+        if ffmpeg is None:
+            error_msg = "FFmpeg not found. Please install FFmpeg first."
+            self.logger.error(error_msg)
+            AsyncNotifications.show_conversion_failed(input_file, error_msg)
             return False, error_msg
         
         self.ensure_output_dir(output_file)
         
         # Start timing
-        start_time = time.time()
+        start_time = self.start_timer()
         
         try:
-            # Get quality settings
-            quality_name = settings.get('quality', 'Medium')
-            preset = QUALITY_PRESETS.get(quality_name, QUALITY_PRESETS['Medium'])
+            # Only build debug messages when they will be emitted
+            debug = self.logger.isEnabledFor(logging.DEBUG)
             
-            # Build FFmpeg command
-            cmd = [
-                'ffmpeg',
-                '-i', input_file,
-                '-crf', preset['crf'],
-                '-b:a', preset['audio_bitrate'],
-            ]
-            
-            # Add resolution if specified
-            if settings.get('resolution') and settings['resolution'] != 'Original':
-                cmd.extend(['-s', settings['resolution']])
-                self.logger.debug(f"Resolution set to: {settings['resolution']}")
-            
-            # Add FPS if specified
-            if settings.get('fps') and settings['fps'] != 'Original':
-                cmd.extend(['-r', str(settings['fps'])])
-                self.logger.debug(f"FPS set to: {settings['fps']}")
-            
-            # Add codec if specified
-            if settings.get('codec'):
-                cmd.extend(['-c:v', settings['codec']])
-                self.logger.debug(f"Codec set to: {settings['codec']}")
-            
-            cmd.extend(['-y', output_file])
+            # Build FFmpeg command (FFmpeg falls back to software decoding
+            # if no hardware decoder is usable)
+            hw_encoder = self._hw_encoder(settings, os.path.splitext(output_file)[1][1:].lower())
+            cmd = [ffmpeg, '-hwaccel', 'auto', *self._device_args(hw_encoder), '-i', input_file,
+                   *self._output_args(settings, debug, hw_encoder), '-y', output_file]
             
-            self.logger.info(f"Converting video: {Path(input_file).name} -> {Path(output_file).name}")
-            self.logger.debug(f"FFmpeg command: {' '.join(cmd)}")
-            self.logger.debug(f"Quality: {quality_name}, CRF: {preset['crf']}, Audio: {preset['audio_bitrate']}")
+            in_name = os.path.basename(input_file)
+            out_name = os.path.basename(output_file)
+            self.logger.info(f"Converting video: {in_name} -> {out_name}")
+            if debug:
+                self.logger.debug(f"FFmpeg command: {shlex.join(cmd)}")
             
             # Show progress notification
-            Notifications.show_progress_notification(
-                f"Converting video: {Path(input_file).name}",
+            AsyncNotifications.show_progress_notification(
+                f"Converting video: {in_name}",
                 icon="🎬"
             )
             
-            # Execute FFmpeg
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=CONVERSION_TIMEOUT
-            )
+            # Execute FFmpeg, reporting its position as stderr streams in
+            on_output = None if settings.get('batch_mode') else _progress_reporter(in_name)
+            return_code, stderr_tail = run_tool(cmd, CONVERSION_TIMEOUT, on_output=on_output)
             
             # Calculate duration
-            duration = time.time() - start_time
+            duration = self.elapsed(start_time)
             
-            if result.returncode == 0:
+            if return_code == 0:
                 self.logger.info(f"Video conversion successful in {duration:.2f}s")
                 
                 # Show success notification
-                Notifications.show_conversion_complete(
+                AsyncNotifications.show_conversion_complete(
                     input_file,
                     output_file,
                     duration
@@ -99,58 +156,409 @@ class VideoConverter(BaseConverter):
                 
                 return True, None
             else:
-                # Extract meaningful error from FFmpeg output
-                error = result.stderr if result.stderr else result.stdout
-                
-                # Try to extract the actual error message
-                error_lines = error.split('\n')
-                meaningful_error = None
-                
-                for line in reversed(error_lines):
-                    if 'error' in line.lower() or 'invalid' in line.lower():
-                        meaningful_error = line.strip()
-                        break
-                
-                if not meaningful_error:
-                    meaningful_error = error[:300]
+                # Extract the last error line from FFmpeg output
+                matches = _ERROR_LINE_RE.findall(stderr_tail)
+                error = matches[-1] if matches else stderr_tail[-300:]
+                meaningful_error = error.decode('utf-8', errors='replace').strip()
                 
                 self.logger.error(f"FFmpeg failed: {meaningful_error}")
                 
                 # Show failure notification
-                Notifications.show_conversion_failed(input_file, meaningful_error)
+                AsyncNotifications.show_conversion_failed(input_file, meaningful_error)
                 
                 return False, meaningful_error
                 
         except subprocess.TimeoutExpired:
-            duration = time.time() - start_time
+            duration = self.elapsed(start_time)
             error_msg = f"Conversion timeout after {duration:.0f}s (limit: {CONVERSION_TIMEOUT}s)"
             self.logger.error(error_msg)
             
             # Show timeout notification
-            Notifications.show_conversion_failed(
+            AsyncNotifications.show_conversion_failed(
                 input_file,
                 f"⏱️ Timeout: Conversion took too long (>{CONVERSION_TIMEOUT}s)"
             )
             
             return False, error_msg
             
-        except FileNotFoundError:
-            error_msg = "FFmpeg not found. Please install FFmpeg first."
-            self.logger.error(error_msg)
-            Notifications.show_conversion_failed(input_file, error_msg)
-            return False, error_msg
-            
         except PermissionError:
             error_msg = f"Permission denied: Cannot write to {output_file}"
             self.logger.error(error_msg)
-            Notifications.show_conversion_failed(input_file, error_msg)
+            AsyncNotifications.show_conversion_failed(input_file, error_msg)
             return False, error_msg
             
         except Exception as e:
             error_msg = str(e)[:300]
             self.logger.error(f"Video conversion exception: {error_msg}", exc_info=True)
-            Notifications.show_conversion_failed(input_file, error_msg)
+            AsyncNotifications.show_conversion_failed(input_file, error_msg)
+            return False, error_msg
+    
+    @staticmethod
+    def _hw_encoder(settings: Dict[str, Any], container: str) -> Optional[str]:
+        """
+        Hardware encoder family to use for an output, if any
+        
+        Applies when the caller detected one (settings['hwaccel']), no codec
+        was requested explicitly and the container takes H.264.
+        
+        Args:
+            settings: Conversion settings
+            container: Output extension or muxer name (e.g., 'mp4')
+        
+        Returns:
+            'nvenc', 'vaapi' or None for software encoding
+        """
+        hwaccel = settings.get('hwaccel')
+        if hwaccel in _HW_VIDEO_ENCODERS and not settings.get('codec') and container in _H264_CONTAINERS:
+            return hwaccel
+        return None
+    
+    @staticmethod
+    def _device_args(hw_encoder: Optional[str]) -> List[str]:
+        """FFmpeg options, placed before -i, that open the encoder's device"""
+        return ['-vaapi_device', VAAPI_DEVICE] if hw_encoder == 'vaapi' else []
+    
+    @staticmethod
+    def _encoder_args(video_args: Tuple[str, ...], hw_encoder: Optional[str]) -> List[str]:
+        """Quality preset options, moved onto the hardware encoder if one is used"""
+        args = list(video_args)
+        if hw_encoder:
+            encoder, quality_flag, extra = _HW_VIDEO_ENCODERS[hw_encoder]
+            # Same quality value, under the hardware encoder's flag
+            args[0] = quality_flag
+            args.extend(['-c:v', encoder, *extra])
+        return args
+    
+    def _output_args(self, settings: Dict[str, Any], debug: bool = False,
+                     hw_encoder: Optional[str] = None) -> List[str]:
+        """
+        Build the FFmpeg output options for the given settings
+        
+        Args:
+            settings: Conversion settings (quality, resolution, fps, codec, ffmpeg_threads)
+            debug: Log each option as it is added
+            hw_encoder: Hardware encoder family from _hw_encoder(), if any
+        
+        Returns:
+            List of FFmpeg arguments placed between the input and the output
+        """
+        quality_name = settings.get('quality', 'Medium')
+        video_args, resolution, fps, codec = _normalize_settings(
+            quality_name,
+            settings.get('resolution'),
+            settings.get('fps'),
+            settings.get('codec')
+        )
+        args = self._encoder_args(video_args, hw_encoder)
+        if debug:
+            self.logger.debug(f"Quality: {quality_name}, CRF: {video_args[1]}, Audio: {video_args[3]}")
+            if hw_encoder:
+                self.logger.debug(f"Hardware encoder: {_HW_VIDEO_ENCODERS[hw_encoder][0]}")
+        
+        # VAAPI encodes from GPU surfaces, so scaling happens before the upload
+        if hw_encoder == 'vaapi':
+            scale = f"scale={resolution.replace('x', ':')}," if resolution else ''
+            args.extend(['-vf', f"{scale}format=nv12,hwupload"])
+        elif resolution:
+            args.extend(['-s', resolution])
+            if debug:
+                self.logger.debug(f"Resolution set to: {resolution}")
+        
+        # Add FPS if specified
+        if fps:
+            args.extend(['-r', fps])
+            if debug:
+                self.logger.debug(f"FPS set to: {fps}")
+        
+        # Add codec if specified
+        if codec:
+            codec = self._select_codec(codec)
+            args.extend(['-c:v', codec])
+            if debug:
+                self.logger.debug(f"Codec set to: {codec}")
+        
+        # Use all cores by default; capped when several files are encoded at once
+        args.extend(['-threads', str(settings.get('ffmpeg_threads', 0))])
+        return args
+    
+    def convert_stream(self, source: BinaryIO, sink: BinaryIO, settings: Dict[str, Any],
+                       output_format: str) -> Tuple[bool, Optional[str]]:
+        """
+        Convert video read from a stream and write the result to a stream
+        
+        FFmpeg reads pipe:0 and writes pipe:1 while the input is still
+        being fed and the output drained, so an upstream producer (e.g. a
+        download) and downstream consumer overlap with the encode and no
+        intermediate file touches the disk.
+        
+        Args:
+            source: Binary file object to read the input video from
+            sink: Binary file object to write the converted video to
+            settings: Conversion settings (quality, resolution, fps, etc.)
+            output_format: FFmpeg muxer name for the output (e.g., 'mp4', 'matroska')
+        
+        Returns:
+            Tuple of (success: bool, error_message: Optional[str])
+        """
+        ffmpeg = find_tool('ffmpeg')
+        if ffmpeg is None:
+            error_msg = "FFmpeg not found. Please install FFmpeg first."
+            self.logger.error(error_msg)
+            return False, error_msg
+        
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        hw_encoder = self._hw_encoder(settings, output_format)
+        cmd = [ffmpeg, '-hide_banner', '-hwaccel', 'auto', *self._device_args(hw_encoder), '-i', 'pipe:0',
+               *self._output_args(settings, debug, hw_encoder)]
+        
+        # MP4/MOV normally seek back to write the index; fragment instead
+        if output_format in _SEEKING_MUXERS:
+            cmd.extend(['-movflags', 'frag_keyframe+empty_moov'])
+        cmd.extend(['-f', output_format, 'pipe:1'])
+        
+        if debug:
+            self.logger.debug(f"FFmpeg command: {shlex.join(cmd)}")
+        
+        start_time = self.start_timer()
+        try:
+            return_code, stderr_tail = pipe_tool(cmd, source, sink, CONVERSION_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            error_msg = f"Conversion timeout (>{CONVERSION_TIMEOUT}s)"
+            self.logger.error(error_msg)
+            return False, error_msg
+        except OSError as e:
+            error_msg = str(e)[:300]
+            self.logger.error(f"Video stream conversion exception: {error_msg}")
+            return False, error_msg
+        
+        if return_code == 0:
+            self.logger.info(f"Video stream conversion successful in {self.elapsed(start_time):.2f}s")
+            return True, None
+        
+        matches = _ERROR_LINE_RE.findall(stderr_tail)
+        error = matches[-1] if matches else stderr_tail[-300:]
+        meaningful_error = error.decode('utf-8', errors='replace').strip()
+        self.logger.error(f"FFmpeg failed: {meaningful_error}")
+        return False, meaningful_error
+    
+    def convert_batch(self, input_files: List[str], output_files: List[str],
+                      settings: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+        """
+        Convert several short clips in a single FFmpeg process
+        
+        Each clip is decoded and encoded on its own, but FFmpeg and the GPU
+        context start once for the group instead of once per clip, which
+        dominates the cost of converting short clips with NVDEC/NVENC.
+        
+        Args:
+            input_files: Paths to input video files
+            output_files: Output path for each input, in the same order
+            settings: Conversion settings shared by all clips
+        
+        Returns:
+            Tuple of (success: bool, error_message: Optional[str]) for the group
+        """
+        if not input_files:
+            return True, None
+        if len(input_files) == 1:
+            return self.convert(input_files[0], output_files[0], settings)
+        
+        missing = [f for f in input_files if not self.validate_input(f)]
+        if missing:
+            error_msg = f"Input file not found: {os.path.basename(missing[0])}"
+            AsyncNotifications.show_conversion_failed(missing[0], error_msg)
+            return False, error_msg
+        
+        ffmpeg = find_tool('ffmpeg')
+        if ffmpeg is None:
+            error_msg = "FFmpeg not found. Please install FFmpeg first."
+            self.logger.error(error_msg)
+            AsyncNotifications.show_conversion_failed(input_files[0], error_msg)
+            return False, error_msg
+        
+        hw_encoders = [self._hw_encoder(settings, os.path.splitext(f)[1][1:].lower()) for f in output_files]
+        cmd = [ffmpeg, *self._device_args('vaapi' if 'vaapi' in hw_encoders else None)]
+        for input_file in input_files:
+            cmd.extend(['-hwaccel', 'auto', '-i', input_file])
+        for i, (output_file, hw_encoder) in enumerate(zip(output_files, hw_encoders)):
+            self.ensure_output_dir(output_file)
+            # Audio-only outputs (e.g., MP3) take just the clip's audio track
+            if os.path.splitext(output_file)[1].lower() in _AUDIO_ONLY_EXTS:
+                audio_args = AUDIO_ARGS.get(settings.get('quality', 'Medium'), AUDIO_ARGS['Medium'])
+                cmd.extend(['-map', f'{i}:a', '-vn', *audio_args,
+                            '-threads', str(settings.get('ffmpeg_threads', 0)), '-y', output_file])
+                continue
+            cmd.extend(['-map', f'{i}:v', '-map', f'{i}:a?',
+                        *self._output_args(settings, hw_encoder=hw_encoder), '-y', output_file])
+        
+        self.logger.info(f"Converting {len(input_files)} video clips in one FFmpeg process")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"FFmpeg command: {shlex.join(cmd)}")
+        
+        start_time = self.start_timer()
+        try:
+            return_code, stderr_tail = run_tool(cmd, CONVERSION_TIMEOUT * len(input_files))
+        except subprocess.TimeoutExpired:
+            error_msg = f"Conversion timeout (>{CONVERSION_TIMEOUT * len(input_files)}s)"
+            self.logger.error(error_msg)
+            return False, error_msg
+        except OSError as e:
+            error_msg = str(e)[:300]
+            self.logger.error(f"Video conversion exception: {error_msg}")
+            return False, error_msg
+        
+        duration = self.elapsed(start_time)
+        if return_code == 0:
+            self.logger.info(f"Video clip batch successful in {duration:.2f}s")
+            for input_file, output_file in zip(input_files, output_files):
+                AsyncNotifications.show_conversion_complete(input_file, output_file, duration)
+            return True, None
+        
+        matches = _ERROR_LINE_RE.findall(stderr_tail)
+        error = matches[-1] if matches else stderr_tail[-300:]
+        meaningful_error = error.decode('utf-8', errors='replace').strip()
+        self.logger.error(f"FFmpeg failed: {meaningful_error}")
+        return False, meaningful_error
+    
+    def convert_multi_output(self, input_file: str,
+                             outputs: List[Tuple[str, Dict[str, Any]]]) -> Tuple[bool, Optional[str]]:
+        """
+        Convert one input to several outputs in a single FFmpeg process
+        
+        The source is decoded once and split with -filter_complex, with
+        one scale/fps branch and one encoder per output, instead of
+        decoding the same file again for every variant. Each output gets
+        the same quality and hardware-encoder options as convert();
+        audio-only outputs (MP3) map just the audio track.
+        
+        Args:
+            input_file: Path to input video file
+            outputs: List of (output_file, settings) tuples; each settings
+                dict takes the same keys as convert()
+        
+        Returns:
+            Tuple of (success: bool, error_message: Optional[str])
+        """
+        if not outputs:
+            return True, None
+        if len(outputs) == 1:
+            return self.convert(input_file, *outputs[0])
+        
+        if not self.validate_input(input_file):
+            error_msg = "Input file not found"
+            AsyncNotifications.show_conversion_failed(input_file, error_msg)
+            return False, error_msg
+        
+        ffmpeg = find_tool('ffmpeg')
+        if ffmpeg is None:
+            error_msg = "FFmpeg not found. Please install FFmpeg first."
+            self.logger.error(error_msg)
+            AsyncNotifications.show_conversion_failed(input_file, error_msg)
             return False, error_msg
+        
+        # One split feeding a per-output scale/fps chain: [0:v]split=N[s0][s1]...
+        # Audio-only outputs (e.g., MP3) take the audio track and skip the split
+        video_outputs = sum(1 for output_file, _ in outputs
+                            if os.path.splitext(output_file)[1].lower() not in _AUDIO_ONLY_EXTS)
+        branches = []
+        if video_outputs:
+            branches.append(f"[0:v]split={video_outputs}" + ''.join(f"[s{i}]" for i in range(video_outputs)))
+        output_args = []
+        device = None
+        i = 0
+        for output_file, settings in outputs:
+            self.ensure_output_dir(output_file)
+            ext = os.path.splitext(output_file)[1].lower()
+            if ext in _AUDIO_ONLY_EXTS:
+                audio_args = AUDIO_ARGS.get(settings.get('quality', 'Medium'), AUDIO_ARGS['Medium'])
+                output_args.extend(['-map', '0:a', '-vn', *audio_args,
+                                    '-threads', str(settings.get('ffmpeg_threads', 0)), '-y', output_file])
+                continue
+            
+            hw_encoder = self._hw_encoder(settings, ext[1:])
+            device = device or hw_encoder
+            video_args, resolution, fps, codec = _normalize_settings(
+                settings.get('quality', 'Medium'),
+                settings.get('resolution'),
+                settings.get('fps'),
+                settings.get('codec')
+            )
+            
+            filters = []
+            if resolution:
+                filters.append(f"scale={resolution.replace('x', ':')}")
+            if fps:
+                filters.append(f"fps={fps}")
+            # VAAPI encodes from GPU surfaces, uploaded after scaling
+            if hw_encoder == 'vaapi':
+                filters.extend(['format=nv12', 'hwupload'])
+            branches.append(f"[s{i}]{','.join(filters) or 'null'}[v{i}]")
+            
+            output_args.extend(['-map', f'[v{i}]', '-map', '0:a?', *self._encoder_args(video_args, hw_encoder)])
+            if codec:
+                output_args.extend(['-c:v', self._select_codec(codec)])
+            output_args.extend(['-threads', str(settings.get('ffmpeg_threads', 0)), '-y', output_file])
+            i += 1
+        
+        cmd = [ffmpeg, '-hwaccel', 'auto', *self._device_args(device), '-i', input_file]
+        if branches:
+            cmd.extend(['-filter_complex', ';'.join(branches)])
+        cmd.extend(output_args)
+        
+        in_name = os.path.basename(input_file)
+        self.logger.info(f"Converting video: {in_name} -> {len(outputs)} outputs")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"FFmpeg command: {shlex.join(cmd)}")
+        
+        AsyncNotifications.show_progress_notification(
+            f"Converting video: {in_name} ({len(outputs)} outputs)",
+            icon="🎬"
+        )
+        
+        start_time = self.start_timer()
+        try:
+            on_output = None if outputs[0][1].get('batch_mode') else _progress_reporter(in_name)
+            return_code, stderr_tail = run_tool(cmd, CONVERSION_TIMEOUT, on_output=on_output)
+        except subprocess.TimeoutExpired:
+            error_msg = f"Conversion timeout (>{CONVERSION_TIMEOUT}s)"
+            self.logger.error(error_msg)
+            AsyncNotifications.show_conversion_failed(input_file, "⏱️ Timeout: Conversion took too long")
+            return False, error_msg
+        except OSError as e:
+            error_msg = str(e)[:300]
+            self.logger.error(f"Video conversion exception: {error_msg}")
+            AsyncNotifications.show_conversion_failed(input_file, error_msg)
+            return False, error_msg
+        
+        duration = self.elapsed(start_time)
+        if return_code == 0:
+            self.logger.info(f"Video conversion successful in {duration:.2f}s")
+            for output_file, _ in outputs:
+                AsyncNotifications.show_conversion_complete(input_file, output_file, duration)
+            return True, None
+        
+        matches = _ERROR_LINE_RE.findall(stderr_tail)
+        error = matches[-1] if matches else stderr_tail[-300:]
+        meaningful_error = error.decode('utf-8', errors='replace').strip()
+        self.logger.error(f"FFmpeg failed: {meaningful_error}")
+        AsyncNotifications.show_conversion_failed(input_file, meaningful_error)
+        return False, meaningful_error
+    
+    def _select_codec(self, codec: str) -> str:
+        """
+        Swap a software codec for a hardware encoder when the machine has one
+        
+        FFmpeg listing 'cuda' among its hwaccels only means it was built with
+        CUDA (distro builds are), so the swap follows get_hw_encoder(), which
+        also checks that nvidia-smi sees a GPU.
+        
+        Args:
+            codec: Requested FFmpeg video codec (e.g., 'libx264')
+        
+        Returns:
+            Codec name to pass to -c:v
+        """
+        return _HW_ENCODERS.get(get_hw_encoder(), {}).get(codec, codec)
     
     def get_video_info(self, video_file: str) -> Optional[Dict]:
         """
@@ -162,9 +570,14 @@ class VideoConverter(BaseConverter):
         Returns:
             Dictionary with video metadata or None
         """
+        ffprobe = find_tool('ffprobe')
+        if ffprobe is None:
+            self.logger.debug("Could not get video info: FFprobe not found")
+            return None
+        
         try:
             cmd = [
-                'ffprobe',
+                ffprobe,
                 '-v', 'quiet',
                 '-print_format', 'json',
                 '-show_format',
@@ -172,11 +585,16 @@ class VideoConverter(BaseConverter):
                 video_file
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            result = subprocess.run(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                timeout=30
+            )
             
             if result.returncode == 0:
-                import json
-                data = json.loads(result.stdout)
+                data = _json_loads(result.stdout)
                 
                 # Extract video stream info
                 video_stream = next(
@@ -185,11 +603,13 @@ class VideoConverter(BaseConverter):
                 )
                 
                 if video_stream:
+                    # Frame rate is a fraction string, e.g. "30000/1001"
+                    num, den = map(int, video_stream.get('r_frame_rate', '0/1').split('/'))
                     return {
                         'width': video_stream.get('width'),
                         'height': video_stream.get('height'),
                         'codec': video_stream.get('codec_name'),
-                        'fps': eval(video_stream.get('r_frame_rate', '0/1')),
+                        'fps': num / den if den else 0,
                         'duration': float(data.get('format', {}).get('duration', 0)),
                         'bitrate': int(data.get('format', {}).get('bit_rate', 0)),
                     }
@@ -199,3 +619,34 @@ class VideoConverter(BaseConverter):
         except Exception as e:
             self.logger.debug(f"Could not get video info: {e}")
             return None
+
+
+def _progress_reporter(name: str) -> Callable[[bytes], None]:
+    """
+    Build a stderr callback that shows FFmpeg's encode position
+    
+    The position is one status line rewritten in place; the completion
+    or failure notification that follows erases it.
+    
+    Args:
+        name: File name shown in the notification
+    
+    Returns:
+        Callback for run_tool's on_output, throttled to _PROGRESS_INTERVAL
+    """
+    last_report = 0.0
+    
+    def report(chunk: bytes):
+        nonlocal last_report
+        now = time.monotonic()
+        if now - last_report < _PROGRESS_INTERVAL:
+            return
+        matches = _TIME_RE.findall(chunk)
+        if matches:
+            last_report = now
+            AsyncNotifications.show_progress_status(
+                f"Encoding {name}: {matches[-1].decode('ascii')}",
+                icon="⏳"
+            )
+    
+    return report
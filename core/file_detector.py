@@ -2,13 +2,28 @@
 # -*- coding: utf-8 -*-
 """File type detection"""
 
-from pathlib import Path
-from typing import Tuple, Optional, Dict
-from config.settings import FILE_TYPE_MAP
+import os
+from typing import Tuple, Optional, Dict, Iterator
+from config.settings import FILE_TYPE_MAP, EXT_TO_TYPE
 from utils.logger import get_logger
 
 logger = get_logger()
 
+_MB = 1.0 / (1024 * 1024)
+
+_UNKNOWN = ('unknown', 'Unknown', '', {})
+
+# get_file_info() results shared by every detector in the process,
+# keyed by (path, mtime_ns, size)
+_INFO_CACHE_SIZE = 256
+_info_cache: Dict[Tuple[str, int, int], Dict] = {}
+
+# Extension -> detect() result, built once at import
+_DETECTIONS: Dict[str, Tuple[str, str, str, Dict]] = {}
+for _ext, _file_type in EXT_TO_TYPE.items():
+    _config = FILE_TYPE_MAP[_file_type]
+    _DETECTIONS[_ext] = (_file_type, _config['tool'], _config['icon'], _config.get('formats', {}))
+
 class FileDetector:
     """Detect file type and metadata"""
     
@@ -22,30 +37,56 @@ class FileDetector:
         Returns:
             Tuple of (file_type, tool_name, icon, formats_dict)
         """
-        try:
-            ext = Path(file_path).suffix.lower()
-            
-            for file_type, config in FILE_TYPE_MAP.items():
-                if ext in config['extensions']:
-                    logger.debug(f"Detected '{file_path}' as {file_type}")
-                    return (
-                        file_type,
-                        config['tool'],
-                        config['icon'],
-                        config.get('formats', {})
-                    )
-            
+        ext = os.path.splitext(file_path)[1].lower()
+        result = self._detect_from_ext(ext)
+        
+        if result is _UNKNOWN:
             logger.warning(f"Unknown file type for: {file_path}")
-            return 'unknown', 'Unknown', '', {}
-            
-        except Exception as e:
-            logger.error(f"Error detecting file type: {e}")
-            return 'unknown', 'Unknown', '', {}
+        else:
+            logger.debug(f"Detected '{file_path}' as {result[0]}")
+        return result
+    
+    @staticmethod
+    def _detect_from_ext(ext: str) -> Tuple[str, str, str, Dict]:
+        """
+        Detect file type from a lowercase extension (e.g., '.mp4')
+        
+        Returns:
+            Tuple of (file_type, tool_name, icon, formats_dict)
+        """
+        return _DETECTIONS.get(ext, _UNKNOWN)
+    
+    def detect_dir(self, directory: str) -> Iterator[Tuple[str, str, int]]:
+        """
+        Find supported files in a directory (non-recursive)
+        
+        Uses os.scandir so the type and size of each entry come from the
+        directory listing instead of a separate stat call per file.
+        
+        Args:
+            directory: Directory to scan
+        
+        Yields:
+            Tuple of (file_path, file_type, size_bytes) for each known file type
+        """
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                file_type = EXT_TO_TYPE.get(os.path.splitext(entry.name)[1].lower())
+                if file_type:
+                    yield entry.path, file_type, entry.stat(follow_symlinks=False).st_size
     
     def get_file_info(self, file_path: str) -> Optional[Dict]:
         """
         Get detailed file information
         
+        Results are cached by path, modification time and size, so showing
+        the same file again does not re-open it (images are read with PIL),
+        while an edited file is read afresh. The cache is shared by all
+        detectors, so a file inspected by one service is not re-read when
+        another converts it.
+        
         Args:
             file_path: Path to file
         
@@ -53,22 +94,28 @@ class FileDetector:
             Dict with file information or None
         """
         try:
-            path = Path(file_path)
-            if not path.exists():
+            try:
+                stat = os.stat(file_path)
+            except FileNotFoundError:
                 logger.error(f"File not found: {file_path}")
                 return None
             
-            file_type, tool, icon, formats = self.detect(file_path)
-            stat = path.stat()
+            key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+            cached = _info_cache.get(key)
+            if cached is not None:
+                return dict(cached)
+            
+            ext = os.path.splitext(file_path)[1].lower()
+            file_type, tool, icon, formats = self._detect_from_ext(ext)
             
             info = {
-                'name': path.name,
-                'path': str(path.absolute()),
+                'name': os.path.basename(file_path),
+                'path': key[0],
                 'type': file_type,
                 'tool': tool,
                 'icon': icon,
                 'size_bytes': stat.st_size,
-                'size_mb': stat.st_size / 1024 / 1024,
+                'size_mb': stat.st_size * _MB,
                 'formats': formats
             }
             
@@ -76,14 +123,17 @@ class FileDetector:
             if file_type == 'image':
                 try:
                     from PIL import Image
-                    img = Image.open(file_path)
-                    info['width'] = img.width
-                    info['height'] = img.height
-                    info['mode'] = img.mode
+                    with Image.open(file_path) as img:
+                        info['width'] = img.width
+                        info['height'] = img.height
+                        info['mode'] = img.mode
                 except Exception as e:
                     logger.debug(f"Could not read image metadata: {e}")
             
-            return info
+            if len(_info_cache) >= _INFO_CACHE_SIZE:
+                _info_cache.clear()
+            _info_cache[key] = info
+            return dict(info)
             
         except Exception as e:
             logger.error(f"Error getting file info: {e}")
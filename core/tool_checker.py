@@ -2,27 +2,105 @@
 # -*- coding: utf-8 -*-
 """Tool availability checker"""
 
+import importlib.util
+import os
 import shutil
-from typing import Dict
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 from config.settings import TOOL_COMMANDS
+from utils import tool_cache
 from utils.logger import get_logger
 
 logger = get_logger()
 
+
+@lru_cache(maxsize=1)
+def get_hwaccels() -> Tuple[str, ...]:
+    """
+    Get the hardware acceleration methods FFmpeg was built with
+    
+    FFmpeg is probed once per process; the result is cached.
+    
+    Returns:
+        Tuple of method names (e.g., ('cuda', 'vaapi')), empty if none
+    """
+    ffmpeg = shutil.which(TOOL_COMMANDS['FFmpeg'])
+    if ffmpeg is None:
+        return ()
+    
+    try:
+        result = subprocess.run(
+            [ffmpeg, '-hide_banner', '-hwaccels'],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.debug(f"Could not list FFmpeg hwaccels: {e}")
+        return ()
+    
+    # First line is the "Hardware acceleration methods:" header
+    methods = tuple(line.strip() for line in result.stdout.splitlines()[1:] if line.strip())
+    logger.debug(f"FFmpeg hwaccels: {', '.join(methods) or 'none'}")
+    return methods
+
+
+# Render node FFmpeg opens for VAAPI encoding
+VAAPI_DEVICE = '/dev/dri/renderD128'
+
+
+@lru_cache(maxsize=1)
+def get_hw_encoder() -> Optional[str]:
+    """
+    Pick the hardware video encoder family usable on this machine
+    
+    NVENC needs FFmpeg built with CUDA and a GPU visible to nvidia-smi;
+    VAAPI needs FFmpeg built with VAAPI and a render node. Probed once per
+    process; the result is cached.
+    
+    Returns:
+        'nvenc', 'vaapi' or None for software encoding
+    """
+    methods = get_hwaccels()
+    
+    if 'cuda' in methods:
+        nvidia_smi = shutil.which('nvidia-smi')
+        if nvidia_smi:
+            try:
+                result = subprocess.run(
+                    [nvidia_smi, '-L'],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=5
+                )
+                if result.returncode == 0:
+                    logger.debug("Hardware encoder: NVENC")
+                    return 'nvenc'
+            except (OSError, subprocess.TimeoutExpired) as e:
+                logger.debug(f"nvidia-smi failed: {e}")
+    
+    if 'vaapi' in methods and os.path.exists(VAAPI_DEVICE):
+        logger.debug("Hardware encoder: VAAPI")
+        return 'vaapi'
+    
+    return None
+
+
 class ToolChecker:
     """Check availability of external tools"""
     
     def __init__(self):
         self._cache = {}
+        self._status = None
         self._pil_available = self._check_pil()
     
     def _check_pil(self) -> bool:
-        """Check if PIL/Pillow is available"""
-        try:
-            from PIL import Image
-            return True
-        except ImportError:
-            return False
+        """Check if PIL/Pillow is installed (without importing it)"""
+        return importlib.util.find_spec('PIL') is not None
     
     def is_available(self, tool_name: str) -> bool:
         """
@@ -40,7 +118,7 @@ class ToolChecker:
         
         # Special case for PIL
         if tool_name == 'PIL/ImageMagick':
-            available = self._pil_available or shutil.which('convert') is not None
+            available = self._pil_available or tool_cache.available(TOOL_COMMANDS['ImageMagick'])
             self._cache[tool_name] = available
             return available
         
@@ -50,23 +128,61 @@ class ToolChecker:
             logger.warning(f"Unknown tool: {tool_name}")
             return False
         
-        available = shutil.which(cmd) is not None
+        # Persisted across runs, so startup does not walk PATH for every tool
+        available = tool_cache.available(cmd)
         self._cache[tool_name] = available
         
         logger.debug(f"Tool '{tool_name}': {'Available' if available else 'Not found'}")
         return available
     
-    def get_all_tools_status(self) -> Dict[str, bool]:
+    def get_all_tools_status(self, refresh: bool = False) -> Dict[str, bool]:
         """
         Get status of all tools
         
+        The result is memoized until invalidate() is called.
+        
+        Args:
+            refresh: Re-check every tool instead of using cached results
+        
         Returns:
             Dict mapping tool names to availability status
         """
+        if refresh:
+            self.invalidate()
+        if self._status is not None:
+            return dict(self._status)
+        
         tools = ['FFmpeg', 'PIL/ImageMagick', 'ImageMagick', 'Pandoc', 'LibreOffice', 'Calibre']
-        return {tool: self.is_available(tool) for tool in tools}
+        
+        # Uncached tools are probed as subprocesses; check them concurrently
+        with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+            self._status = dict(zip(tools, executor.map(self.is_available, tools)))
+        return dict(self._status)
+    
+    def invalidate(self):
+        """Forget cached results (in memory and on disk) so tools are re-checked"""
+        # Imported here: the converters import this module
+        from converters.base_converter import find_tool
+        
+        self._cache.clear()
+        self._status = None
+        self._pil_available = self._check_pil()
+        tool_cache.invalidate()
+        get_hwaccels.cache_clear()
+        get_hw_encoder.cache_clear()
+        find_tool.cache_clear()
+        logger.info("Tool status cache cleared")
     
     @property
     def has_pil(self) -> bool:
         """Check if PIL is available"""
         return self._pil_available
+    
+    @property
+    def hwaccels(self) -> Tuple[str, ...]:
+        """Hardware acceleration methods supported by FFmpeg"""
+        return get_hwaccels()
+    
+    def detect_hwaccel(self) -> Optional[str]:
+        """Hardware video encoder family to use ('nvenc', 'vaapi' or None)"""
+        return get_hw_encoder()
@@ -15,6 +15,8 @@ A beautiful, modular file conversion tool supporting:
 import sys
 import os
 import io
+import importlib.util
+from functools import lru_cache
 
 # UTF-8 encoding setup for Windows compatibility
 os.environ['PYTHONIOENCODING'] = 'utf-8'
@@ -22,32 +24,12 @@ if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from rich.align import Align
+# Console and logger are set up in main(); rich, the UI and the services
+# are imported there too, so --version and --help start instantly
+console = None
+logger = None
 
-# Import UI components
-from ui.menu import MainMenu
-from ui.display import Display
-
-# Import services
-from services.single_converter import SingleFileConverter
-from services.batch_converter import BatchFileConverter
-from services.file_info import FileInfoService
-
-# Import core components
-from core.tool_checker import ToolChecker
-from utils.logger import get_logger
-
-# Initialize console and logger
-console = Console()
-logger = get_logger()
-
-def show_splash_screen():
-    """Display beautiful splash screen on startup"""
-    console.clear()
-    splash = r"""
+_SPLASH_ART = r"""
     ╔════════════════════════════════════════════════════════════════╗
     ║                                                                ║
     ║     ██╗   ██╗███████╗██████╗                                  ║
@@ -63,13 +45,61 @@ def show_splash_screen():
     ║                  🎬 🎵 🖼️  📝 📊 📚                           ║
     ║                                                                ║
     ╚════════════════════════════════════════════════════════════════╝
-    """    
-    text = Text(splash, style="bold cyan")
-    console.print(Align.center(text))
+    """
+
+@lru_cache(maxsize=None)
+def _splash():
+    """Build the static splash screen renderable (once)"""
+    from rich.text import Text
+    from rich.align import Align
+    return Align.center(Text(_SPLASH_ART, style="bold cyan"))
+
+@lru_cache(maxsize=None)
+def _welcome_panel():
+    """Build the static welcome panel renderable (once)"""
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich.align import Align
+    # Better formatted welcome message
+    welcome_text = Text()
+    welcome_text.append("Welcome to Universal File Processor!\n", style="bold cyan")
+    welcome_text.append("\nA professional tool for converting:\n\n", style="white")
+    # Format in two lines
+    welcome_text.append("  🎬 Videos", style="green")
+    welcome_text.append("      ", style="dim")
+    welcome_text.append("🎵 Audio", style="green")
+    welcome_text.append("       ", style="dim")
+    welcome_text.append("🖼️  Images\n", style="green")
+    welcome_text.append("  📝 Documents", style="green")
+    welcome_text.append("   ", style="dim")
+    welcome_text.append("📊 Office", style="green")
+    welcome_text.append("      ", style="dim")
+    welcome_text.append("📚 Ebooks", style="green")
+    return Panel(
+        Align.center(welcome_text),
+        border_style="cyan",
+        padding=(1, 2)
+    )
+
+@lru_cache(maxsize=None)
+def _goodbye():
+    """Build the static goodbye message renderable (once)"""
+    from rich.text import Text
+    from rich.align import Align
+    goodbye_text = Text()
+    goodbye_text.append("\n\n")
+    goodbye_text.append("Thank you for using\n", style="bold cyan")
+    goodbye_text.append("Universal File Processor!\n\n", style="bold white")
+    goodbye_text.append("👋 Goodbye!\n\n", style="bold yellow")
+    return Align.center(goodbye_text)
+
+def show_splash_screen():
+    """Display beautiful splash screen on startup"""
+    from rich.align import Align
+    console.clear()
+    console.print(_splash())
     console.print()
     console.print(Align.center("[dim]Loading...[/dim]"))    
-    import time
-    time.sleep(1.2)
 
 def check_dependencies():
     """Check if required Python packages are installed"""
@@ -78,12 +108,11 @@ def check_dependencies():
         'rich': 'rich',
         'PIL': 'Pillow'
     }
-    missing = []
-    for module, package in required_packages.items():
-        try:
-            __import__(module)
-        except ImportError:
-            missing.append(package)
+    # Only locate the packages; importing them (PIL especially) is slow
+    missing = [
+        package for module, package in required_packages.items()
+        if importlib.util.find_spec(module) is None
+    ]
     if missing:
         console.print("\n[bold red]❌ Missing Dependencies[/bold red]\n")
         console.print("Please install the following packages:\n")
@@ -97,33 +126,11 @@ def check_dependencies():
 def show_startup_info(tool_checker):
     """Display startup information and tool status"""
     console.clear()
-    # Better formatted welcome message
-    welcome_text = Text()
-    welcome_text.append("Welcome to Universal File Processor!\n", style="bold cyan")
-    welcome_text.append("\nA professional tool for converting:\n\n", style="white")
-    # Format in two lines
-    welcome_text.append("  🎬 Videos", style="green")
-    welcome_text.append("      ", style="dim")
-    welcome_text.append("🎵 Audio", style="green")
-    welcome_text.append("       ", style="dim")
-    welcome_text.append("🖼️  Images\n", style="green")
-    welcome_text.append("  📝 Documents", style="green")
-    welcome_text.append("   ", style="dim")
-    welcome_text.append("📊 Office", style="green")
-    welcome_text.append("      ", style="dim")
-    welcome_text.append("📚 Ebooks", style="green")
-    welcome_panel = Panel(
-        Align.center(welcome_text),
-        border_style="cyan",
-        padding=(1, 2)
-    )
-    console.print(welcome_panel)
+    console.print(_welcome_panel())
     console.print()
-    # Animated checking with spinner
+    # Spinner runs only while the tools are actually being checked
     with console.status("[bold yellow]🔍 Checking installed tools...[/bold yellow]", spinner="dots12"):
-        import time
         status = tool_checker.get_all_tools_status()
-        time.sleep(0.7)
     console.print()
     available = sum(1 for v in status.values() if v)
     total = len(status)
@@ -148,6 +155,21 @@ def show_startup_info(tool_checker):
 
 def main():
     """Main application loop with enhanced error handling"""
+    global console, logger
+    # Import UI components
+    from ui.console import console as shared_console
+    from ui.menu import MainMenu
+    from ui.display import Display
+    # Import services
+    from services.single_converter import SingleFileConverter
+    from services.batch_converter import BatchFileConverter
+    from services.file_info import FileInfoService
+    # Import core components
+    from core.tool_checker import ToolChecker
+    from utils.logger import get_logger
+    # Initialize console and logger
+    console = shared_console
+    logger = get_logger()
     try:
         # Show splash screen
         show_splash_screen()
@@ -158,10 +180,11 @@ def main():
         # Initialize services
         logger.info("Initializing services...")
         try:
-            single_converter = SingleFileConverter()
-            batch_converter = BatchFileConverter()
-            file_info_service = FileInfoService()
+            # One ToolChecker shared by every service
             tool_checker = ToolChecker()
+            single_converter = SingleFileConverter(tool_checker=tool_checker)
+            batch_converter = BatchFileConverter(tool_checker=tool_checker)
+            file_info_service = FileInfoService(tool_checker=tool_checker)
             display = Display()
         except Exception as e:
             logger.error(f"Failed to initialize services: {e}")
@@ -173,13 +196,12 @@ def main():
         # Main application loop
         while True:
             try:
-                # پاکسازی قبل از هر عمل یا نمایش جدید (مهم برای جلوگیری هم‌افتادگی)
-                console.clear()
+                # MainMenu.show() clears the screen before drawing the menu
                 choice = MainMenu.show()
                 if choice is None:
                     continue
+                # The conversion and file-info services clear the screen themselves
                 elif choice == "Convert Single File":
-                    console.clear()
                     logger.info("User selected: Convert Single File")
                     try:
                         single_converter.run()
@@ -189,7 +211,6 @@ def main():
                         MainMenu.show_error(f"Conversion failed: {str(e)[:100]}")
                         MainMenu.pause()
                 elif choice == "Convert Multiple Files":
-                    console.clear()
                     logger.info("User selected: Convert Multiple Files")
                     try:
                         batch_converter.run()
@@ -199,7 +220,6 @@ def main():
                         MainMenu.show_error(f"Batch conversion failed: {str(e)[:100]}")
                         MainMenu.pause()
                 elif choice == "File Information":
-                    console.clear()
                     logger.info("User selected: File Information")
                     try:
                         file_info_service.run()
@@ -220,6 +240,19 @@ def main():
                         console.clear()
                         MainMenu.show_error(f"Could not check tools: {str(e)[:100]}")
                         MainMenu.pause()
+                elif choice == "Refresh Tools":
+                    console.clear()
+                    logger.info("User selected: Refresh Tools")
+                    try:
+                        with console.status("[bold yellow]🔍 Re-checking installed tools...[/bold yellow]", spinner="dots12"):
+                            status = tool_checker.get_all_tools_status(refresh=True)
+                        display.show_tools_status(status)
+                        MainMenu.pause()
+                    except Exception as e:
+                        logger.error(f"Error refreshing tools: {e}")
+                        console.clear()
+                        MainMenu.show_error(f"Could not check tools: {str(e)[:100]}")
+                        MainMenu.pause()
                 elif choice == "View Logs":
                     console.clear()
                     logger.info("User selected: View Logs")
@@ -234,20 +267,13 @@ def main():
                 elif choice == "Exit":
                     logger.info("Application closed by user")
                     console.clear()
-                    goodbye_text = Text()
-                    goodbye_text.append("\n\n")
-                    goodbye_text.append("Thank you for using\n", style="bold cyan")
-                    goodbye_text.append("Universal File Processor!\n\n", style="bold white")
-                    goodbye_text.append("👋 Goodbye!\n\n", style="bold yellow")
-                    console.print(Align.center(goodbye_text))
+                    console.print(_goodbye())
                     break
                 else:
                     logger.warning(f"Unknown menu choice: '{choice}'")
                     console.clear()
                     MainMenu.show_warning(f"Unknown option selected: '{choice}'")
                     MainMenu.pause()
-                # پاکسازی مجدد پس از هر اقدام و قبل از نمایش منوی جدید
-                console.clear()
             except KeyboardInterrupt:
                 if MainMenu.confirm("\nAre you sure you want to exit?", default=False):
                     logger.info("Application closed by user (Ctrl+C)")
@@ -292,20 +318,70 @@ Supported formats:
 
 For more info: [https://github.com/yourusername/universal-file-processor](https://github.com/yourusername/universal-file-processor)
 """
-    console.print(version_info)
+    print(version_info)
+
+def _env_option(flag, env_name):
+    """Move an integer command-line option in [1, 64] into the environment"""
+    if flag not in sys.argv:
+        return
+    i = sys.argv.index(flag)
+    value = sys.argv[i + 1] if i + 1 < len(sys.argv) else ''
+    if not value.isdigit() or not 1 <= int(value) <= 64:
+        print(f"{flag} requires an integer between 1 and 64")
+        sys.exit(2)
+    os.environ[env_name] = value
+    del sys.argv[i:i + 2]
+
+def _env_choice(flag, env_name, choices):
+    """Move a command-line option limited to choices (--flag X or --flag=X) into the environment"""
+    for i, arg in enumerate(sys.argv):
+        if arg == flag or arg.startswith(flag + '='):
+            break
+    else:
+        return
+    if '=' in sys.argv[i]:
+        value, end = sys.argv[i].split('=', 1)[1], i + 1
+    else:
+        value, end = (sys.argv[i + 1] if i + 1 < len(sys.argv) else ''), i + 2
+    if value not in choices:
+        print(f"{flag} must be one of: {', '.join(choices)}")
+        sys.exit(2)
+    os.environ[env_name] = value
+    del sys.argv[i:end]
 
 if __name__ == '__main__':
+    # Tuning flags are read by config.settings, which main() imports later
+    _env_option('--workers', 'UFP_WORKERS')
+    _env_option('--ffmpeg-threads-per-invocation', 'UFP_FFMPEG_THREADS_PER_INVOCATION')
+    _env_choice('--order', 'UFP_ORDER', ('smallest', 'largest', 'picked'))
+    if '--assume-default' in sys.argv:
+        os.environ['UFP_ASSUME_DEFAULT'] = '1'
+        sys.argv.remove('--assume-default')
+    if '--group-clips' in sys.argv:
+        os.environ['UFP_GROUP_CLIPS'] = '1'
+        sys.argv.remove('--group-clips')
     if len(sys.argv) > 1:
         if sys.argv[1] in ['--version', '-v']:
             show_version()
             sys.exit(0)
         elif sys.argv[1] in ['--help', '-h']:
-            console.print("""
+            print("""
 Usage: python main.py [OPTIONS]
 
 Options:
   -v, --version    Show version information
   -h, --help       Show this help message
+  --workers N      Files converted in parallel in batch mode
+                   (default: half the CPU cores, or $UFP_WORKERS)
+  --ffmpeg-threads-per-invocation N
+                   FFmpeg threads per batch conversion (default: CPU
+                   cores / workers, or $UFP_FFMPEG_THREADS_PER_INVOCATION)
+  --order ORDER    Batch conversion order: smallest (default), largest
+                   or picked (or $UFP_ORDER)
+  --assume-default Reuse the last output formats when a batch has a
+                   single file type (or $UFP_ASSUME_DEFAULT=1)
+  --group-clips    On NVENC hosts, convert numbered clips of one source
+                   in a shared FFmpeg process (or $UFP_GROUP_CLIPS=1)
        
 Run without arguments to start the interactive menu.
 """)
@@ -3,38 +3,311 @@
 """Batch file conversion service with enhanced UI and progress tracking"""
 
 from pathlib import Path
-import questionary
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+import os
+import re
+import shutil
 import time
-from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeRemainingColumn, MofNCompleteColumn
 from rich.text import Text
 
 from core.file_detector import FileDetector
 from core.tool_checker import ToolChecker
-from converters import ConverterFactory
 from ui.file_picker import FilePicker
 from ui.display import Display
-from ui.notifications import Notifications
-from config.settings import OUTPUT_DIR
+from ui.notifications import Notifications, AsyncNotifications, quiet_worker
+from ui.console import console
+from config.settings import (
+    OUTPUT_DIR, BATCH_WORKERS, FFMPEG_THREADS_PER_INVOCATION,
+    FILE_LIST_DISPLAY_LIMIT, FILE_LIST_STREAM_THRESHOLD, ASSUME_DEFAULT, BATCH_ORDER,
+    GROUP_CLIPS
+)
+from utils.cpu import effective_cpu_count
+from utils.humanize import humanize_bytes
+from utils.last_choices import last_formats, remember_formats
 from utils.logger import get_logger
 
-console = Console()
+# questionary, rich.progress, the converters and the process pool are
+# imported where they are used, so loading this service stays cheap
+if TYPE_CHECKING:
+    from converters.base_converter import BaseConverter
+
 logger = get_logger()
 
+# Files stat()ed per running-total update when streaming the batch size
+_SIZE_CHUNK = 100
+
+# Trailing clip number in a file name ("talk_012" -> source "talk")
+_CLIP_SUFFIX_RE = re.compile(r'[ _.-]*\d+$')
+
+# Clips of one source converted per FFmpeg process on NVENC hosts
+_CLIP_BATCH_SIZE = 16
+
+# Minimum seconds between progress description changes during a batch
+_DESCRIPTION_INTERVAL = 0.1
+
+
+def _file_size(path: str) -> Optional[int]:
+    """Size of a file in bytes, or None if it cannot be read"""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _prompt_style():
+    """Build the style shared by every batch prompt (once; questionary loads on first use)"""
+    import questionary
+    return questionary.Style([
+        ('qmark', 'fg:#00ff00 bold'),
+        ('question', 'fg:#00ffff bold'),
+        ('answer', 'fg:#00ff00 bold'),
+        ('pointer', 'fg:#00ffff bold'),
+        ('highlighted', 'fg:#00ffff bold'),
+    ])
+
+
+def _gather_sizes(files: List[str]) -> List[Optional[int]]:
+    """
+    Stat files concurrently (each stat is a round-trip on network mounts)
+    
+    Args:
+        files: File paths
+    
+    Returns:
+        Sizes in bytes in the same order as files (None if unreadable)
+    """
+    if not files:
+        return []
+    with ThreadPoolExecutor(max_workers=min(32, len(files))) as executor:
+        return list(executor.map(_file_size, files))
+
+
+def _plan_conversion(fp: Path, ftype: str, tool: str, out_dir: Path,
+                     format_config: Dict[str, List[str]],
+                     converters: Dict[str, Optional['BaseConverter']],
+                     tool_available: Dict[str, bool]
+                     ) -> Tuple[str, Optional[List[str]], Optional['BaseConverter']]:
+    """
+    Decide what the batch does with one file
+    
+    Args:
+        fp: Input file path
+        ftype: Detected file type
+        tool: Tool the file type needs
+        out_dir: Folder the outputs are written to
+        format_config: Maps file type to its list of output extensions
+        converters: Maps file type to its converter
+        tool_available: Maps tool name to availability
+    
+    Returns:
+        Tuple of (action, output_files, converter); action is one of
+        'skip-unknown', 'skip-tool', 'skip-fmt', 'no-converter' or
+        'convert', and output_files/converter are None unless converting
+    """
+    if ftype == 'unknown':
+        return 'skip-unknown', None, None
+    if not tool_available[tool]:
+        return 'skip-tool', None, None
+    output_exts = format_config.get(ftype)
+    if not output_exts:
+        return 'skip-fmt', None, None
+    converter = converters.get(ftype)
+    if not converter:
+        return 'no-converter', None, None
+    
+    # All outputs of one input go to a single job (one decode)
+    return 'convert', [os.fspath(out_dir / f"{fp.stem}.{ext}") for ext in output_exts], converter
+
+
+def _check_input(fp: Path) -> Tuple[Optional[int], Optional[str]]:
+    """Stat and access-check one input; returns (size, None) or (None, problem)"""
+    try:
+        size = os.stat(fp).st_size
+    except OSError as e:
+        return None, e.strerror or str(e)
+    if not os.access(fp, os.R_OK):
+        return None, "Not readable"
+    return size, None
+
+
+def _make_dir(directory: str) -> Optional[str]:
+    """Create an output directory; returns a problem description or None"""
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError as e:
+        return e.strerror or str(e)
+    return None
+
+
+def _preflight(jobs: List[Tuple[Path, List[str], 'BaseConverter']]
+               ) -> Tuple[List[Tuple[str, str]], Dict[Path, int]]:
+    """
+    Check planned batch jobs before any conversion starts
+    
+    Inputs are stat()ed and access-checked and output folders created
+    from a thread pool; then the expected output size (inputs x outputs,
+    plus 20%) is compared with the free space on the output disk.
+    
+    Args:
+        jobs: List of (input_path, output_files, converter) tuples
+    
+    Returns:
+        Tuple of (issues, sizes): issues are (file_name, problem) pairs,
+        with an empty name for a batch-wide problem (disk space); sizes
+        maps each readable input to its size in bytes
+    """
+    issues = []
+    sizes = {}
+    out_dirs = sorted({os.path.dirname(output_file) or '.' for _, output_files, _ in jobs
+                       for output_file in output_files})
+    
+    with ThreadPoolExecutor(max_workers=min(16, len(jobs) + len(out_dirs))) as executor:
+        dir_results = executor.map(_make_dir, out_dirs)
+        input_results = executor.map(_check_input, [fp for fp, _, _ in jobs])
+        
+        for (fp, _, _), (size, problem) in zip(jobs, input_results):
+            if problem:
+                issues.append((fp.name, problem))
+            else:
+                sizes[fp] = size
+        for directory, problem in zip(out_dirs, dir_results):
+            if problem:
+                issues.append(('', f"Cannot create {directory}: {problem}"))
+    
+    if not any(not name for name, _ in issues):
+        needed = int(sum(sizes.get(fp, 0) * len(output_files) for fp, output_files, _ in jobs) * 1.2)
+        free = shutil.disk_usage(out_dirs[0]).free
+        if needed > free:
+            issues.append(('', f"Needs about {humanize_bytes(needed)} of disk space, "
+                               f"only {humanize_bytes(free)} free"))
+    
+    return issues, sizes
+
+
+def _convert_outputs(converter: 'BaseConverter', input_file: str, output_files: List[str],
+                     settings: Dict[str, Any]) -> List[Tuple[bool, Optional[str]]]:
+    """
+    Convert one batch file to every requested format inside a worker process
+    
+    Converters with convert_multi_output (video) decode the input once for
+    all outputs; the others convert each output in turn.
+    
+    Args:
+        converter: Converter for the input's file type (pickled into the worker)
+        input_file: Path to input file
+        output_files: Output paths, one per requested format
+        settings: Conversion settings shared by all outputs
+    
+    Returns:
+        One-item list of (success: bool, error_message: Optional[str])
+    """
+    try:
+        if len(output_files) > 1 and hasattr(converter, 'convert_multi_output'):
+            return [converter.convert_multi_output(
+                input_file, [(output_file, settings) for output_file in output_files]
+            )]
+        for output_file in output_files:
+            success, error = converter.convert(input_file, output_file, settings)
+            if not success:
+                return [(False, error)]
+        return [(True, None)]
+    finally:
+        # Worker processes exit without running atexit handlers
+        AsyncNotifications.flush()
+
+
+def _convert_clips(converter: 'BaseConverter', input_files: List[str], output_files: List[str],
+                   settings: Dict[str, Any]) -> List[Tuple[bool, Optional[str]]]:
+    """
+    Convert a group of clips from one source inside a worker process
+    
+    If the shared FFmpeg process fails, each clip is converted on its own,
+    so one bad clip only fails itself.
+    
+    Returns:
+        List of (success: bool, error_message: Optional[str]), one per clip
+    """
+    try:
+        success, error = converter.convert_batch(input_files, output_files, settings)
+        if success:
+            return [(True, None)] * len(input_files)
+        logger.warning(f"Clip group failed ({error}), converting {len(input_files)} clips one by one")
+        return [
+            converter.convert(input_file, output_file, settings)
+            for input_file, output_file in zip(input_files, output_files)
+        ]
+    finally:
+        # Worker processes exit without running atexit handlers
+        AsyncNotifications.flush()
+
+
+def _build_tasks(jobs: List[Tuple[Path, List[str], 'BaseConverter']], settings: Dict[str, Any],
+                 group_clips: bool) -> List[Tuple[List[Path], Callable, tuple]]:
+    """
+    Turn planned jobs into process pool tasks
+    
+    With group_clips, single-output jobs for converters that have
+    convert_batch (video) and encode that output with NVENC are grouped by
+    source - same folder, same name once a trailing clip number is
+    removed, same output format - and each group of up to _CLIP_BATCH_SIZE
+    clips becomes one task. Other jobs gain nothing from a shared GPU
+    context and are converted per file.
+    
+    Args:
+        jobs: List of (input_path, output_files, converter) tuples
+        settings: Conversion settings shared by all jobs
+        group_clips: Group clips cut from the same source
+    
+    Returns:
+        List of (input_paths, worker, args) tuples; the worker is called
+        with (*args, settings) and returns one result per input path
+    """
+    tasks = []
+    groups = {}
+    for fp, output_files, converter in jobs:
+        if group_clips and len(output_files) == 1 and hasattr(converter, 'convert_batch'):
+            ext = os.path.splitext(output_files[0])[1].lower()
+            if converter._hw_encoder(settings, ext[1:]) == 'nvenc':
+                key = (fp.parent, _CLIP_SUFFIX_RE.sub('', fp.stem), ext)
+                groups.setdefault(key, []).append((fp, output_files[0], converter))
+                continue
+        tasks.append(([fp], _convert_outputs, (converter, os.fspath(fp), output_files)))
+    
+    for clips in groups.values():
+        for start in range(0, len(clips), _CLIP_BATCH_SIZE):
+            chunk = clips[start:start + _CLIP_BATCH_SIZE]
+            paths = [fp for fp, _, _ in chunk]
+            if len(chunk) == 1:
+                fp, output_file, converter = chunk[0]
+                tasks.append((paths, _convert_outputs, (converter, os.fspath(fp), [output_file])))
+            else:
+                tasks.append((paths, _convert_clips, (
+                    chunk[0][2],
+                    [os.fspath(fp) for fp in paths],
+                    [output_file for _, output_file, _ in chunk]
+                )))
+    return tasks
+
 
 class BatchFileConverter:
     """Handle batch file conversion workflow with beautiful UI"""
     
-    def __init__(self):
+    def __init__(self, tool_checker: Optional[ToolChecker] = None):
         self.detector = FileDetector()
-        self.tool_checker = ToolChecker()
+        self.tool_checker = tool_checker or ToolChecker()
         self.file_picker = FilePicker()
         self.display = Display()
     
     def run(self):
         """Run batch file conversion workflow"""
+        import questionary
+        from converters import ConverterFactory
+        
         try:
             console.clear()
             
@@ -60,6 +333,9 @@ class BatchFileConverter:
                 return
             
             logger.info(f"Selected {len(files)} files for batch conversion")
+            
+            # Build each Path and detect each file once; the helpers below reuse them
+            detected = [(fp, *self.detector.detect(os.fspath(fp))) for fp in map(Path, files)]
             console.clear()
             
             # Show selected files count
@@ -72,16 +348,13 @@ class BatchFileConverter:
             console.print()
             
             # Display file list
-            self._display_file_list(files)
+            self._display_file_list(detected)
             
             # Confirm selection
             if not questionary.confirm(
                 "\n▶️  Proceed with these files?",
                 default=True,
-                style=questionary.Style([
-                    ('question', 'fg:#00ffff bold'),
-                    ('answer', 'fg:#00ff00 bold'),
-                ])
+                style=_prompt_style()
             ).ask():
                 logger.info("Batch conversion cancelled by user")
                 console.print("\n[yellow]Conversion cancelled[/yellow]")
@@ -109,7 +382,8 @@ class BatchFileConverter:
                 'Low': 'Smallest size - 128k audio / CRF 28',
                 'Medium': 'Balanced - 192k audio / CRF 23 (Recommended)',
                 'High': 'Great quality - 256k audio / CRF 18',
-                'Ultra': 'Maximum quality - 320k audio / CRF 15'
+                'Ultra': 'Maximum quality - 320k audio / CRF 15',
+                'Original': 'Keep unchanged when the format matches - otherwise like High'
             }
             
             quality_choices = [
@@ -117,20 +391,14 @@ class BatchFileConverter:
                     title=f"{q} - {quality_descriptions[q]}",
                     value=q
                 )
-                for q in ['Low', 'Medium', 'High', 'Ultra']
+                for q in ['Low', 'Medium', 'High', 'Ultra', 'Original']
             ]
             
             quality = questionary.select(
                 "Select quality preset:",
                 choices=quality_choices,
                 default='Medium',
-                style=questionary.Style([
-                    ('qmark', 'fg:#00ff00 bold'),
-                    ('question', 'fg:#00ffff bold'),
-                    ('answer', 'fg:#00ff00 bold'),
-                    ('pointer', 'fg:#00ffff bold'),
-                    ('highlighted', 'fg:#00ffff bold'),
-                ])
+                style=_prompt_style()
             ).ask()
             
             if not quality:
@@ -139,7 +407,7 @@ class BatchFileConverter:
             
             # Step 4: Get format configuration
             console.print("\n[cyan]📋 Step 4: Configure Output Formats[/cyan]\n")
-            format_config = self._get_format_config(files)
+            format_config = self._get_format_config(detected)
             
             if not format_config:
                 self.display.show_warning(
@@ -158,22 +426,23 @@ class BatchFileConverter:
             if not questionary.confirm(
                 "\n🚀 Start batch conversion?",
                 default=True,
-                style=questionary.Style([
-                    ('question', 'fg:#00ffff bold'),
-                    ('answer', 'fg:#00ff00 bold'),
-                ])
+                style=_prompt_style()
             ).ask():
                 console.print("\n[yellow]Batch conversion cancelled[/yellow]")
                 input("\n[dim]Press Enter to continue...[/dim]")
                 return
             
+            # Resolve one converter per file type, not one per file
+            converters = {ftype: ConverterFactory.get_converter(ftype) for ftype in format_config}
+            
             # Perform batch conversion
             console.print("\n")
             success_count, failed_count = self._convert_batch(
-                files,
+                detected,
                 output_folder,
                 quality,
-                format_config
+                format_config,
+                converters
             )
             
             # Note: Batch completion notification is shown in _convert_batch
@@ -193,8 +462,8 @@ class BatchFileConverter:
             )
             input("\n[dim]Press Enter to continue...[/dim]")
     
-    def _display_file_list(self, files):
-        """Display list of selected files in a beautiful table"""
+    def _display_file_list(self, detected):
+        """Display list of selected files (as (Path, type, tool, icon, formats)) in a beautiful table"""
         
         # Create table
         table = Table(
@@ -208,30 +477,23 @@ class BatchFileConverter:
         table.add_column("Type", style="green", width=15)
         table.add_column("Size", style="cyan", width=12)
         
-        # Add files to table (show first 15)
-        display_limit = 15
+        display_limit = FILE_LIST_DISPLAY_LIMIT
+        paths = [f for f, *_ in detected]
+        
+        # Small batches: one stat pass, reused for the rows and the total.
+        # Large ones stat only the shown rows here and stream the total below.
+        streamed = len(paths) > FILE_LIST_STREAM_THRESHOLD
+        sizes = _gather_sizes(paths[:display_limit] if streamed else paths)
         
-        for idx, f in enumerate(files[:display_limit], 1):
-            ftype, tool, icon, _ = self.detector.detect(f)
-            name = Path(f).name
+        for idx, (f, ftype, tool, icon, _) in enumerate(detected[:display_limit], 1):
+            name = f.name
             
             # Truncate long names
             if len(name) > 45:
                 name = name[:42] + "..."
             
-            # Get file size
-            try:
-                size_bytes = Path(f).stat().st_size
-                if size_bytes < 1024:
-                    size = f"{size_bytes} B"
-                elif size_bytes < 1024 * 1024:
-                    size = f"{size_bytes / 1024:.1f} KB"
-                elif size_bytes < 1024 * 1024 * 1024:
-                    size = f"{size_bytes / (1024 * 1024):.1f} MB"
-                else:
-                    size = f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
-            except:
-                size = "N/A"
+            size_bytes = sizes[idx - 1]
+            size = humanize_bytes(size_bytes, 1) if size_bytes is not None else "N/A"
             
             table.add_row(
                 str(idx),
@@ -241,8 +503,8 @@ class BatchFileConverter:
             )
         
         # Add "more files" row if needed
-        if len(files) > display_limit:
-            remaining = len(files) - display_limit
+        if len(detected) > display_limit:
+            remaining = len(detected) - display_limit
             table.add_row(
                 "...",
                 f"[dim]+ {remaining} more file{'s' if remaining > 1 else ''}[/dim]",
@@ -253,16 +515,63 @@ class BatchFileConverter:
         console.print(table)
         
         # Show total size
-        try:
-            total_size = sum(Path(f).stat().st_size for f in files)
-            if total_size < 1024 * 1024 * 1024:
-                total_str = f"{total_size / (1024 * 1024):.2f} MB"
-            else:
-                total_str = f"{total_size / (1024 * 1024 * 1024):.2f} GB"
-            
-            console.print(f"\n[dim]Total size: {total_str}[/dim]")
-        except:
-            pass
+        if streamed:
+            total_size = self._stream_total_size(paths)
+        else:
+            total_size = sum(size for size in sizes if size is not None)
+        console.print(f"\n[dim]Total size: {humanize_bytes(total_size)}[/dim]")
+    
+    def _stream_total_size(self, files):
+        """
+        Sum file sizes in chunks, showing the running total as it grows
+        
+        Only one chunk of sizes is held at a time, so memory stays flat
+        however many files were selected.
+        
+        Args:
+            files: File paths
+        
+        Returns:
+            Total size in bytes of the readable files
+        """
+        from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, MofNCompleteColumn
+        
+        total_size = 0
+        with Progress(
+            SpinnerColumn(spinner_name="dots12", style="cyan"),
+            TextColumn("[dim]{task.description}"),
+            BarColumn(bar_width=30, style="cyan", complete_style="green"),
+            MofNCompleteColumn(),
+            console=console,
+            transient=True
+        ) as progress, ThreadPoolExecutor(max_workers=32) as executor:
+            task = progress.add_task("Total size: 0 B", total=len(files))
+            for start in range(0, len(files), _SIZE_CHUNK):
+                chunk = files[start:start + _SIZE_CHUNK]
+                total_size += sum(size for size in executor.map(_file_size, chunk) if size is not None)
+                progress.update(
+                    task,
+                    advance=len(chunk),
+                    description=f"Total size: {humanize_bytes(total_size)}"
+                )
+        return total_size
+    
+    def _show_preflight_issues(self, issues):
+        """Show the problems found by _preflight in a table"""
+        table = Table(
+            title="⚠️  Pre-flight Check",
+            show_header=True,
+            header_style="bold yellow",
+            title_style="bold yellow"
+        )
+        table.add_column("File", style="white", width=40)
+        table.add_column("Problem", style="red")
+        
+        for name, problem in issues:
+            table.add_row(name or "[bold](batch)[/bold]", problem)
+            logger.error(f"Pre-flight: {name or 'batch'} - {problem}")
+        
+        console.print(table)
     
     def _show_batch_summary(self, file_count, quality, format_config, output_folder):
         """Show batch conversion summary"""
@@ -275,10 +584,10 @@ class BatchFileConverter:
         summary_table.add_row("⚙️  Quality:", quality)
         
         # Show format configurations
-        for ftype, fmt in format_config.items():
+        for ftype, fmts in format_config.items():
             summary_table.add_row(
                 f"📝 {ftype.capitalize()} →",
-                fmt.upper()
+                ', '.join(fmt.upper() for fmt in fmts)
             )
         
         summary_table.add_row("📁 Output Folder:", output_folder)
@@ -292,15 +601,15 @@ class BatchFileConverter:
         
         console.print(panel)
     
-    def _get_format_config(self, files):
+    def _get_format_config(self, detected):
         """Get output format configuration for each file type"""
+        import questionary
         
         format_config = {}
         file_types_present = {}
         
         # Detect all file types
-        for fp in files:
-            ftype, tool, icon, formats = self.detector.detect(fp)
+        for _, ftype, tool, icon, formats in detected:
             if ftype not in file_types_present and ftype != 'unknown' and formats:
                 file_types_present[ftype] = (tool, icon, formats)
         
@@ -309,25 +618,31 @@ class BatchFileConverter:
         
         console.print(f"[dim]Found {len(file_types_present)} different file type(s)[/dim]\n")
         
+        # Single-type batch with --assume-default: reuse the last choice
+        if ASSUME_DEFAULT and len(file_types_present) == 1:
+            ftype, (_, _, formats) = next(iter(file_types_present.items()))
+            previous = last_formats(ftype)
+            if previous and set(previous) <= set(formats.values()):
+                logger.info(f"Using previous format choice for {ftype}: {', '.join(previous)}")
+                console.print(f"[cyan]Using previous choice: {', '.join(fmt.upper() for fmt in previous)}[/cyan]\n")
+                return {ftype: previous}
+        
         # Ask for format for each type
         for ftype, (tool, icon, formats) in file_types_present.items():
             if formats:
                 try:
-                    out_fmt = questionary.select(
+                    # Several formats per type are converted from a single decode
+                    out_fmts = questionary.checkbox(
                         f"{icon} {ftype.capitalize()} files → Convert to:",
                         choices=list(formats.keys()),
-                        style=questionary.Style([
-                            ('qmark', 'fg:#00ff00 bold'),
-                            ('question', 'fg:#00ffff bold'),
-                            ('answer', 'fg:#00ff00 bold'),
-                            ('pointer', 'fg:#00ffff bold'),
-                            ('highlighted', 'fg:#00ffff bold'),
-                        ])
+                        validate=lambda selected: bool(selected) or "Select at least one format",
+                        style=_prompt_style()
                     ).ask()
                     
-                    if out_fmt:
-                        format_config[ftype] = formats[out_fmt]
-                        console.print(f"[green]✓ {ftype.capitalize()}: {out_fmt}[/green]\n")
+                    if out_fmts:
+                        format_config[ftype] = [formats[fmt] for fmt in out_fmts]
+                        remember_formats(ftype, format_config[ftype])
+                        console.print(f"[green]✓ {ftype.capitalize()}: {', '.join(out_fmts)}[/green]\n")
                     else:
                         logger.info(f"Format selection cancelled for {ftype}")
                         return {}
@@ -337,25 +652,43 @@ class BatchFileConverter:
         
         return format_config
     
-    def _convert_batch(self, files, output_folder, quality, format_config):
+    def _convert_batch(self, detected, output_folder, quality, format_config, converters=None):
         """
         Convert batch of files with beautiful progress tracking
         
         Args:
-            files: List of file paths
+            detected: List of (Path, type, tool, icon, formats) tuples
             output_folder: Output directory
             quality: Quality preset
-            format_config: Format configuration dict
+            format_config: Maps file type to its list of output extensions
+            converters: Maps file type to its converter (resolved here if omitted)
         
         Returns:
             Tuple of (success_count, failed_count)
         """
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        from rich.progress import (
+            Progress, SpinnerColumn, BarColumn, TextColumn, TimeRemainingColumn, MofNCompleteColumn
+        )
+        from converters import ConverterFactory
+        
         success_count = 0
         failed_count = 0
         skipped_count = 0
         
-        # Start timing
-        start_time = time.time()
+        if converters is None:
+            converters = {ftype: ConverterFactory.get_converter(ftype) for ftype in format_config}
+        
+        out_dir = Path(output_folder)
+        
+        # Check each distinct tool once instead of once per file
+        tool_available = {
+            tool: self.tool_checker.is_available(tool)
+            for tool in {tool for _, ftype, tool, _, _ in detected if ftype != 'unknown'}
+        }
+        
+        # Start timing (monotonic, unaffected by clock adjustments)
+        start_ns = time.perf_counter_ns()
         
         # Create enhanced progress bar
         with Progress(
@@ -371,76 +704,133 @@ class BatchFileConverter:
             TextColumn("•", style="dim"),
             TimeRemainingColumn(),
             console=console,
-            transient=False
+            transient=False,
+            refresh_per_second=10
         ) as progress:
             
             task = progress.add_task(
-                f"[cyan]Converting {len(files)} files...",
-                total=len(files)
+                f"[cyan]Converting {len(detected)} files...",
+                total=len(detected)
             )
             
-            for idx, fp in enumerate(files, 1):
-                fp_path = Path(fp)
-                ftype, tool, icon, _ = self.detector.detect(str(fp))
-                
-                # Update progress description
-                progress.update(
-                    task,
-                    description=f"[cyan]Converting ({idx}/{len(files)}): {fp_path.name[:30]}..."
+            # Plan: skip what cannot be converted, queue the rest
+            jobs = []
+            for fp, ftype, tool, icon, _ in detected:
+                action, output_files, converter = _plan_conversion(
+                    fp, ftype, tool, out_dir, format_config, converters, tool_available
                 )
-                
-                # Skip if unknown type or tool not available
-                if ftype == 'unknown':
-                    logger.warning(f"Skipping unknown file type: {fp_path.name}")
-                    skipped_count += 1
-                    progress.update(task, advance=1)
-                    continue
-                
-                if not self.tool_checker.is_available(tool):
-                    logger.warning(f"Skipping {fp_path.name} - {tool} not installed")
-                    skipped_count += 1
-                    progress.update(task, advance=1)
+                if action == 'convert':
+                    jobs.append((fp, output_files, converter))
                     continue
                 
-                # Get output format
-                output_ext = format_config.get(ftype)
-                if not output_ext:
-                    logger.warning(f"No format configured for {ftype}: {fp_path.name}")
-                    skipped_count += 1
-                    progress.update(task, advance=1)
-                    continue
-                
-                output_file = str(Path(output_folder) / f"{fp_path.stem}.{output_ext}")
+                name = fp.name
+                if action == 'skip-unknown':
+                    logger.warning(f"Skipping unknown file type: {name}")
+                elif action == 'skip-tool':
+                    logger.warning(f"Skipping {name} - {tool} not installed")
+                elif action == 'skip-fmt':
+                    logger.warning(f"No format configured for {ftype}: {name}")
+                else:
+                    logger.error(f"No converter for {ftype}: {name}")
                 
-                # Get converter
-                converter = ConverterFactory.get_converter(ftype)
-                if not converter:
-                    logger.error(f"No converter for {ftype}: {fp_path.name}")
+                if action == 'no-converter':
                     failed_count += 1
-                    progress.update(task, advance=1)
-                    continue
-                
-                # Convert (notifications are suppressed during batch)
-                settings = {'quality': quality, 'batch_mode': True}
-                success, error = converter.convert(str(fp), output_file, settings)
-                
-                if success:
-                    success_count += 1
-                    logger.info(f"✓ Converted: {fp_path.name}")
                 else:
-                    failed_count += 1
-                    logger.error(f"✗ Failed: {fp_path.name} - {error[:100] if error else 'Unknown error'}")
-                
+                    skipped_count += 1
                 progress.update(task, advance=1)
+            
+            # Check inputs and disk space up front instead of failing mid-batch
+            issues, sizes = _preflight(jobs) if jobs else ([], {})
+            if issues:
+                self._show_preflight_issues(issues)
+                if any(not name for name, _ in issues):
+                    # Batch-wide problem (output folder, disk space): convert nothing
+                    failed_count += len(jobs)
+                    progress.update(task, advance=len(jobs))
+                    jobs = []
+                else:
+                    readable = [job for job in jobs if job[0] in sizes]
+                    failed_count += len(jobs) - len(readable)
+                    progress.update(task, advance=len(jobs) - len(readable))
+                    jobs = readable
+            
+            # Convert in parallel. Workers show no notifications (quiet_worker);
+            # the loop below reports each result above the progress bar.
+            # Each FFmpeg gets a share of the CPU: workers * threads ~= cpu_count
+            workers = min(BATCH_WORKERS, len(jobs))
+            ffmpeg_threads = FFMPEG_THREADS_PER_INVOCATION or max(1, effective_cpu_count() // max(1, workers))
+            settings = {'quality': quality, 'batch_mode': True, 'ffmpeg_threads': ffmpeg_threads}
+            
+            # Let video encodes use NVENC/VAAPI when the machine has it (probed once)
+            if 'video' in format_config:
+                settings['hwaccel'] = self.tool_checker.detect_hwaccel()
+            
+            # With --group-clips, clips cut from one source that are
+            # encoded with NVENC share an FFmpeg process
+            tasks = _build_tasks(jobs, settings, group_clips=GROUP_CLIPS)
+            
+            # Smallest first by default: short jobs finish early, so progress
+            # and ETA become accurate sooner and long encodes fill the tail
+            if BATCH_ORDER != 'picked' and len(tasks) > 1:
+                tasks.sort(
+                    key=lambda t: sum(sizes.get(fp) or 0 for fp in t[0]),
+                    reverse=BATCH_ORDER == 'largest'
+                )
+            
+            if tasks:
+                progress.update(
+                    task,
+                    description=f"[cyan]Converting {len(jobs)} file(s) with {workers} worker(s)..."
+                )
+                logger.info(
+                    f"Batch pool: {workers} worker(s), {ffmpeg_threads} FFmpeg thread(s) each"
+                )
+                with ProcessPoolExecutor(max_workers=workers, initializer=quiet_worker) as executor:
+                    futures = {
+                        executor.submit(worker, *args, settings): paths
+                        for paths, worker, args in tasks
+                    }
+                    last_description = 0.0
+                    for future in as_completed(futures):
+                        paths = futures[future]
+                        try:
+                            results = future.result()
+                        except Exception as e:
+                            results = [(False, str(e))] * len(paths)
+                        
+                        for fp, (success, error) in zip(paths, results):
+                            if success:
+                                success_count += 1
+                                logger.info(f"✓ Converted: {fp.name}")
+                            else:
+                                failed_count += 1
+                                reason = error[:100] if error else 'Unknown error'
+                                logger.error(f"✗ Failed: {fp.name} - {reason}")
+                                progress.console.print(Text.assemble(
+                                    ("✗ ", "bold red"), (fp.name, "white"), (f" - {reason}", "yellow")
+                                ))
+                        
+                        # Advance on every result; rename the task at most every 0.1s
+                        now = time.monotonic()
+                        if now - last_description >= _DESCRIPTION_INTERVAL:
+                            last_description = now
+                            progress.update(
+                                task,
+                                advance=len(paths),
+                                description=f"[cyan]Converted: {paths[-1].name[:30]}"
+                            )
+                        else:
+                            progress.update(task, advance=len(paths))
         
         # Calculate total duration
-        duration = time.time() - start_time
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
         
-        # Show batch completion notification
+        # Show batch completion notification after any queued per-file ones
+        AsyncNotifications.flush()
         Notifications.show_batch_complete(
             success_count,
             failed_count,
-            len(files),
+            len(detected),
             duration
         )
         
@@ -453,7 +843,8 @@ class BatchFileConverter:
         logger.info(
             f"Batch conversion complete: "
             f"{success_count} success, {failed_count} failed, "
-            f"{skipped_count} skipped out of {len(files)} total"
+            f"{skipped_count} skipped out of {len(detected)} total"
         )
         
         return success_count, failed_count
+
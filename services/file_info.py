@@ -2,28 +2,29 @@
 # -*- coding: utf-8 -*-
 """File information service with enhanced UI"""
 
-from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 from pathlib import Path
+from typing import Optional
 
 from core.file_detector import FileDetector
 from core.tool_checker import ToolChecker
 from ui.file_picker import FilePicker
 from ui.display import Display
+from ui.console import console
+from utils.humanize import humanize_bytes
 from utils.logger import get_logger
 
-console = Console()
 logger = get_logger()
 
 
 class FileInfoService:
     """Handle file information display with beautiful UI"""
     
-    def __init__(self):
+    def __init__(self, tool_checker: Optional[ToolChecker] = None):
         self.detector = FileDetector()
-        self.tool_checker = ToolChecker()
+        self.tool_checker = tool_checker or ToolChecker()
         self.file_picker = FilePicker()
         self.display = Display()
     
@@ -111,14 +112,9 @@ class FileInfoService:
         
         # File size with multiple units
         size_bytes = file_info['size_bytes']
-        if size_bytes < 1024:
-            size_display = f"{size_bytes} B"
-        elif size_bytes < 1024 * 1024:
-            size_display = f"{size_bytes / 1024:.2f} KB ({size_bytes:,} bytes)"
-        elif size_bytes < 1024 * 1024 * 1024:
-            size_display = f"{size_bytes / (1024 * 1024):.2f} MB ({size_bytes:,} bytes)"
-        else:
-            size_display = f"{size_bytes / (1024 * 1024 * 1024):.2f} GB ({size_bytes:,} bytes)"
+        size_display = humanize_bytes(size_bytes)
+        if size_bytes >= 1024:
+            size_display += f" ({size_bytes:,} bytes)"
         
         info_table.add_row("💾 File Size:", size_display)
         
@@ -2,37 +2,140 @@
 # -*- coding: utf-8 -*-
 """Single file conversion service with enhanced UI"""
 
+import os
 from pathlib import Path
-import questionary
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional
 
 from core.file_detector import FileDetector
 from core.tool_checker import ToolChecker
-from converters import ConverterFactory
 from ui.file_picker import FilePicker
 from ui.display import Display
-from ui.notifications import Notifications
+from ui.notifications import Notifications, AsyncNotifications
+from ui.console import console
 from config.settings import OUTPUT_DIR, VIDEO_RESOLUTIONS, VIDEO_FRAMERATES, IMAGE_RESIZE_OPTIONS
 from utils.logger import get_logger
 
-console = Console()
 logger = get_logger()
 
+# Prompt styles (questionary.Style specs, built once by _style())
+_PROMPT_STYLE = (
+    ('qmark', 'fg:#00ff00 bold'),
+    ('question', 'fg:#00ffff bold'),
+    ('answer', 'fg:#00ff00 bold'),
+    ('pointer', 'fg:#00ffff bold'),
+    ('highlighted', 'fg:#00ffff bold'),
+)
+_CONFIRM_STYLE = (
+    ('question', 'fg:#00ffff bold'),
+    ('answer', 'fg:#00ff00 bold'),
+)
+_OPTIONS_STYLE = (
+    ('question', 'fg:#00ffff'),
+    ('answer', 'fg:#00ff00 bold'),
+)
+_SUBPROMPT_STYLE = (
+    ('qmark', 'fg:#00ff00 bold'),
+    ('question', 'fg:#00ffff'),
+    ('pointer', 'fg:#00ffff bold'),
+    ('highlighted', 'fg:#00ffff bold'),
+)
+
+# Inputs above this size also have their first bytes read ahead of conversion
+_PREFETCH_READ_THRESHOLD = 16 * 1024 * 1024
+_PREFETCH_READ_BYTES = 1024 * 1024
+
+_QUALITY_DESCRIPTIONS = {
+    'Low': '128k audio / CRF 28 - Smallest size',
+    'Medium': '192k audio / CRF 23 - Balanced',
+    'High': '256k audio / CRF 18 - Great quality',
+    'Ultra': '320k audio / CRF 15 - Maximum quality',
+    'Original': 'Keep unchanged when the format matches - otherwise like High'
+}
+
+
+@lru_cache(maxsize=None)
+def _style(spec):
+    """Build a prompt style from a spec above (once; questionary loads on first use)"""
+    import questionary
+    return questionary.Style(list(spec))
+
+
+def _select(message: str, choices, default=None, style=_PROMPT_STYLE):
+    """
+    Ask a single-choice question
+    
+    Args:
+        message: Question text
+        choices: Sequence of choice values or questionary.Choice objects
+            (passed as is; questionary does not copy or reorder it)
+        default: Preselected value
+        style: Style spec (one of the tuples above)
+    
+    Returns:
+        Selected value, or None if cancelled
+    """
+    import questionary
+    return questionary.select(
+        message,
+        choices=choices,
+        default=default,
+        style=_style(style)
+    ).ask()
+
+
+@lru_cache(maxsize=1)
+def _io_pool() -> ThreadPoolExecutor:
+    """Single background thread for file-system work overlapped with prompts"""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix='ufp-io')
+
+
+def _prefetch(file_path: str, size_bytes: int) -> None:
+    """
+    Warm the page cache for an input file while the user answers prompts
+    
+    Args:
+        file_path: Input file
+        size_bytes: Its size; large files also get their first bytes read
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+            if size_bytes > _PREFETCH_READ_THRESHOLD:
+                f.read(_PREFETCH_READ_BYTES)
+    except OSError as e:
+        logger.debug(f"Prefetch skipped for {file_path}: {e}")
+
+
+@lru_cache(maxsize=1)
+def _quality_choices():
+    """Build the quality preset choices (once; reused by every run)"""
+    import questionary
+    return tuple(
+        questionary.Choice(title=f"{q} - {description}", value=q)
+        for q, description in _QUALITY_DESCRIPTIONS.items()
+    )
+
 
 class SingleFileConverter:
     """Handle single file conversion workflow with beautiful UI"""
     
-    def __init__(self):
+    def __init__(self, tool_checker: Optional[ToolChecker] = None):
         self.detector = FileDetector()
-        self.tool_checker = ToolChecker()
+        self.tool_checker = tool_checker or ToolChecker()
         self.file_picker = FilePicker()
         self.display = Display()
     
     def run(self):
         """Run single file conversion workflow"""
+        # Prompt and panel libraries are loaded on first use, not at startup
+        import questionary
+        from rich.console import Group
+        from rich.panel import Panel
+        from rich.text import Text
+        
         try:
             console.clear()
             
@@ -43,42 +146,61 @@ class SingleFileConverter:
                 border_style="cyan",
                 padding=(1, 2)
             )
-            console.print(header)
-            console.print()
+            # Each step's output is rendered in one print call
+            console.print(Group(
+                header,
+                Text(""),
+                Text.from_markup("[cyan]📂 Step 1: Select File[/cyan]"),
+                Text("")
+            ))
             
             # Pick file
-            console.print("[cyan]📂 Step 1: Select File[/cyan]\n")
             file_path = self.file_picker.pick_file()
             
             if not file_path:
                 console.print("\n[yellow]⚠️  No file selected[/yellow]")
-                input("\n[dim]Press Enter to continue...[/dim]")
+                self._pause()
                 return
             
+            # The tool follows from the extension alone, so check it in the
+            # background while the file itself is read (PIL for images)
+            tool_check = _io_pool().submit(
+                self.tool_checker.is_available, self.detector.detect(file_path)[1]
+            )
+            
             # Get file info
             file_info = self.detector.get_file_info(file_path)
             if not file_info:
                 self.display.show_error("Could not read file information!", "File Error")
-                input("\n[dim]Press Enter to continue...[/dim]")
+                self._pause()
                 return
             
             console.clear()
             
-            # Display file info in beautiful card
-            self._show_file_card(file_info)
+            # Build the file info card
+            file_card = self._build_file_card(file_info)
             
             # Check tool availability
-            if not self.tool_checker.is_available(file_info['tool']):
+            if not tool_check.result():
+                console.print(file_card)
                 self.display.show_error(
                     f"{file_info['tool']} is not installed!\n\n"
                     f"Please install {file_info['tool']} to convert this file type.",
                     "Tool Not Found"
                 )
-                input("\n[dim]Press Enter to continue...[/dim]")
+                self._pause()
                 return
             
+            # Start reading the input into the page cache during the prompts
+            _io_pool().submit(_prefetch, file_path, file_info['size_bytes'])
+            
             # Select format
-            console.print("\n[cyan]📋 Step 2: Choose Output Format[/cyan]\n")
+            console.print(Group(
+                file_card,
+                Text(""),
+                Text.from_markup("[cyan]📋 Step 2: Choose Output Format[/cyan]"),
+                Text("")
+            ))
             formats = file_info.get('formats', {})
             
             if not formats:
@@ -86,20 +208,10 @@ class SingleFileConverter:
                     "No conversion options available for this file type.",
                     "No Options"
                 )
-                input("\n[dim]Press Enter to continue...[/dim]")
+                self._pause()
                 return
             
-            output_format = questionary.select(
-                "Select output format:",
-                choices=list(formats.keys()),
-                style=questionary.Style([
-                    ('qmark', 'fg:#00ff00 bold'),
-                    ('question', 'fg:#00ffff bold'),
-                    ('answer', 'fg:#00ff00 bold'),
-                    ('pointer', 'fg:#00ffff bold'),
-                    ('highlighted', 'fg:#00ffff bold'),
-                ])
-            ).ask()
+            output_format = _select("Select output format:", list(formats))
             
             if not output_format:
                 logger.info("User cancelled format selection")
@@ -110,33 +222,7 @@ class SingleFileConverter:
             # Select quality
             console.print("\n[cyan]⚙️  Step 3: Choose Quality[/cyan]\n")
             
-            quality_descriptions = {
-                'Low': '128k audio / CRF 28 - Smallest size',
-                'Medium': '192k audio / CRF 23 - Balanced',
-                'High': '256k audio / CRF 18 - Great quality',
-                'Ultra': '320k audio / CRF 15 - Maximum quality'
-            }
-            
-            quality_choices = [
-                questionary.Choice(
-                    title=f"{q} - {quality_descriptions[q]}",
-                    value=q
-                )
-                for q in ['Low', 'Medium', 'High', 'Ultra']
-            ]
-            
-            quality = questionary.select(
-                "Select quality preset:",
-                choices=quality_choices,
-                default='Medium',
-                style=questionary.Style([
-                    ('qmark', 'fg:#00ff00 bold'),
-                    ('question', 'fg:#00ffff bold'),
-                    ('answer', 'fg:#00ff00 bold'),
-                    ('pointer', 'fg:#00ffff bold'),
-                    ('highlighted', 'fg:#00ffff bold'),
-                ])
-            ).ask()
+            quality = _select("Select quality preset:", _quality_choices(), default='Medium')
             
             if not quality:
                 logger.info("User cancelled quality selection")
@@ -159,32 +245,38 @@ class SingleFileConverter:
                 output_folder = str(OUTPUT_DIR)
                 console.print(f"[dim]Using default output folder: {output_folder}[/dim]\n")
             
-            Path(output_folder).mkdir(exist_ok=True, parents=True)
-            output_file = str(Path(output_folder) / f"{Path(file_path).stem}.{output_ext}")
+            # Create the folder in the background while the summary and the
+            # confirm prompt are shown (slow on network file systems)
+            pending_mkdir = _io_pool().submit(
+                Path(output_folder).mkdir, exist_ok=True, parents=True
+            )
+            stem = os.path.splitext(os.path.basename(file_path))[0]
+            output_file = os.path.join(output_folder, f"{stem}.{output_ext}")
             
             # Show conversion summary
-            self._show_conversion_summary(
-                file_info,
-                output_format,
-                quality,
-                settings,
-                output_folder
-            )
+            console.print(Group(
+                Text("\n"),
+                self._build_conversion_summary(
+                    file_info,
+                    output_format,
+                    quality,
+                    settings,
+                    output_folder
+                )
+            ))
             
             # Confirm conversion
             if not questionary.confirm(
                 "\n▶️  Start conversion?",
                 default=True,
-                style=questionary.Style([
-                    ('question', 'fg:#00ffff bold'),
-                    ('answer', 'fg:#00ff00 bold'),
-                ])
+                style=_style(_CONFIRM_STYLE)
             ).ask():
                 console.print("\n[yellow]Conversion cancelled[/yellow]")
-                input("\n[dim]Press Enter to continue...[/dim]")
+                self._pause()
                 return
             
-            # Perform conversion
+            # Perform conversion (mkdir errors surface here)
+            pending_mkdir.result()
             console.print("\n")
             success = self._convert_file(file_path, output_file, file_info['type'], settings)
             
@@ -194,12 +286,12 @@ class SingleFileConverter:
             if not success:
                 logger.error("Conversion failed")
             
-            input("\n[dim]Press Enter to continue...[/dim]")
+            self._pause()
             
         except KeyboardInterrupt:
             logger.info("Conversion cancelled by user (Ctrl+C)")
             console.print("\n\n[yellow]⚠️  Conversion cancelled[/yellow]")
-            input("\n[dim]Press Enter to continue...[/dim]")
+            self._pause()
             
         except Exception as e:
             logger.error(f"Single file conversion error: {e}", exc_info=True)
@@ -207,76 +299,89 @@ class SingleFileConverter:
                 f"An unexpected error occurred:\n{str(e)[:200]}",
                 "Conversion Error"
             )
-            input("\n[dim]Press Enter to continue...[/dim]")
+            self._pause()
+    
+    def _pause(self):
+        """Wait for Enter on the shared console (the prompt's markup is rendered)"""
+        console.print()
+        try:
+            console.input("[dim]Press Enter to continue...[/dim]")
+        except (KeyboardInterrupt, EOFError):
+            console.print()
     
-    def _show_file_card(self, file_info: dict):
-        """Display beautiful file information card"""
+    def _build_file_card(self, file_info: dict):
+        """Build beautiful file information card"""
+        from rich.panel import Panel
+        from rich.table import Table
         
         # Create file info table
         info_table = Table(show_header=False, box=None, padding=(0, 2))
         info_table.add_column(style="cyan bold", width=15)
         info_table.add_column(style="white")
         
-        info_table.add_row("📄 Name:", file_info['name'])
-        info_table.add_row(
-            f"{file_info['icon']} Type:",
-            file_info['type'].capitalize()
-        )
-        info_table.add_row("💾 Size:", f"{file_info['size_mb']:.2f} MB")
-        info_table.add_row("🛠️  Tool:", file_info['tool'])
+        rows = [
+            ("📄 Name:", file_info['name']),
+            (f"{file_info['icon']} Type:", file_info['type'].capitalize()),
+            ("💾 Size:", f"{file_info['size_mb']:.2f} MB"),
+            ("🛠️  Tool:", file_info['tool']),
+        ]
         
         # Add image-specific info
         if 'width' in file_info and 'height' in file_info:
-            info_table.add_row(
-                "📐 Resolution:",
-                f"{file_info['width']}x{file_info['height']}"
-            )
             megapixels = (file_info['width'] * file_info['height']) / 1_000_000
-            info_table.add_row("📊 Megapixels:", f"{megapixels:.2f} MP")
+            rows.append(("📐 Resolution:", f"{file_info['width']}x{file_info['height']}"))
+            rows.append(("📊 Megapixels:", f"{megapixels:.2f} MP"))
+        
+        for row in rows:
+            info_table.add_row(*row)
         
         # Create panel
-        panel = Panel(
+        return Panel(
             info_table,
             title="[bold cyan]📋 File Information[/bold cyan]",
             border_style="cyan",
             padding=(1, 2)
         )
-        
-        console.print(panel)
     
-    def _show_conversion_summary(self, file_info, output_format, quality, settings, output_folder):
-        """Show conversion summary before starting"""
+    def _build_conversion_summary(self, file_info, output_format, quality, settings, output_folder):
+        """Build conversion summary shown before starting"""
+        from rich.panel import Panel
+        from rich.table import Table
         
         summary_table = Table(show_header=False, box=None, padding=(0, 2))
         summary_table.add_column(style="cyan bold", width=18)
         summary_table.add_column(style="white")
         
-        summary_table.add_row("📥 Input:", file_info['name'])
-        summary_table.add_row("📤 Output Format:", output_format)
-        summary_table.add_row("⚙️  Quality:", quality)
+        rows = [
+            ("📥 Input:", file_info['name']),
+            ("📤 Output Format:", output_format),
+            ("⚙️  Quality:", quality),
+        ]
         
         # Add advanced settings if any
         if settings.get('resolution'):
-            summary_table.add_row("📐 Resolution:", settings['resolution'])
+            rows.append(("📐 Resolution:", settings['resolution']))
         if settings.get('fps'):
-            summary_table.add_row("🎞️  Frame Rate:", f"{settings['fps']} fps")
+            rows.append(("🎞️  Frame Rate:", f"{settings['fps']} fps"))
         if settings.get('resize'):
-            summary_table.add_row("🖼️  Resize:", settings['resize'])
+            rows.append(("🖼️  Resize:", settings['resize']))
+        
+        rows.append(("📁 Output Folder:", output_folder))
         
-        summary_table.add_row("📁 Output Folder:", output_folder)
+        for row in rows:
+            summary_table.add_row(*row)
         
-        panel = Panel(
+        return Panel(
             summary_table,
             title="[bold yellow]📊 Conversion Summary[/bold yellow]",
             border_style="yellow",
             padding=(1, 2)
         )
-        
-        console.print("\n")
-        console.print(panel)
     
     def _get_advanced_settings(self, file_type: str) -> dict:
         """Get advanced settings based on file type"""
+        import questionary
+        
         settings = {}
         
         try:
@@ -284,42 +389,19 @@ class SingleFileConverter:
                 if questionary.confirm(
                     "Configure advanced video options?",
                     default=False,
-                    style=questionary.Style([
-                        ('question', 'fg:#00ffff'),
-                        ('answer', 'fg:#00ff00 bold'),
-                    ])
+                    style=_style(_OPTIONS_STYLE)
                 ).ask():
                     
                     console.print("\n[dim]Advanced Video Options:[/dim]\n")
                     
                     # Resolution
-                    resolution = questionary.select(
-                        "Resolution:",
-                        choices=VIDEO_RESOLUTIONS,
-                        default='Original',
-                        style=questionary.Style([
-                            ('qmark', 'fg:#00ff00 bold'),
-                            ('question', 'fg:#00ffff'),
-                            ('pointer', 'fg:#00ffff bold'),
-                            ('highlighted', 'fg:#00ffff bold'),
-                        ])
-                    ).ask()
+                    resolution = _select("Resolution:", VIDEO_RESOLUTIONS, default='Original', style=_SUBPROMPT_STYLE)
                     
                     if resolution and resolution != 'Original':
                         settings['resolution'] = resolution
                     
                     # Frame rate
-                    fps = questionary.select(
-                        "Frame rate:",
-                        choices=VIDEO_FRAMERATES,
-                        default='Original',
-                        style=questionary.Style([
-                            ('qmark', 'fg:#00ff00 bold'),
-                            ('question', 'fg:#00ffff'),
-                            ('pointer', 'fg:#00ffff bold'),
-                            ('highlighted', 'fg:#00ffff bold'),
-                        ])
-                    ).ask()
+                    fps = _select("Frame rate:", VIDEO_FRAMERATES, default='Original', style=_SUBPROMPT_STYLE)
                     
                     if fps and fps != 'Original':
                         settings['fps'] = fps
@@ -328,26 +410,13 @@ class SingleFileConverter:
                 if questionary.confirm(
                     "Configure advanced image options?",
                     default=False,
-                    style=questionary.Style([
-                        ('question', 'fg:#00ffff'),
-                        ('answer', 'fg:#00ff00 bold'),
-                    ])
+                    style=_style(_OPTIONS_STYLE)
                 ).ask():
                     
                     console.print("\n[dim]Advanced Image Options:[/dim]\n")
                     
                     # Resize
-                    resize = questionary.select(
-                        "Resize:",
-                        choices=IMAGE_RESIZE_OPTIONS,
-                        default='Original',
-                        style=questionary.Style([
-                            ('qmark', 'fg:#00ff00 bold'),
-                            ('question', 'fg:#00ffff'),
-                            ('pointer', 'fg:#00ffff bold'),
-                            ('highlighted', 'fg:#00ffff bold'),
-                        ])
-                    ).ask()
+                    resize = _select("Resize:", IMAGE_RESIZE_OPTIONS, default='Original', style=_SUBPROMPT_STYLE)
                     
                     if resize and resize != 'Original':
                         settings['resize'] = resize
@@ -371,6 +440,8 @@ class SingleFileConverter:
         Returns:
             True if conversion successful, False otherwise
         """
+        from converters import ConverterFactory
+        
         # Get converter
         converter = ConverterFactory.get_converter(file_type)
         
@@ -383,12 +454,15 @@ class SingleFileConverter:
             return False
         
         # Log conversion start
-        logger.info(f"Starting conversion: {Path(input_file).name} -> {Path(output_file).name}")
+        logger.info(
+            f"Starting conversion: {os.path.basename(input_file)} -> {os.path.basename(output_file)}"
+        )
         logger.debug(f"Settings: {settings}")
         
         # Perform conversion
         # Note: Notifications are shown inside the converter
         success, error = converter.convert(input_file, output_file, settings)
+        AsyncNotifications.flush()
         
         # Log result
         if success:
@@ -2,24 +2,24 @@
 # -*- coding: utf-8 -*-
 """Beautiful ASCII art banner"""
 
-from rich.console import Console
 from rich.panel import Panel
+from rich.table import Table
 from rich.text import Text
+from ui.console import console
 
-console = Console()
 
 BANNER = """
 ╔══════════════════════════════════════════════════════════════╗
 ║                                                              ║
-║   ██╗   ██╗███████╗██████╗                                  ║
-║   ██║   ██║██╔════╝██╔══██╗                                 ║
-║   ██║   ██║█████╗  ██████╔╝                                 ║
-║   ██║   ██║██╔══╝  ██╔═══╝                                  ║
-║   ╚██████╔╝██║     ██║                                      ║
-║    ╚═════╝ ╚═╝     ╚═╝                                      ║
+║   ██╗   ██╗███████╗██████╗                                   ║
+║   ██║   ██║██╔════╝██╔══██╗                                  ║
+║   ██║   ██║█████╗  ██████╔╝                                  ║
+║   ██║   ██║██╔══╝  ██╔═══╝                                   ║
+║   ╚██████╔╝██║     ██║                                       ║
+║    ╚═════╝ ╚═╝     ╚═╝                                       ║
 ║                                                              ║
-║        Universal File Processor Pro v2.0                    ║
-║        Professional Modular Conversion Tool                 ║
+║        Universal File Processor Pro v2.0                     ║
+║        Professional Modular Conversion Tool                  ║
 ║                                                              ║
 ╚══════════════════════════════════════════════════════════════╝
 """
@@ -34,42 +34,36 @@ GRADIENT_BANNER = r"""
            🎬 Video  🎵 Audio  🖼️ Image  📝 Document
 """
 
+# The banner and welcome table are static, so they are built once at import
+_BANNER_COLORS = ["cyan", "blue", "magenta", "cyan"]
+
+_banner_text = Text()
+for _i, _line in enumerate(GRADIENT_BANNER.split('\n')):
+    _banner_text.append(_line + '\n', style=f"bold {_BANNER_COLORS[_i % len(_BANNER_COLORS)]}")
+
+_CACHED_BANNER_PANEL = Panel(
+    _banner_text,
+    border_style="bold cyan",
+    padding=(1, 2)
+)
+
+_CACHED_WELCOME_TABLE = Table(show_header=False, box=None, padding=(0, 2))
+_CACHED_WELCOME_TABLE.add_column(style="cyan bold")
+_CACHED_WELCOME_TABLE.add_column(style="white")
+_CACHED_WELCOME_TABLE.add_row("🎬 Video", "MP4, AVI, MKV, WebM, MOV")
+_CACHED_WELCOME_TABLE.add_row("🎵 Audio", "MP3, WAV, FLAC, AAC, OGG")
+_CACHED_WELCOME_TABLE.add_row("🖼️  Image", "PNG, JPG, GIF, WebP, BMP")
+_CACHED_WELCOME_TABLE.add_row("📝 Document", "PDF, HTML, DOCX, Markdown")
+_CACHED_WELCOME_TABLE.add_row("📊 Office", "Excel, PowerPoint, Word → PDF")
+_CACHED_WELCOME_TABLE.add_row("📚 Ebook", "EPUB, MOBI, AZW3, PDF")
+
 def show_banner():
     """Display animated banner"""
     console.clear()
-    
-    # Gradient colors
-    colors = ["cyan", "blue", "magenta", "cyan"]
-    
-    # Animated text
-    text = Text()
-    lines = GRADIENT_BANNER.split('\n')
-    
-    for i, line in enumerate(lines):
-        color = colors[i % len(colors)]
-        text.append(line + '\n', style=f"bold {color}")
-    
-    console.print(Panel(
-        text,
-        border_style="bold cyan",
-        padding=(1, 2)
-    ))
+    console.print(_CACHED_BANNER_PANEL)
 
 def show_welcome():
     """Show welcome message with stats"""
-    from rich.table import Table
-    
-    table = Table(show_header=False, box=None, padding=(0, 2))
-    table.add_column(style="cyan bold")
-    table.add_column(style="white")
-    
-    table.add_row("🎬 Video", "MP4, AVI, MKV, WebM, MOV")
-    table.add_row("🎵 Audio", "MP3, WAV, FLAC, AAC, OGG")
-    table.add_row("🖼️  Image", "PNG, JPG, GIF, WebP, BMP")
-    table.add_row("📝 Document", "PDF, HTML, DOCX, Markdown")
-    table.add_row("📊 Office", "Excel, PowerPoint, Word → PDF")
-    table.add_row("📚 Ebook", "EPUB, MOBI, AZW3, PDF")
-    
     console.print("\n")
-    console.print(table)
+    console.print(_CACHED_WELCOME_TABLE)
     console.print("\n")
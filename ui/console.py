@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Process-wide Rich console shared by the UI and the services"""
+
+import sys
+from rich.console import Console, Group, RenderableType
+from rich.text import Text
+
+console = Console(force_terminal=sys.stdout.isatty() or None)
+
+# Spacer around print_spaced() output (same layout as the former
+# console.print("\n", panel, "\n") calls)
+_GAP = Text("\n")
+
+
+def print_spaced(renderable: RenderableType) -> None:
+    """
+    Print a renderable framed by blank lines in one console.print call
+    
+    Args:
+        renderable: Panel or other Rich renderable
+    """
+    console.print(Group(_GAP, renderable, _GAP))
@@ -4,18 +4,127 @@
 
 from __future__ import annotations
 
-from rich.console import Console
+from rich.console import Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.columns import Columns
 from rich.text import Text
 from rich import box
+import os
+import re
 from pathlib import Path
 from typing import Dict, List
 from datetime import datetime
 from config.settings import LOG_DIR
+from ui.console import console, print_spaced
+from utils.humanize import humanize_bytes
+from utils.logger import flush_logs
+
+
+# Log viewer: label, label style and message style per log level
+_LOG_LEVELS = {
+    'ERROR': ("ERROR", "bold red", "red"),
+    'WARNING': ("WARN", "bold yellow", "yellow"),
+    'INFO': ("INFO", "bold green", "white"),
+    'DEBUG': ("DEBUG", "dim cyan", "dim cyan"),
+}
+
+# Log viewer columns: time and level are fixed width, so rows are padded
+# here rather than measured by a Table. Messages fold at _LOG_MSG_WIDTH,
+# continuing under the message column.
+_LOG_TIME_WIDTH = 19
+_LOG_LEVEL_WIDTH = 8
+_LOG_MSG_WIDTH = 80
+_LOG_INDENT = "\n" + " " * (_LOG_TIME_WIDTH + _LOG_LEVEL_WIDTH + 2)
+_LOG_HEADER = Text(
+    f"{'Time':<{_LOG_TIME_WIDTH}} {'Level':<{_LOG_LEVEL_WIDTH}} Message",
+    style="bold cyan"
+)
+
+# One log record: "<asctime> - <logger name> - <level> - <message>"
+# (the format set up in utils/logger.py)
+_LOG_RE = re.compile(r'(.{19}) - \S+ - (\w+) - (.*)')
+
+# Banner lines the logger writes at startup
+_LOG_SEPARATOR = '=' * 10
+
+# Bytes read from the end of the log file to find the last 40 lines
+_LOG_TAIL_BYTES = 16384
+
+
+# Latest log file found by _latest_log(), keyed by LOG_DIR's mtime
+_latest_log_cache = {'dir_mtime': None, 'latest': None}
+
+
+def _latest_log():
+    """
+    Find the most recently modified processor log
+
+    The directory is only re-scanned (one stat per log file) when its own
+    mtime changes, i.e. when a log file was added or removed.
+
+    Returns:
+        Path of the latest log, or None if there are none
+    """
+    try:
+        dir_mtime = LOG_DIR.stat().st_mtime_ns
+    except OSError:
+        return None
+    if dir_mtime == _latest_log_cache['dir_mtime']:
+        return _latest_log_cache['latest']
+
+    try:
+        with os.scandir(LOG_DIR) as it:
+            entries = [
+                e for e in it
+                if e.name.startswith('processor_') and e.name.endswith('.log')
+            ]
+        latest = Path(max(entries, key=lambda e: e.stat().st_mtime).path) if entries else None
+    except OSError:
+        return None
+    _latest_log_cache['dir_mtime'] = dir_mtime
+    _latest_log_cache['latest'] = latest
+    return latest
+
+
+# Pause prompt shown under each Display screen (printed, never modified)
+_PROMPT_TEXT = Text("Press Enter to continue...", style="dim")
+
+
+# Tool cards shown by show_tools_status (static)
+_TOOLS_INFO = {
+    'FFmpeg': {
+        'icon': '🎬',
+        'name': 'FFmpeg',
+        'desc': 'Video & Audio\nconversion',
+        'formats': 'MP4, AVI, MKV\nMP3, WAV, FLAC'
+    },
+    'PIL/ImageMagick': {
+        'icon': '🖼️',
+        'name': 'PIL/Pillow',
+        'desc': 'Image processing\n& conversion',
+        'formats': 'PNG, JPG, GIF\nWebP, BMP'
+    },
+    'Pandoc': {
+        'icon': '📝',
+        'name': 'Pandoc',
+        'desc': 'Document\nconversion',
+        'formats': 'PDF, HTML\nDOCX, MD'
+    },
+    'LibreOffice': {
+        'icon': '📊',
+        'name': 'LibreOffice',
+        'desc': 'Office file\nconversion',
+        'formats': 'XLSX, DOCX\nPPTX → PDF'
+    },
+    'Calibre': {
+        'icon': '📚',
+        'name': 'Calibre',
+        'desc': 'Ebook\nconversion',
+        'formats': 'EPUB, MOBI\nAZW3, PDF'
+    },
+}
 
-console = Console()
 
 # -------- Helpers --------
 def ellipsis(s: str, max_len: int = 80) -> str:
@@ -27,52 +136,36 @@ class Display:
     @staticmethod
     def show_file_info(file_info: Dict):
         """Display file information as beautiful card"""
-        console.clear()
-        console.print()
-
-        # Create info text
-        info_text = Text()
-
-        # File icon and name
-        info_text.append("📄 ", style="bold yellow")
-        info_text.append(ellipsis(file_info.get('name', 'Unknown'), 60) + "\n\n", style="bold white")
-
-        # Type
-        info_text.append("Type:       ", style="cyan bold")
-        info_text.append(f"{file_info.get('icon','')} {file_info.get('type','').capitalize()}\n", style="white")
-
-        # Size
-        info_text.append("Size:       ", style="cyan bold")
-        size_mb = file_info.get('size_mb', 0.0)
-        if size_mb < 1:
-            size_text = f"{size_mb * 1024:.2f} KB"
-        elif size_mb > 1024:
-            size_text = f"{size_mb / 1024:.2f} GB"
-        else:
-            size_text = f"{size_mb:.2f} MB"
-        info_text.append(f"{size_text}\n", style="white")
-
-        # Tool
-        info_text.append("Tool:       ", style="cyan bold")
-        info_text.append(f"{file_info.get('tool','')}\n", style="white")
-
-        # Path
-        info_text.append("Path:       ", style="cyan bold")
-        info_text.append(ellipsis(file_info.get('path', 'N/A'), 90) + "\n", style="dim white")
+        size_bytes = file_info.get('size_bytes', int(file_info.get('size_mb', 0.0) * 1048576))
+
+        # Create info text (plain Text parts: names with brackets are shown as written)
+        parts = [
+            ("📄 ", "bold yellow"),
+            (ellipsis(file_info.get('name', 'Unknown'), 60) + "\n\n", "bold white"),
+            ("Type:       ", "cyan bold"),
+            (f"{file_info.get('icon','')} {file_info.get('type','').capitalize()}\n", "white"),
+            ("Size:       ", "cyan bold"),
+            (f"{humanize_bytes(size_bytes)}\n", "white"),
+            ("Tool:       ", "cyan bold"),
+            (f"{file_info.get('tool','')}\n", "white"),
+            ("Path:       ", "cyan bold"),
+            (ellipsis(file_info.get('path', 'N/A'), 90) + "\n", "dim white"),
+        ]
 
         # Image-specific info
         if 'width' in file_info and 'height' in file_info:
-            info_text.append("\n")
-            info_text.append("Resolution: ", style="cyan bold")
-            info_text.append(f"{file_info['width']}x{file_info['height']}\n", style="white")
-
-            info_text.append("Mode:       ", style="cyan bold")
-            info_text.append(f"{file_info.get('mode', 'N/A')}\n", style="white")
-
-            # Calculate megapixels
             megapixels = (file_info['width'] * file_info['height']) / 1_000_000
-            info_text.append("Megapixels: ", style="cyan bold")
-            info_text.append(f"{megapixels:.2f} MP\n", style="white")
+            parts += [
+                "\n",
+                ("Resolution: ", "cyan bold"),
+                (f"{file_info['width']}x{file_info['height']}\n", "white"),
+                ("Mode:       ", "cyan bold"),
+                (f"{file_info.get('mode', 'N/A')}\n", "white"),
+                ("Megapixels: ", "cyan bold"),
+                (f"{megapixels:.2f} MP\n", "white"),
+            ]
+
+        info_text = Text.assemble(*parts)
 
         # Create panel (padding کم برای جلوگیری از wrap)
         panel = Panel(
@@ -83,11 +176,12 @@ class Display:
             expand=False
         )
 
-        console.print(panel)
-        console.print()
-
-        # توقف استاندارد (بدون چاپ markup خام)
-        console.print(Text("Press Enter to continue...", style="dim"), end="")
+        # Clear, card and prompt go to the terminal in one write
+        with console:
+            console.clear()
+            console.print(Group(Text(""), panel, Text("")))
+            # توقف استاندارد (بدون چاپ markup خام)
+            console.print(_PROMPT_TEXT, end="")
         try:
             input()
         except KeyboardInterrupt:
@@ -96,67 +190,32 @@ class Display:
     @staticmethod
     def show_tools_status(status: Dict[str, bool]):
         """Display tools status as beautiful cards"""
-        console.clear()
-        console.print()
-
         # Title
         title = Text()
         title.append("🛠️  ", style="bold yellow")
         title.append("Installed Tools Status", style="bold cyan")
-        console.print(title)
-        console.print()
 
         # Create cards for each tool
         cards: List[Panel] = []
 
-        tools_info = {
-            'FFmpeg': {
-                'icon': '🎬',
-                'name': 'FFmpeg',
-                'desc': 'Video & Audio\nconversion',
-                'formats': 'MP4, AVI, MKV\nMP3, WAV, FLAC'
-            },
-            'PIL/ImageMagick': {
-                'icon': '🖼️',
-                'name': 'PIL/Pillow',
-                'desc': 'Image processing\n& conversion',
-                'formats': 'PNG, JPG, GIF\nWebP, BMP'
-            },
-            'Pandoc': {
-                'icon': '📝',
-                'name': 'Pandoc',
-                'desc': 'Document\nconversion',
-                'formats': 'PDF, HTML\nDOCX, MD'
-            },
-            'LibreOffice': {
-                'icon': '📊',
-                'name': 'LibreOffice',
-                'desc': 'Office file\nconversion',
-                'formats': 'XLSX, DOCX\nPPTX → PDF'
-            },
-            'Calibre': {
-                'icon': '📚',
-                'name': 'Calibre',
-                'desc': 'Ebook\nconversion',
-                'formats': 'EPUB, MOBI\nAZW3, PDF'
-            },
-        }
-
-        for tool_key, info in tools_info.items():
+        for tool_key, info in _TOOLS_INFO.items():
             is_available = status.get(tool_key, False)
 
-            card_text = Text()
-            card_text.append(f"{info['icon']}\n", style="bold")
-
             if is_available:
-                card_text.append(f"✓ {info['name']}\n", style="bold green")
-                card_text.append(f"{info['desc']}\n", style="dim white")
-                card_text.append(f"\n{info['formats']}", style="dim cyan")
+                card_text = Text.assemble(
+                    (f"{info['icon']}\n", "bold"),
+                    (f"✓ {info['name']}\n", "bold green"),
+                    (f"{info['desc']}\n", "dim white"),
+                    (f"\n{info['formats']}", "dim cyan")
+                )
                 border_style = "green"
             else:
-                card_text.append(f"✗ {info['name']}\n", style="bold red")
-                card_text.append(f"{info['desc']}\n", style="dim white")
-                card_text.append("\nNot installed", style="dim red")
+                card_text = Text.assemble(
+                    (f"{info['icon']}\n", "bold"),
+                    (f"✗ {info['name']}\n", "bold red"),
+                    (f"{info['desc']}\n", "dim white"),
+                    ("\nNot installed", "dim red")
+                )
                 border_style = "red"
 
             card = Panel(
@@ -168,13 +227,9 @@ class Display:
             )
             cards.append(card)
 
-        # Display cards in columns
-        console.print(Columns(cards, equal=True, expand=False, padding=(0, 2)))
-        console.print()
-
         # Summary
         available_count = sum(1 for v in status.values() if v)
-        total_count = len(tools_info)
+        total_count = len(_TOOLS_INFO)
 
         if available_count == total_count:
             summary_style = "bold green"
@@ -195,10 +250,20 @@ class Display:
             padding=(0, 2),
             expand=False
         )
-        console.print(summary)
-        console.print()
-
-        console.print(Text("Press Enter to continue...", style="dim"), end="")
+        # Clear, title, cards in columns, summary and prompt go to the
+        # terminal in one write
+        with console:
+            console.clear()
+            console.print(Group(
+                Text(""),
+                title,
+                Text(""),
+                Columns(cards, equal=True, expand=False, padding=(0, 2)),
+                Text(""),
+                summary,
+                Text("")
+            ))
+            console.print(_PROMPT_TEXT, end="")
         try:
             input()
         except KeyboardInterrupt:
@@ -207,19 +272,17 @@ class Display:
     @staticmethod
     def show_logs():
         """Display recent logs with syntax highlighting"""
-        console.clear()
-        console.print()
+        # The whole screen is collected and written (with the clear) at once
+        screen: List = [
+            Text(""),
+            Text.from_markup("[bold cyan]📋 Recent Application Logs[/bold cyan]\n")
+        ]
 
-        # Title
-        console.print("[bold cyan]📋 Recent Application Logs[/bold cyan]\n")
+        # Find latest log file (with this session's buffered records written)
+        flush_logs()
+        latest_log = _latest_log()
 
-        # Find latest log file
-        try:
-            log_files = list(LOG_DIR.glob("processor_*.log"))
-        except Exception:
-            log_files = []
-
-        if not log_files:
+        if latest_log is None:
             no_logs_panel = Panel(
                 "[yellow]No log files found[/yellow]\n\n"
                 "Logs will be created when you perform conversions.",
@@ -227,11 +290,11 @@ class Display:
                 border_style="yellow",
                 padding=(1, 2)
             )
-            console.print(no_logs_panel)
+            with console:
+                console.clear()
+                console.print(Group(*screen, no_logs_panel))
             return
 
-        latest_log = max(log_files, key=lambda p: p.stat().st_mtime)
-
         # Log file info
         try:
             log_info = latest_log.stat()
@@ -252,72 +315,56 @@ class Display:
                 padding=(0, 2),
                 expand=False
             )
-            console.print(info_panel)
-            console.print()
+            screen += [info_panel, Text("")]
         except Exception as e:
-            console.print(f"[yellow]Could not read log file info: {e}[/yellow]\n")
+            screen.append(Text(f"Could not read log file info: {e}\n", style="yellow"))
 
         # Read and display logs
         try:
-            with open(latest_log, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()[-40:]  # Last 40 lines
-
-                log_table = Table(
-                    show_header=True,
-                    header_style="bold cyan",
-                    box=box.MINIMAL,
-                    padding=(0, 1),
-                    collapse_padding=True,
-                    pad_edge=False
-                )
-                log_table.add_column("Time", style="dim", width=19, no_wrap=True)
-                log_table.add_column("Level", width=8, no_wrap=True)
-                log_table.add_column("Message", style="white", overflow="fold", max_width=80)
-
+            # Only the end of the file is read; logs grow over long sessions
+            with open(latest_log, 'rb') as f:
+                start = max(0, f.seek(0, 2) - _LOG_TAIL_BYTES)
+                f.seek(start)
+                lines = f.read().decode('utf-8', errors='ignore').splitlines()
+                if start:
+                    lines = lines[1:]  # cut mid-line by the seek
+                lines = lines[-40:]  # Last 40 lines
+
+                # Rows are plain pre-padded lines (no markup: brackets in
+                # a message are shown as written)
+                rows = [_LOG_HEADER]
                 for line in lines:
-                    line = line.strip()
-                    if not line or '=' * 10 in line:
+                    # Non-records (blank lines, traceback lines) fail the match
+                    match = _LOG_RE.match(line)
+                    if not match:
                         continue
-                    try:
-                        parts = line.split(' - ', 2)
-                        if len(parts) >= 3:
-                            timestamp = parts[0]
-                            level = parts[1]
-                            message = parts[2] if len(parts) > 2 else ""
-
-                            if len(timestamp) > 19:
-                                timestamp = timestamp[-19:]
-
-                            if 'ERROR' in level:
-                                level_style = "[bold red]ERROR[/bold red]"
-                                msg_style = "red"
-                            elif 'WARNING' in level or 'WARN' in level:
-                                level_style = "[bold yellow]WARN[/bold yellow]"
-                                msg_style = "yellow"
-                            elif 'INFO' in level:
-                                level_style = "[bold green]INFO[/bold green]"
-                                msg_style = "white"
-                            elif 'DEBUG' in level:
-                                level_style = "[dim cyan]DEBUG[/dim cyan]"
-                                msg_style = "dim cyan"
-                            else:
-                                level_style = level
-                                msg_style = "white"
-
-                            if len(message) > 100:
-                                message = message[:97] + "..."
-
-                            log_table.add_row(timestamp, level_style, f"[{msg_style}]{message}[/{msg_style}]")
-                    except Exception:
+                    timestamp, level, message = match.groups()
+                    if _LOG_SEPARATOR in message:
                         continue
 
+                    label, level_style, msg_style = _LOG_LEVELS.get(level) or (level, "", "white")
+
+                    if len(message) > 100:
+                        message = message[:97] + "..."
+                    if len(message) > _LOG_MSG_WIDTH:
+                        message = _LOG_INDENT.join(
+                            message[i:i + _LOG_MSG_WIDTH]
+                            for i in range(0, len(message), _LOG_MSG_WIDTH)
+                        )
+
+                    rows.append(Text.assemble(
+                        (timestamp, "dim"), " ",
+                        (f"{label:<{_LOG_LEVEL_WIDTH}}", level_style), " ",
+                        (message, msg_style)
+                    ))
+
                 logs_panel = Panel(
-                    log_table,
+                    Group(*rows),
                     title="[bold cyan]📖 Recent Entries[/bold cyan]",
                     border_style="cyan",
                     padding=(1, 2)
                 )
-                console.print(logs_panel)
+                screen.append(logs_panel)
 
         except Exception as e:
             error_panel = Panel(
@@ -326,16 +373,18 @@ class Display:
                 border_style="red",
                 padding=(1, 2)
             )
-            console.print(error_panel)
+            screen.append(error_panel)
 
-        console.print()
+        screen.append(Text(""))
         try:
-            console.print(Text(f"Full log path: {latest_log.absolute()}", style="dim"))
+            screen.append(Text(f"Full log path: {latest_log.absolute()}", style="dim"))
         except Exception:
             pass
-        console.print()
-
-        console.print(Text("Press Enter to continue...", style="dim"), end="")
+        screen.append(Text(""))
+        with console:
+            console.clear()
+            console.print(Group(*screen))
+            console.print(_PROMPT_TEXT, end="")
         try:
             input()
         except KeyboardInterrupt:
@@ -382,25 +431,25 @@ class Display:
         panel = Panel(f"[red]{message}[/red]",
                       title=f"[bold red]❌ {title}[/bold red]",
                       border_style="red", padding=(1, 2))
-        console.print("\n", panel, "\n")
+        print_spaced(panel)
 
     @staticmethod
     def show_success(message: str, title: str = "Success"):
         panel = Panel(f"[green]{message}[/green]",
                       title=f"[bold green]✅ {title}[/bold green]",
                       border_style="green", padding=(1, 2))
-        console.print("\n", panel, "\n")
+        print_spaced(panel)
 
     @staticmethod
     def show_warning(message: str, title: str = "Warning"):
         panel = Panel(f"[yellow]{message}[/yellow]",
                       title=f"[bold yellow]⚠️  {title}[/bold yellow]",
                       border_style="yellow", padding=(1, 2))
-        console.print("\n", panel, "\n")
+        print_spaced(panel)
 
     @staticmethod
     def show_info(message: str, title: str = "Information"):
         panel = Panel(f"[cyan]{message}[/cyan]",
                       title=f"[bold cyan]ℹ️  {title}[/bold cyan]",
                       border_style="cyan", padding=(1, 2))
-        console.print("\n", panel, "\n")
+        print_spaced(panel)
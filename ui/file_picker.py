@@ -2,22 +2,55 @@
 # -*- coding: utf-8 -*-
 """File and folder picker dialogs"""
 
-from tkinter import Tk, filedialog
+import atexit
 from typing import List
 from utils.logger import get_logger
 
 logger = get_logger()
 
+# Hidden Tk root shared by the picker dialogs (see FilePicker._create_root)
+_root = None
+
+
+def _destroy_root():
+    """Tear down the shared Tk root at exit"""
+    global _root
+    if _root is not None:
+        try:
+            _root.destroy()
+        except Exception:
+            pass
+        _root = None
+
+
+atexit.register(_destroy_root)
+
+
 class FilePicker:
     """Handle file and folder selection dialogs"""
     
     @staticmethod
     def _create_root():
-        """Create and configure Tk root"""
-        root = Tk()
-        root.withdraw()
-        root.attributes('-topmost', True)
-        return root
+        """
+        Get the hidden Tk root shared by all picker dialogs
+        
+        The root (and the Tcl interpreter behind it) is created on first
+        use and kept for the rest of the session, so picking a file and
+        then a folder does not start Tk twice. tkinter loads on first use.
+        """
+        global _root
+        if _root is not None:
+            try:
+                _root.update()
+                return _root
+            except Exception:
+                _root = None  # destroyed behind our back; build a new one
+        
+        from tkinter import Tk
+        _root = Tk()
+        _root.withdraw()
+        _root.attributes('-topmost', True)
+        return _root
     
     @staticmethod
     def pick_file() -> str:
@@ -28,6 +61,7 @@ class FilePicker:
             Selected file path or empty string
         """
         try:
+            from tkinter import filedialog
             root = FilePicker._create_root()
             
             file_path = filedialog.askopenfilename(
@@ -41,7 +75,7 @@ class FilePicker:
                 ]
             )
             
-            root.destroy()
+            root.update()  # let the dialog close; the root is kept
             logger.info(f"File selected: {file_path if file_path else 'None'}")
             return file_path
         except Exception as e:
@@ -57,6 +91,7 @@ class FilePicker:
             List of selected file paths
         """
         try:
+            from tkinter import filedialog
             root = FilePicker._create_root()
             
             files = filedialog.askopenfilenames(
@@ -64,7 +99,7 @@ class FilePicker:
                 filetypes=[("All Files", "*.*")]
             )
             
-            root.destroy()
+            root.update()  # let the dialog close; the root is kept
             logger.info(f"Selected {len(files)} files")
             return list(files)
         except Exception as e:
@@ -80,10 +115,11 @@ class FilePicker:
             Selected folder path or empty string
         """
         try:
+            from tkinter import filedialog
             root = FilePicker._create_root()
             
             folder_path = filedialog.askdirectory(title="Select output folder")
-            root.destroy()
+            root.update()  # let the dialog close; the root is kept
             logger.info(f"Folder selected: {folder_path if folder_path else 'None'}")
             return folder_path
         except Exception as e:
@@ -3,15 +3,47 @@
 """Enhanced main menu interface with animations - FIXED & TESTED"""
 
 import questionary
-from rich.console import Console
+from rich.console import Group
 from rich.panel import Panel
 from rich.align import Align
 from rich.text import Text
 from rich.table import Table
-import time
 import sys
+from functools import lru_cache
+from ui.console import console, print_spaced
 
-console = Console()
+
+# Main menu prompt style
+_MENU_STYLE = questionary.Style([
+    ('qmark', 'fg:#00ff00 bold'),
+    ('question', 'fg:#00ffff bold'),
+    ('answer', 'fg:#00ff00 bold'),
+    ('pointer', 'fg:#00ffff bold'),
+    ('highlighted', 'fg:#00ffff bold'),
+    ('selected', 'fg:#00ff00'),
+    ('separator', 'fg:#555555'),
+    ('instruction', 'fg:#888888'),
+    ('text', ''),
+])
+
+# get_choice() prompt style
+_CHOICE_STYLE = questionary.Style([
+    ('qmark', 'fg:#00ff00 bold'),
+    ('question', 'fg:#00ffff bold'),
+    ('answer', 'fg:#00ff00 bold'),
+    ('pointer', 'fg:#00ffff bold'),
+    ('highlighted', 'fg:#00ffff bold'),
+    ('selected', 'fg:#00ff00'),
+])
+
+# confirm() and get_text() prompt style
+_INPUT_STYLE = questionary.Style([
+    ('question', 'fg:#00ffff bold'),
+    ('answer', 'fg:#00ff00 bold'),
+])
+
+# Default pause() prompt (printed, never modified)
+_PAUSE_TEXT = Text("\nPress Enter to continue...", style="dim")
 
 
 class MainMenu:
@@ -43,6 +75,12 @@ class MainMenu:
             "desc": "Check installed conversion tools",
             "color": "green"
         },
+        {
+            "key": "Refresh Tools",
+            "emoji": "🔄",
+            "desc": "Re-check tools after installing or removing one",
+            "color": "green"
+        },
         {
             "key": "View Logs",
             "emoji": "📋",
@@ -62,44 +100,16 @@ class MainMenu:
         """Display enhanced main menu with animation"""
         console.clear()
         
-        # Show header banner
-        MainMenu._show_header()
-        
-        # Show feature highlights
-        MainMenu._show_features()
+        # Header banner and feature highlights, printed in one pass
+        console.print(MainMenu._menu_screen())
         
         try:
-            # Create menu choices
-            choices = [
-                questionary.Choice(
-                    title=f"{opt['emoji']} {opt['key']}",
-                    value=opt['key']
-                )
-                for opt in MainMenu.MENU_OPTIONS
-            ]
-            
-            choice = questionary.select(
+            return questionary.select(
                 "What would you like to do?",
-                choices=choices,
-                style=questionary.Style([
-                    ('qmark', 'fg:#00ff00 bold'),
-                    ('question', 'fg:#00ffff bold'),
-                    ('answer', 'fg:#00ff00 bold'),
-                    ('pointer', 'fg:#00ffff bold'),
-                    ('highlighted', 'fg:#00ffff bold'),
-                    ('selected', 'fg:#00ff00'),
-                    ('separator', 'fg:#555555'),
-                    ('instruction', 'fg:#888888'),
-                    ('text', ''),
-                ])
+                choices=MainMenu._menu_choices(),
+                style=_MENU_STYLE
             ).ask()
             
-            # Show loading animation
-            if choice and choice != "Exit":
-                MainMenu._show_loading(choice)
-            
-            return choice
-            
         except KeyboardInterrupt:
             console.print("\n[yellow]Operation cancelled[/yellow]")
             return None
@@ -107,9 +117,39 @@ class MainMenu:
             console.print(f"\n[red]Menu error: {e}[/red]")
             return None
     
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _menu_choices() -> tuple:
+        """Build the menu choices from MENU_OPTIONS (once)"""
+        return tuple(
+            questionary.Choice(
+                title=f"{opt['emoji']} {opt['key']}",
+                value=opt['key']
+            )
+            for opt in MainMenu.MENU_OPTIONS
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _menu_screen() -> Group:
+        """Build the static part of the menu screen (once)"""
+        return Group(
+            MainMenu._header_panel(),
+            Text(""),
+            MainMenu._features_table(),
+            Text("")
+        )
+    
     @staticmethod
     def _show_header():
         """Display beautiful header banner"""
+        console.print(MainMenu._header_panel())
+        console.print()
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _header_panel() -> Panel:
+        """Build the static header banner (once)"""
         logo = r"""
   ██╗   ██╗███████╗██████╗ 
   ██║   ██║██╔════╝██╔══██╗
@@ -126,18 +166,22 @@ class MainMenu:
         header_text.append("\n")
         header_text.append("Professional Modular Conversion Tool v2.0", style="dim white")
         
-        panel = Panel(
+        return Panel(
             Align.center(header_text),
             border_style="cyan",
             padding=(1, 2)
         )
-        
-        console.print(panel)
-        console.print()
     
     @staticmethod
     def _show_features():
         """Display supported features"""
+        console.print(MainMenu._features_table())
+        console.print()
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _features_table() -> Align:
+        """Build the static feature highlights table (once)"""
         table = Table(show_header=False, box=None, padding=(0, 3), collapse_padding=True)
         table.add_column(style="bold", width=16, no_wrap=True)
         table.add_column(style="dim white", width=30)
@@ -154,14 +198,7 @@ class MainMenu:
         for icon_text, formats in features:
             table.add_row(icon_text, formats)
         
-        console.print(Align.center(table))
-        console.print()
-    
-    @staticmethod
-    def _show_loading(action: str):
-        """Show loading animation"""
-        with console.status(f"[bold cyan]Loading {action}...[/bold cyan]", spinner="dots12"):
-            time.sleep(0.3)
+        return Align.center(table)
     
     @staticmethod
     def show_error(message: str):
@@ -171,7 +208,7 @@ class MainMenu:
             border_style="red",
             padding=(1, 2)
         )
-        console.print("\n", panel, "\n")
+        print_spaced(panel)
     
     @staticmethod
     def show_success(message: str):
@@ -181,7 +218,7 @@ class MainMenu:
             border_style="green",
             padding=(1, 2)
         )
-        console.print("\n", panel, "\n")
+        print_spaced(panel)
     
     @staticmethod
     def show_info(message: str):
@@ -191,7 +228,7 @@ class MainMenu:
             border_style="cyan",
             padding=(1, 2)
         )
-        console.print("\n", panel, "\n")
+        print_spaced(panel)
     
     @staticmethod
     def show_warning(message: str):
@@ -201,7 +238,7 @@ class MainMenu:
             border_style="yellow",
             padding=(1, 2)
         )
-        console.print("\n", panel, "\n")
+        print_spaced(panel)
     
     @staticmethod
     def confirm(question: str, default: bool = True) -> bool:
@@ -210,10 +247,7 @@ class MainMenu:
             return questionary.confirm(
                 question,
                 default=default,
-                style=questionary.Style([
-                    ('question', 'fg:#00ffff bold'),
-                    ('answer', 'fg:#00ff00 bold'),
-                ])
+                style=_INPUT_STYLE
             ).ask()
         except KeyboardInterrupt:
             return False
@@ -229,7 +263,7 @@ class MainMenu:
         try:
             if message is None:
                 # ✅ FIXED: بدون f-string
-                console.print("\n[dim]Press Enter to continue...[/dim]", end="")
+                console.print(_PAUSE_TEXT, end="")
             else:
                 # برای پیام‌های سفارشی
                 console.print(f"\n{message}", end="")
@@ -245,14 +279,7 @@ class MainMenu:
                 question,
                 choices=choices,
                 default=default,
-                style=questionary.Style([
-                    ('qmark', 'fg:#00ff00 bold'),
-                    ('question', 'fg:#00ffff bold'),
-                    ('answer', 'fg:#00ff00 bold'),
-                    ('pointer', 'fg:#00ffff bold'),
-                    ('highlighted', 'fg:#00ffff bold'),
-                    ('selected', 'fg:#00ff00'),
-                ])
+                style=_CHOICE_STYLE
             ).ask()
         except KeyboardInterrupt:
             return None
@@ -264,10 +291,7 @@ class MainMenu:
             return questionary.text(
                 question,
                 default=default,
-                style=questionary.Style([
-                    ('question', 'fg:#00ffff bold'),
-                    ('answer', 'fg:#00ff00 bold'),
-                ])
+                style=_INPUT_STYLE
             ).ask()
         except KeyboardInterrupt:
             return None
@@ -2,21 +2,126 @@
 # -*- coding: utf-8 -*-
 """Beautiful notification system with enhanced animations"""
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from rich.align import Align
-from rich.table import Table
-from pathlib import Path
+import atexit
+import functools
+from itertools import islice
+import os
+import queue
+import threading
 import time
 
-console = Console()
+from utils.humanize import humanize_bytes
+
+# Rich and the shared console (ui.console) are imported where output is
+# rendered: every converter imports this module, including in worker
+# processes that seldom render anything
+
+
+@functools.lru_cache(maxsize=1)
+def _no_emoji() -> bool:
+    """
+    True when emoji cannot be written to the output stream
+    
+    That is a non-UTF stream (e.g. a latin-1 locale; Rich swaps box lines
+    for ASCII there but not emoji), so icons are left out. Labels stay
+    aligned: each icon includes its spacing.
+    """
+    from ui.console import console
+    return not console.encoding.startswith('utf')
+
+
+def _icon(glyph: str) -> str:
+    """The glyph (an emoji and its spacing), or '' where emoji can't be shown"""
+    return '' if _no_emoji() else glyph
+
+
+# Color and title icon of the simple message panels (show_warning etc.)
+_SIMPLE_STYLES = {
+    'warning': ("yellow", "⚠️  "),
+    'info': ("cyan", "ℹ️  "),
+    'success': ("green", "✅ "),
+    'error': ("red", "❌ "),
+}
+
+# Serializes notification rendering across conversion worker threads
+_render_lock = threading.RLock()
+
+
+def _print_notification(panel) -> None:
+    """Print a notification panel and its spacing in one console.print call"""
+    from rich.console import Group
+    from rich.text import Text
+    from ui.console import console
+    
+    # Blank lines above and below the panel
+    console.print(Group(Text("\n"), panel, Text("")))
+
+
+# When output is not a terminal (piped, redirected, CI) notifications are
+# written as single plain lines instead of rendered panels; see _print_plain.
+
+def _plain_size(path: str):
+    """Size of path for a plain notification line, or None if unreadable"""
+    try:
+        return humanize_bytes(os.stat(path).st_size)
+    except OSError:
+        return None
+
+
+def _print_plain(summary: str, **fields) -> None:
+    """
+    Write a one-line notification (e.g. 'OK a.png -> a.jpg size=12.00 KB')
+    
+    Args:
+        summary: Line text (printed as is, no markup)
+        **fields: key=value pairs appended to the line; None values are left out
+    """
+    from ui.console import console
+    
+    extra = " ".join(f"{key}={value}" for key, value in fields.items() if value is not None)
+    console.out(f"{summary} {extra}" if extra else summary, highlight=False)
+
+
+def _synchronized(func):
+    """Render a whole notification without interleaving with other threads"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not Notifications.enabled:
+            return None
+        with _render_lock:
+            if _status_line_open:
+                _end_status_line()
+            return func(*args, **kwargs)
+    return wrapper
+
+
+# True while show_progress_status's line is on screen, not yet ended
+_status_line_open = False
+
+
+def _rewind_line(console) -> None:
+    """Move the cursor to column 1 and erase the whole line"""
+    from rich.control import Control
+    from rich.segment import ControlType
+    console.control(Control.move_to_column(0), Control((ControlType.ERASE_IN_LINE, 2)))
+
+
+def _end_status_line() -> None:
+    """Erase the in-place status line so the next output starts clean"""
+    global _status_line_open
+    from ui.console import console
+    _rewind_line(console)
+    _status_line_open = False
 
 
 class Notifications:
     """Beautiful notification messages with enhanced UI"""
     
+    # Set to False to silence all notifications
+    enabled = True
+    
     @staticmethod
+    @_synchronized
     def show_conversion_complete(input_file: str, output_file: str, duration: float = None):
         """
         Show beautiful completion notification with file details
@@ -26,68 +131,57 @@ class Notifications:
             output_file: Output file path
             duration: Conversion duration in seconds
         """
-        console.print("\n")
-        
-        # Create notification text
-        text = Text()
-        text.append("🎉 ", style="bold yellow")
-        text.append("Conversion Complete!", style="bold green")
-        text.append("\n\n")
+        from ui.console import console
         
-        # Input file
-        text.append("📥 Input:    ", style="cyan bold")
-        text.append(f"{Path(input_file).name}\n", style="white")
-        
-        # Output file
-        text.append("📤 Output:   ", style="green bold")
-        text.append(f"{Path(output_file).name}\n", style="white")
+        if not console.is_terminal:
+            _print_plain(
+                f"OK {os.path.basename(input_file)} -> {os.path.basename(output_file)}",
+                size=_plain_size(output_file),
+                dur=f"{duration:.2f}s" if duration else None
+            )
+            return
         
-        # Output location
-        output_path = Path(output_file).parent
-        text.append("📁 Location: ", style="cyan bold")
+        from rich.align import Align
+        from rich.panel import Panel
+        from rich.text import Text
         
-        # Truncate long paths
-        path_str = str(output_path)
-        if len(path_str) > 50:
+        # Build the notification text from (text, style) parts in one
+        # Text.assemble call; names are plain text, never markup
+        path_str = os.path.dirname(output_file) or "."
+        if len(path_str) > 50:  # Truncate long paths
             path_str = "..." + path_str[-47:]
-        text.append(f"{path_str}\n", style="dim white")
+        
+        parts = [
+            (_icon("🎉 "), "bold yellow"),
+            ("Conversion Complete!", "bold green"),
+            "\n\n",
+            (_icon("📥 ") + "Input:    ", "cyan bold"),
+            (f"{os.path.basename(input_file)}\n", "white"),
+            (_icon("📤 ") + "Output:   ", "green bold"),
+            (f"{os.path.basename(output_file)}\n", "white"),
+            (_icon("📁 ") + "Location: ", "cyan bold"),
+            (f"{path_str}\n", "dim white"),
+        ]
         
         # File size comparison
         try:
-            input_size = Path(input_file).stat().st_size
-            output_size = Path(output_file).stat().st_size
-            
-            # Format sizes
-            def format_size(size_bytes):
-                if size_bytes < 1024:
-                    return f"{size_bytes} B"
-                elif size_bytes < 1024 * 1024:
-                    return f"{size_bytes / 1024:.2f} KB"
-                elif size_bytes < 1024 * 1024 * 1024:
-                    return f"{size_bytes / (1024 * 1024):.2f} MB"
-                else:
-                    return f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
+            input_size = os.stat(input_file).st_size
+            output_size = os.stat(output_file).st_size
             
-            output_size_str = format_size(output_size)
-            text.append("💾 Size:     ", style="cyan bold")
-            text.append(f"{output_size_str}", style="white")
+            parts += [(_icon("💾 ") + "Size:     ", "cyan bold"), (humanize_bytes(output_size), "white")]
             
             # Show size difference
             if input_size > 0:
                 size_diff = ((output_size - input_size) / input_size) * 100
                 if abs(size_diff) > 1:  # Only show if difference is > 1%
-                    if size_diff > 0:
-                        text.append(f" (+{size_diff:.1f}%)", style="yellow")
-                    else:
-                        text.append(f" ({size_diff:.1f}%)", style="green")
+                    parts.append((f" ({size_diff:+.1f}%)", "yellow" if size_diff > 0 else "green"))
             
-            text.append("\n")
+            parts.append("\n")
         except Exception:
             pass
         
         # Duration
         if duration:
-            text.append("⏱️  Duration: ", style="cyan bold")
             if duration < 1:
                 time_str = f"{duration * 1000:.0f}ms"
             elif duration < 60:
@@ -96,21 +190,23 @@ class Notifications:
                 minutes = int(duration // 60)
                 seconds = duration % 60
                 time_str = f"{minutes}m {seconds:.1f}s"
-            text.append(f"{time_str}", style="white")
+            parts += [(_icon("⏱️  ") + "Duration: ", "cyan bold"), (time_str, "white")]
+        
+        text = Text.assemble(*parts)
         
         # Create panel
         panel = Panel(
             Align.center(text),
-            title="[bold green]✨ Success ✨[/bold green]",
+            title=f"[bold green]{_icon('✨ ')}Success{_icon(' ✨')}[/bold green]",
             subtitle="[dim]File saved successfully[/dim]",
             border_style="green",
             padding=(1, 2)
         )
         
-        console.print(panel)
-        console.print()
+        _print_notification(panel)
     
     @staticmethod
+    @_synchronized
     def show_conversion_failed(input_file: str, error: str):
         """
         Show failure notification with error details
@@ -119,37 +215,49 @@ class Notifications:
             input_file: Input file path
             error: Error message
         """
-        console.print("\n")
-        
-        text = Text()
-        text.append("❌ ", style="bold red")
-        text.append("Conversion Failed", style="bold red")
-        text.append("\n\n")
-        
-        text.append("📄 File: ", style="cyan bold")
-        text.append(f"{Path(input_file).name}\n\n", style="white")
-        
-        text.append("🔴 Error:\n", style="red bold")
-        
-        # Format error message (wrap long lines)
-        error_text = error[:300]  # Limit error length
-        error_lines = error_text.split('\n')
-        for line in error_lines[:5]:  # Show max 5 lines
-            if line.strip():
-                text.append(f"   {line.strip()}\n", style="yellow")
+        from ui.console import console
+        
+        if not console.is_terminal:
+            first_line = next(filter(None, map(str.strip, error[:300].splitlines())), "")
+            _print_plain(f"FAILED {os.path.basename(input_file)}: {first_line}")
+            return
+        
+        from rich.align import Align
+        from rich.panel import Panel
+        from rich.text import Text
+        
+        parts = [
+            (_icon("❌ "), "bold red"),
+            ("Conversion Failed", "bold red"),
+            "\n\n",
+            (_icon("📄 ") + "File: ", "cyan bold"),
+            (f"{os.path.basename(input_file)}\n\n", "white"),
+            (_icon("🔴 ") + "Error:\n", "red bold"),
+        ]
+        
+        # Format error message (wrap long lines); shown as plain text, so
+        # brackets in tool output are not taken for markup
+        # At most 5 lines of the first 300 characters: a long traceback is
+        # never split in full, and islice stops after the fifth line
+        for line in islice(error[:300].splitlines(), 5):
+            line = line.strip()
+            if line:
+                parts.append((f"   {line}\n", "yellow"))
+        
+        text = Text.assemble(*parts)
         
         panel = Panel(
             Align.center(text),
-            title="[bold red]⚠️  Failed ⚠️[/bold red]",
+            title=f"[bold red]{_icon('⚠️  ')}Failed{_icon(' ⚠️')}[/bold red]",
             subtitle="[dim]Check logs for full error details[/dim]",
             border_style="red",
             padding=(1, 2)
         )
         
-        console.print(panel)
-        console.print()
+        _print_notification(panel)
     
     @staticmethod
+    @_synchronized
     def show_batch_complete(success: int, failed: int, total: int, duration: float = None):
         """
         Show batch conversion completion with statistics
@@ -160,33 +268,44 @@ class Notifications:
             total: Total files processed
             duration: Total duration in seconds
         """
-        console.print("\n")
+        from ui.console import console
+        
+        if not console.is_terminal:
+            _print_plain(
+                f"BATCH {success}/{total} succeeded, {failed} failed",
+                dur=f"{duration:.2f}s" if duration else None
+            )
+            return
+        
+        from rich.align import Align
+        from rich.panel import Panel
+        from rich.table import Table
         
         # Create statistics table
         stats_table = Table(show_header=False, box=None, padding=(0, 3))
         stats_table.add_column(style="bold", justify="right", width=20)
         stats_table.add_column(style="bold", justify="left")
         
-        stats_table.add_row("✅ Successful:", f"[green]{success}[/green]")
-        stats_table.add_row("❌ Failed:", f"[red]{failed}[/red]")
-        stats_table.add_row("📊 Total:", f"[cyan]{total}[/cyan]")
+        stats_table.add_row(_icon("✅ ") + "Successful:", f"[green]{success}[/green]")
+        stats_table.add_row(_icon("❌ ") + "Failed:", f"[red]{failed}[/red]")
+        stats_table.add_row(_icon("📊 ") + "Total:", f"[cyan]{total}[/cyan]")
         
         # Success rate
         if total > 0:
             rate = (success / total) * 100
             if rate >= 80:
                 rate_style = "bold green"
-                rate_icon = "🎉"
+                rate_icon = _icon("🎉 ")
             elif rate >= 50:
                 rate_style = "bold yellow"
-                rate_icon = "⚠️"
+                rate_icon = _icon("⚠️ ")
             else:
                 rate_style = "bold red"
-                rate_icon = "❌"
+                rate_icon = _icon("❌ ")
             
             stats_table.add_row(
-                "📈 Success Rate:",
-                f"[{rate_style}]{rate_icon} {rate:.1f}%[/{rate_style}]"
+                _icon("📈 ") + "Success Rate:",
+                f"[{rate_style}]{rate_icon}{rate:.1f}%[/{rate_style}]"
             )
         
         # Duration
@@ -202,7 +321,7 @@ class Notifications:
                 minutes = int((duration % 3600) // 60)
                 time_str = f"{hours}h {minutes}m"
             
-            stats_table.add_row("⏱️  Total Time:", f"[white]{time_str}[/white]")
+            stats_table.add_row(_icon("⏱️  ") + "Total Time:", f"[white]{time_str}[/white]")
         
         # Calculate average time per file
         if duration and total > 0:
@@ -211,20 +330,20 @@ class Notifications:
                 avg_str = f"{avg_time * 1000:.0f}ms"
             else:
                 avg_str = f"{avg_time:.2f}s"
-            stats_table.add_row("⚡ Avg per File:", f"[dim]{avg_str}[/dim]")
+            stats_table.add_row(_icon("⚡ ") + "Avg per File:", f"[dim]{avg_str}[/dim]")
         
         # Determine border style and title
         if success == total and total > 0:
             border_style = "green"
-            title = "[bold green]✨ Perfect! All files converted ✨[/bold green]"
-            subtitle = "[dim green]🎉 100% success rate[/dim green]"
+            title = f"[bold green]{_icon('✨ ')}Perfect! All files converted{_icon(' ✨')}[/bold green]"
+            subtitle = f"[dim green]{_icon('🎉 ')}100% success rate[/dim green]"
         elif success > 0:
             border_style = "yellow"
-            title = "[bold yellow]⚡ Batch Conversion Completed ⚡[/bold yellow]"
+            title = f"[bold yellow]{_icon('⚡ ')}Batch Conversion Completed{_icon(' ⚡')}[/bold yellow]"
             subtitle = f"[dim]{success} succeeded, {failed} failed[/dim]"
         else:
             border_style = "red"
-            title = "[bold red]⚠️  All Conversions Failed ⚠️[/bold red]"
+            title = f"[bold red]{_icon('⚠️  ')}All Conversions Failed{_icon(' ⚠️')}[/bold red]"
             subtitle = "[dim]Check logs for error details[/dim]"
         
         panel = Panel(
@@ -235,14 +354,14 @@ class Notifications:
             padding=(1, 2)
         )
         
-        console.print(panel)
-        console.print()
+        _print_notification(panel)
         
         # Show celebration if perfect
         if success == total and total > 0:
             Notifications.show_celebration()
     
     @staticmethod
+    @_synchronized
     def show_progress_notification(message: str, icon: str = "⏳"):
         """
         Show inline progress notification
@@ -251,37 +370,95 @@ class Notifications:
             message: Progress message
             icon: Icon to display (default: hourglass)
         """
-        text = f"{icon} [cyan]{message}[/cyan]"
+        from ui.console import console
+        
+        if not console.is_terminal:
+            _print_plain(message)
+            return
+        
+        text = f"{_icon(icon + ' ')}[cyan]{message}[/cyan]"
         console.print(text)
     
     @staticmethod
+    def show_progress_status(message: str, icon: str = "⏳"):
+        """
+        Show a one-line progress status, updated in place
+        
+        Each call rewrites the same terminal line; the next notification of
+        any other kind erases it. Nothing is written when output is not a
+        terminal (a log would get one line per update).
+        
+        Args:
+            message: Status text (plain, no markup)
+            icon: Icon to display (default: hourglass)
+        """
+        global _status_line_open
+        from rich.text import Text
+        from ui.console import console
+        
+        if not Notifications.enabled or not console.is_terminal:
+            return
+        with _render_lock, console:
+            _rewind_line(console)
+            console.print(
+                Text.assemble(_icon(icon + ' '), (message, "cyan")),
+                end="", no_wrap=True, overflow="ellipsis"
+            )
+            _status_line_open = True
+    
+    @staticmethod
+    @_synchronized
     def show_celebration():
         """Show celebration animation with emojis"""
+        from ui.console import console
+        
+        if not console.is_terminal or _no_emoji():
+            return
         celebration = "🎉 🎊 ✨ 🎈 🎁 ✨ 🎊 🎉"
         console.print(f"[bold yellow]{celebration}[/bold yellow]", justify="center")
     
     @staticmethod
-    def show_warning(message: str, title: str = "Warning"):
+    def _show_simple(message: str, title: str, kind: str):
         """
-        Show warning notification
+        Render one of the simple message panels (see _SIMPLE_STYLES)
         
         Args:
-            message: Warning message
-            title: Warning title
+            message: Panel text (Rich markup)
+            title: Panel title
+            kind: 'warning', 'info', 'success' or 'error'
         """
-        console.print("\n")
+        from rich.panel import Panel
+        from ui.console import console
+        
+        color, icon = _SIMPLE_STYLES[kind]
+        icon = _icon(icon)
+        if not console.is_terminal:
+            console.print(f"{icon}{title}: {message}", highlight=False)
+            return
         
         panel = Panel(
-            f"[yellow]{message}[/yellow]",
-            title=f"[bold yellow]⚠️  {title}[/bold yellow]",
-            border_style="yellow",
+            f"[{color}]{message}[/{color}]",
+            title=f"[bold {color}]{icon}{title}[/bold {color}]",
+            border_style=color,
             padding=(1, 2)
         )
         
-        console.print(panel)
-        console.print()
+        _print_notification(panel)
+    
+    @staticmethod
+    @_synchronized
+    def show_warning(message: str, title: str = "Warning"):
+        """
+        Show warning notification
+        
+        Args:
+            message: Warning message
+            title: Warning title
+        """
+        Notifications._show_simple(message, title, 'warning')
     
     @staticmethod
+    @_synchronized
     def show_info(message: str, title: str = "Information"):
         """
         Show info notification
@@ -290,19 +467,10 @@ class Notifications:
             message: Info message
             title: Info title
         """
-        console.print("\n")
-        
-        panel = Panel(
-            f"[cyan]{message}[/cyan]",
-            title=f"[bold cyan]ℹ️  {title}[/bold cyan]",
-            border_style="cyan",
-            padding=(1, 2)
-        )
-        
-        console.print(panel)
-        console.print()
+        Notifications._show_simple(message, title, 'info')
     
     @staticmethod
+    @_synchronized
     def show_success(message: str, title: str = "Success"):
         """
         Show success notification (simple)
@@ -311,19 +479,10 @@ class Notifications:
             message: Success message
             title: Success title
         """
-        console.print("\n")
-        
-        panel = Panel(
-            f"[green]{message}[/green]",
-            title=f"[bold green]✅ {title}[/bold green]",
-            border_style="green",
-            padding=(1, 2)
-        )
-        
-        console.print(panel)
-        console.print()
+        Notifications._show_simple(message, title, 'success')
     
     @staticmethod
+    @_synchronized
     def show_error(message: str, title: str = "Error"):
         """
         Show error notification (simple)
@@ -332,18 +491,93 @@ class Notifications:
             message: Error message
             title: Error title
         """
-        console.print("\n")
+        Notifications._show_simple(message, title, 'error')
+
+
+
+# Pending notifications for the background render thread
+_queue: "queue.Queue" = queue.Queue()
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def _render_pending():
+    """Render queued notifications in order (runs in a daemon thread)"""
+    while True:
+        method, args, kwargs = _queue.get()
+        try:
+            method(*args, **kwargs)
+        except Exception:
+            pass
+        finally:
+            _queue.task_done()
+
+
+class _AsyncNotifications:
+    """
+    Asynchronous front-end for Notifications
+    
+    Any Notifications.show_* method can be called on this object; the
+    call is queued and rendered by a background thread so the calling
+    conversion thread does not wait on terminal I/O. Call flush() before
+    prompting the user so queued output is on screen first.
+    """
+    
+    def __getattr__(self, name: str):
+        method = getattr(Notifications, name)
         
-        panel = Panel(
-            f"[red]{message}[/red]",
-            title=f"[bold red]❌ {title}[/bold red]",
-            border_style="red",
-            padding=(1, 2)
-        )
+        def enqueue(*args, **kwargs):
+            _ensure_worker()
+            _queue.put((method, args, kwargs))
         
-        console.print(panel)
-        console.print()
+        return enqueue
+    
+    @staticmethod
+    def flush():
+        """Block until every queued notification has been rendered"""
+        _queue.join()
+
 
+def _ensure_worker():
+    """Start the render thread on first use"""
+    global _worker
+    if _worker is None:
+        with _worker_lock:
+            if _worker is None:
+                _worker = threading.Thread(target=_render_pending, daemon=True)
+                _worker.start()
+
+
+def _reset_in_child():
+    """
+    After fork: start from an empty queue and no render thread
+    
+    The parent's render thread does not exist in the child, so a copied
+    _worker would make flush() wait forever on a queue nobody drains. The
+    locks are renewed too, as the render thread may have held them.
+    """
+    global _queue, _worker, _worker_lock, _render_lock
+    _queue = queue.Queue()
+    _worker = None
+    _worker_lock = threading.Lock()
+    _render_lock = threading.RLock()
+
+
+os.register_at_fork(after_in_child=_reset_in_child)
+
+AsyncNotifications = _AsyncNotifications()
+atexit.register(AsyncNotifications.flush)
+
+
+def quiet_worker() -> None:
+    """
+    Process pool initializer: turn notifications off in the worker
+    
+    Batch workers report each file by return value and the parent prints
+    it, so nothing a worker renders can land on the parent's live
+    progress bar (stderr goes to the same terminal as stdout).
+    """
+    Notifications.enabled = False
 
 # Example usage for testing
 if __name__ == '__main__':
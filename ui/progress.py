@@ -11,25 +11,32 @@ from rich.progress import (
     TimeElapsedColumn,
     MofNCompleteColumn
 )
-from rich.console import Console
+from ui.console import console
+
+
+# Columns of the conversion progress bar, shared by every Progress built
+# below. TimeRemainingColumn is left out: it caches its text by task id,
+# and task ids restart at 0 in each Progress, so it is made per call.
+_COLUMNS = (
+    SpinnerColumn(spinner_name="dots12", style="cyan"),
+    TextColumn("[bold blue]{task.description}", justify="left"),
+    BarColumn(
+        bar_width=40,
+        style="cyan",
+        complete_style="green",
+        finished_style="bold green"
+    ),
+    MofNCompleteColumn(),
+    TextColumn("•"),
+    TimeElapsedColumn(),
+    TextColumn("•"),
+)
 
-console = Console()
 
 def get_conversion_progress():
     """Create beautiful progress bar for conversions"""
     return Progress(
-        SpinnerColumn(spinner_name="dots12", style="cyan"),
-        TextColumn("[bold blue]{task.description}", justify="left"),
-        BarColumn(
-            bar_width=40,
-            style="cyan",
-            complete_style="green",
-            finished_style="bold green"
-        ),
-        MofNCompleteColumn(),
-        TextColumn("•"),
-        TimeElapsedColumn(),
-        TextColumn("•"),
+        *_COLUMNS,
         TimeRemainingColumn(),
         console=console,
         transient=False
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""CPU count that respects affinity masks and container CPU limits"""
+
+import math
+import os
+from functools import lru_cache
+from typing import Optional
+
+# cgroup v2 quota file, then the cgroup v1 quota/period pair
+_CGROUP_V2_MAX = '/sys/fs/cgroup/cpu.max'
+_CGROUP_V1_QUOTA = '/sys/fs/cgroup/cpu/cpu.cfs_quota_us'
+_CGROUP_V1_PERIOD = '/sys/fs/cgroup/cpu/cpu.cfs_period_us'
+
+
+def _read(path: str) -> Optional[str]:
+    """Read a small file, or None if it is missing"""
+    try:
+        with open(path, 'r', encoding='ascii') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _cgroup_cpu_limit() -> Optional[int]:
+    """
+    CPUs allowed by the cgroup CPU quota (Docker --cpus, Kubernetes limits)
+    
+    Returns:
+        Quota rounded up to whole CPUs, or None if there is no limit
+    """
+    try:
+        v2 = _read(_CGROUP_V2_MAX)
+        if v2 is not None:
+            quota, period = v2.split()[:2]
+            if quota == 'max':
+                return None
+            return max(1, math.ceil(int(quota) / int(period)))
+        
+        quota, period = _read(_CGROUP_V1_QUOTA), _read(_CGROUP_V1_PERIOD)
+        if quota is None or period is None or int(quota) <= 0:
+            return None
+        return max(1, math.ceil(int(quota) / int(period)))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=1)
+def effective_cpu_count() -> int:
+    """
+    Number of CPUs this process can actually use
+    
+    The smallest of os.cpu_count(), the scheduler affinity mask and the
+    cgroup CPU quota, so worker pools are not oversized inside containers.
+    
+    Returns:
+        CPU count (at least 1)
+    """
+    count = os.cpu_count() or 1
+    if hasattr(os, 'sched_getaffinity'):
+        try:
+            count = min(count, len(os.sched_getaffinity(0)))
+        except OSError:
+            pass
+    limit = _cgroup_cpu_limit()
+    if limit:
+        count = min(count, limit)
+    return max(1, count)
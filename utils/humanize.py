@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Human-readable formatting helpers"""
+
+_UNITS = ('B', 'KB', 'MB', 'GB')
+
+
+def humanize_bytes(size_bytes: int, precision: int = 2) -> str:
+    """
+    Format a byte count for display (e.g., '1.50 MB')
+    
+    The unit comes from the number's bit length (every 10 bits above the
+    first is one 1024 step), so no comparison ladder or float log2 is needed.
+    
+    Args:
+        size_bytes: Size in bytes
+        precision: Decimal places for KB and larger
+    
+    Returns:
+        Human-readable size string
+    """
+    exp = min(3, max(0, size_bytes.bit_length() - 1) // 10)
+    if exp == 0:
+        return f"{size_bytes} B"
+    return f"{size_bytes / (1 << 10 * exp):.{precision}f} {_UNITS[exp]}"
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Persisted batch output-format choices, reused with --assume-default"""
+
+import json
+from typing import Dict, List, Optional
+from config.settings import LAST_CHOICES_FILE
+from utils.logger import get_logger
+
+logger = get_logger()
+
+_choices: Optional[Dict[str, List[str]]] = None
+
+
+def _load() -> Dict[str, List[str]]:
+    """Read the choices file once per process"""
+    global _choices
+    if _choices is None:
+        try:
+            with open(LAST_CHOICES_FILE, 'r', encoding='utf-8') as f:
+                _choices = json.load(f)
+        except (OSError, ValueError):
+            _choices = {}
+    return _choices
+
+
+def last_formats(file_type: str) -> Optional[List[str]]:
+    """
+    Get the output formats last chosen for a file type
+    
+    Args:
+        file_type: File type (e.g., 'audio')
+    
+    Returns:
+        List of output extensions, or None if nothing was recorded
+    """
+    return _load().get(file_type) or None
+
+
+def remember_formats(file_type: str, formats: List[str]) -> None:
+    """
+    Record the output formats chosen for a file type
+    
+    Args:
+        file_type: File type (e.g., 'audio')
+        formats: Chosen output extensions
+    """
+    choices = _load()
+    if choices.get(file_type) == formats:
+        return
+    choices[file_type] = formats
+    try:
+        LAST_CHOICES_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(LAST_CHOICES_FILE, 'w', encoding='utf-8') as f:
+            json.dump(choices, f)
+    except OSError as e:
+        logger.debug(f"Could not save format choices: {e}")
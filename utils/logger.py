@@ -3,11 +3,71 @@
 """Logging utilities"""
 
 import logging
+import os
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
 from config.settings import LOG_DIR
 
+# Guards the one-time logger setup against concurrent first calls
+_setup_lock = threading.Lock()
+
+# Log file name stamp, taken once per process
+_RUN_STAMP = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+# The log file handler, once set up (see flush_logs)
+_file_handler = None
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler that lets records collect in the file's write buffer
+    
+    StreamHandler.emit() flushes after every record, i.e. one write(2)
+    per log line. Here the buffer is written when it fills, right away
+    for WARNING and above, and on flush_logs()/close. Worker processes
+    switch buffering off (they exit without running atexit/logging
+    shutdown, so a buffered tail would be lost).
+    """
+    
+    buffered = True
+    
+    def flush(self):
+        if not self.buffered:
+            super().flush()
+    
+    def emit(self, record):
+        super().emit(record)
+        if self.buffered and record.levelno >= logging.WARNING:
+            super().flush()
+    
+    def sync(self):
+        """Write out buffered records now"""
+        super().flush()
+
+
+def _in_worker_process() -> bool:
+    """True in a multiprocessing child (spawned workers set up logging anew)"""
+    mp = sys.modules.get('multiprocessing')
+    return mp is not None and mp.parent_process() is not None
+
+
+def _unbuffer_in_child():
+    """After fork: the child writes each record as before"""
+    if _file_handler is not None:
+        _file_handler.buffered = False
+
+
+def flush_logs():
+    """Write buffered log records to the log file (e.g. before reading it)"""
+    if _file_handler is not None:
+        _file_handler.sync()
+
+
+# Forked children start with an empty buffer (nothing written twice)
+os.register_at_fork(before=flush_logs, after_in_child=_unbuffer_in_child)
+
 class LoggerManager:
     """Centralized logger management"""
     
@@ -21,20 +81,28 @@ class LoggerManager:
     
     def __init__(self):
         if self._logger is None:
-            self._setup_logger()
+            with _setup_lock:
+                if self._logger is None:
+                    self._setup_logger()
     
     def _setup_logger(self):
         """Setup logging configuration"""
         LOG_DIR.mkdir(exist_ok=True)
-        log_file = LOG_DIR / f"processor_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+        log_file = LOG_DIR / f"processor_{_RUN_STAMP}.log"
         
-        # Create logger
-        self._logger = logging.getLogger('UniversalFileProcessor')
-        self._logger.setLevel(logging.DEBUG)
+        # Create logger (handlers are only added once per process)
+        logger = logging.getLogger('UniversalFileProcessor')
+        if logger.handlers:
+            LoggerManager._logger = logger
+            return
+        logger.setLevel(logging.DEBUG)
         
-        # File handler
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        # File handler (buffered, see _BufferedFileHandler)
+        global _file_handler
+        file_handler = _BufferedFileHandler(log_file, encoding='utf-8')
+        file_handler.buffered = not _in_worker_process()
         file_handler.setLevel(logging.DEBUG)
+        _file_handler = file_handler
         
         # Console handler
         console_handler = logging.StreamHandler(sys.stdout)
@@ -49,13 +117,16 @@ class LoggerManager:
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
         
-        self._logger.addHandler(file_handler)
-        self._logger.addHandler(console_handler)
+        logger.addHandler(file_handler)
+        logger.addHandler(console_handler)
+        
+        logger.info("=" * 60)
+        logger.info(" Universal File Processor Started")
+        logger.info(f"Log file: {log_file}")
+        logger.info("=" * 60)
         
-        self._logger.info("=" * 60)
-        self._logger.info(" Universal File Processor Started")
-        self._logger.info(f"Log file: {log_file}")
-        self._logger.info("=" * 60)
+        # Published last, so other threads never see a half-set-up logger
+        LoggerManager._logger = logger
     
     def get_logger(self):
         """Get logger instance"""
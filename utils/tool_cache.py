@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Persistent tool availability cache (stale-while-revalidate)"""
+
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from typing import Dict
+from config.settings import LOG_DIR
+from utils.logger import get_logger
+
+logger = get_logger()
+
+CACHE_FILE = LOG_DIR / ".tool_cache.json"
+
+# Cached results older than this are served once more while being refreshed.
+# Missing tools are re-checked sooner so a fresh install is picked up.
+MAX_AGE = 24 * 60 * 60
+MISSING_MAX_AGE = 60
+
+# Version flag per command (default: --version)
+_VERSION_FLAGS = {
+    'ffmpeg': '-version',
+    'ffprobe': '-version',
+}
+
+_lock = threading.Lock()
+_entries: Dict[str, Dict] = {}
+_loaded = False
+_refreshing = set()
+
+
+def _load():
+    """Read the cache file once per process"""
+    global _loaded
+    if _loaded:
+        return
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            _entries.update(json.load(f))
+    except (OSError, ValueError):
+        pass
+    _loaded = True
+
+
+def _save():
+    """Write the cache file (caller holds the lock)"""
+    try:
+        LOG_DIR.mkdir(exist_ok=True)
+        # Write a temp file and rename it over the cache, so another process
+        # never reads a half-written file
+        fd, tmp = tempfile.mkstemp(dir=LOG_DIR, prefix='.tool_cache.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(_entries, f)
+            os.replace(tmp, CACHE_FILE)
+        except OSError:
+            os.unlink(tmp)
+            raise
+    except OSError as e:
+        logger.debug(f"Could not write tool cache: {e}")
+
+
+def _probe(command: str) -> bool:
+    """Check that a command is on PATH and actually runs"""
+    path = shutil.which(command)
+    if path is None:
+        return False
+    try:
+        subprocess.run(
+            [path, _VERSION_FLAGS.get(command, '--version')],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=1
+        )
+    except subprocess.TimeoutExpired:
+        # Slow to start, but present
+        return True
+    except OSError:
+        return False
+    return True
+
+
+def _refresh(command: str) -> bool:
+    """Probe a command and store the result"""
+    available = _probe(command)
+    with _lock:
+        _entries[command] = {'available': available, 'checked': time.time()}
+        _refreshing.discard(command)
+        _save()
+    logger.debug(f"Tool cache: '{command}' {'available' if available else 'not found'}")
+    return available
+
+
+def available(command: str) -> bool:
+    """
+    Check if an external command is available
+
+    Results are persisted in LOG_DIR/.tool_cache.json. A fresh entry is
+    returned as-is; a stale entry is returned immediately while a
+    background thread re-probes the command. Unknown commands are
+    probed synchronously.
+
+    Args:
+        command: Executable name (e.g., 'ffmpeg', 'pandoc')
+
+    Returns:
+        bool: True if the command is available
+    """
+    with _lock:
+        _load()
+        entry = _entries.get(command)
+        if entry is not None:
+            max_age = MAX_AGE if entry.get('available') else MISSING_MAX_AGE
+            if time.time() - entry.get('checked', 0) > max_age and command not in _refreshing:
+                _refreshing.add(command)
+                threading.Thread(target=_refresh, args=(command,), daemon=True).start()
+            return bool(entry.get('available'))
+
+    return _refresh(command)
+
+
+def invalidate(command: str = None):
+    """
+    Drop cached results
+
+    Args:
+        command: Command to forget, or None to clear the whole cache
+    """
+    with _lock:
+        _load()
+        if command is None:
+            _entries.clear()
+        else:
+            _entries.pop(command, None)
+        _save()